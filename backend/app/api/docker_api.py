@@ -32,6 +32,7 @@ async def list_docker_services():
 @router.post("/services", response_model=DockerServiceConfigModel)
 async def create_docker_service(payload: DockerServiceConfigPayload):
     config = create_service_from_payload(payload.model_dump())
+    get_docker_overview.cache_clear()
     return DockerServiceConfigModel(**config.to_dict())
 
 
@@ -40,6 +41,7 @@ async def update_docker_service(slug: str, payload: DockerServiceConfigPayload):
     updated = update_service_from_payload(slug, payload.model_dump())
     if not updated:
         raise HTTPException(status_code=404, detail="service not found")
+    get_docker_overview.cache_clear()
     return DockerServiceConfigModel(**updated.to_dict())
 
 
@@ -47,3 +49,4 @@ async def update_docker_service(slug: str, payload: DockerServiceConfigPayload):
 async def delete_docker_service(slug: str):
     if not remove_service(slug):
         raise HTTPException(status_code=404, detail="service not found")
+    get_docker_overview.cache_clear()
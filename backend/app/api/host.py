@@ -1,57 +1,140 @@
 # backend/app/api/host.py
-import logging
+import asyncio
+from typing import List, Optional
 
-from fastapi import APIRouter
-
-from app.core.system import (
-    get_system_summary,
-    get_disk_devices_snapshot,
-    get_processes_overview,
-    get_sensors_overview,
-    get_uptime_info,
-)
-from app.core.network import get_network_overview
-from app.core.monitor import get_monitor_overview
-from app.core.docker import get_docker_overview
+from fastapi import APIRouter, HTTPException, Query, Request, WebSocket
+from fastapi.responses import StreamingResponse
 
+from app.core.host import SECTIONS, get_host_overview, resolve_sections, stream_hub
 from app.models.host import HostOverview
 
 router = APIRouter()
-logger = logging.getLogger(__name__)
+
+# SSE 空闲时的心跳间隔（秒），防止代理断开长连接
+SSE_KEEPALIVE_SECONDS = 15.0
+
+_SECTION_NAMES = ", ".join(SECTIONS)
+
+
+def _split_csv(values: Optional[List[str]]) -> List[str]:
+    """
+    同时支持 ?sections=a,b 与 ?sections=a&sections=b 两种写法。
+    """
+    names: List[str] = []
+    for value in values or []:
+        names.extend(part.strip() for part in value.split(",") if part.strip())
+    return names
 
 
 @router.get("/overview", response_model=HostOverview)
-async def host_overview():
-    # system 系列
-    system_summary = get_system_summary(mount=None)
-    disks = get_disk_devices_snapshot()
-    processes = get_processes_overview(limit=10)
-    sensors = get_sensors_overview()
-    uptime = get_uptime_info()
-
-    # network
-    network = get_network_overview()
-
-    # monitor：增加保护，监控模块异常时只影响自身
+async def host_overview(
+    sections: Optional[List[str]] = Query(
+        None,
+        description=f"只返回这些区块，逗号分隔；不传表示全部。可选：{_SECTION_NAMES}",
+    ),
+    exclude: Optional[List[str]] = Query(
+        None,
+        description="排除这些区块，逗号分隔，例如 exclude=network,docker",
+    ),
+):
+    """
+    首页聚合视图：
+      - 各区块（system/disks/processes/sensors/uptime/network/monitor/docker）并发采集
+      - sections / exclude 可只取需要的区块，未选中的区块不会执行，字段为 null
+        例如移动端小组件：/host/overview?sections=system,uptime
+      - 每个区块有独立 deadline，整体耗时不超过最慢区块的 deadline
+      - 超时/失败的区块返回上一次结果并标记 stale，从未成功过则为 missing
+      - sections 字段给出每个区块的状态与耗时
+    """
     try:
-        monitor = await get_monitor_overview()
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("failed to load monitor overview: %s", exc)
-        monitor = None
+        names = resolve_sections(_split_csv(sections), _split_csv(exclude))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return await get_host_overview(sections=names)
 
+
+@router.get("/stream")
+async def host_stream_sse(
+    request: Request,
+    sections: Optional[List[str]] = Query(None, description="只订阅这些区块，逗号分隔"),
+    exclude: Optional[List[str]] = Query(None, description="排除这些区块，逗号分隔"),
+):
+    """
+    首页实时推送（Server-Sent Events）：
+      - 第一帧 event: snapshot，data 为所选区块的全量 JSON
+      - 之后 event: patch，data.ops 为 JSON Patch（RFC 6902）操作列表，只包含变化的字段
+      - 所有连接共享同一个后台采样循环，连接数不影响采集成本
+    """
     try:
-        docker = await get_docker_overview()
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("failed to load docker overview: %s", exc)
-        docker = None
-
-    return HostOverview(
-        system=system_summary,
-        disks=disks,
-        processes=processes,
-        sensors=sensors,
-        uptime=uptime,
-        network=network,
-        monitor=monitor,   # 关键：一定要传 monitor
-        docker=docker,
+        names = resolve_sections(_split_csv(sections), _split_csv(exclude))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    async def event_source():
+        sub = stream_hub.subscribe(names)
+        try:
+            while not await request.is_disconnected():
+                frame = await sub.next_frame(timeout=SSE_KEEPALIVE_SECONDS)
+                if frame is None:
+                    yield ": keepalive\n\n"
+                    continue
+                event = "snapshot" if frame.startswith('{"type":"snapshot"') else "patch"
+                yield f"event: {event}\ndata: {frame}\n\n"
+        finally:
+            stream_hub.unsubscribe(sub)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """
+    asyncio.wait 不会抛出任务的异常：断开时 drain 以 WebSocketDisconnect 结束，
+    不取回的话每次断开都会记录 "Task exception was never retrieved"。
+    """
+    if not task.cancelled():
+        task.exception()
+
+
+@router.websocket("/stream")
+async def host_stream_ws(
+    websocket: WebSocket,
+    sections: Optional[List[str]] = Query(None),
+    exclude: Optional[List[str]] = Query(None),
+):
+    """
+    首页实时推送（WebSocket），帧格式与 SSE 相同：
+      {"type": "snapshot", "seq": ..., "data": {...}}
+      {"type": "patch", "seq": ..., "ops": [{"op": "replace", "path": "/system/cpu/usagePct", "value": 12.5}]}
+    """
+    try:
+        names = resolve_sections(_split_csv(sections), _split_csv(exclude))
+    except ValueError as exc:
+        await websocket.close(code=1008, reason=str(exc))
+        return
+
+    await websocket.accept()
+    sub = stream_hub.subscribe(names)
+
+    async def pump():
+        while True:
+            frame = await sub.next_frame()
+            await websocket.send_text(frame)
+
+    async def drain():
+        # 客户端不需要发消息；读取只是为了及时感知断开
+        while True:
+            await websocket.receive_text()
+
+    tasks = [asyncio.create_task(pump()), asyncio.create_task(drain())]
+    for task in tasks:
+        task.add_done_callback(_retrieve_exception)
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        stream_hub.unsubscribe(sub)
@@ -0,0 +1,19 @@
+# backend/app/api/metrics.py
+from fastapi import APIRouter, Response
+
+from app.core.metrics import CONTENT_TYPE, render_metrics
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=Response)
+async def metrics():
+    """
+    Prometheus / OpenMetrics 抓取入口：
+      - CPU（含每核心）/ 内存 / 磁盘 / 网卡字节计数 / 开机时间
+      - 监控目标在线状态与延迟、Docker 服务状态
+      - collector 各任务的采样年龄与耗时
+    内容来自后台快照并缓存，高频抓取几乎不增加开销。
+    """
+    body = await render_metrics()
+    return Response(content=body, media_type=CONTENT_TYPE)
@@ -1,14 +1,25 @@
 # backend/app/api/system.py
-from fastapi import APIRouter, Query
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 
 from app.core.system import (
     get_system_summary,
     get_disk_devices_snapshot,
+    get_disk_io_history,
+    list_disk_io_devices,
     get_processes_overview,
+    search_processes,
     get_sensors_overview,
     get_uptime_info,
     get_system_events,
+    build_event_filter,
+    get_event_rates,
     get_resource_trend,
+    get_resource_trend_range,
+    list_trend_interfaces,
     get_schedule_overview,
     list_files,
     get_login_history,
@@ -17,10 +28,13 @@ from app.core.system import (
 from app.models.system import (
     SystemSummary,
     DiskDevicesSnapshot,
+    DiskIoHistory,
     ProcessesOverview,
+    ProcessSearchResult,
     SensorsOverview,
     UptimeInfo,
     SystemEventsOverview,
+    EventRatesOverview,
     ResourceTrend,
     ScheduleOverview,
     FileList,
@@ -43,22 +57,50 @@ async def system_summary(
       - 不传时：自动选择当前系统主盘（mac/Linux 用 '/', Windows 用系统盘 C:\\）
       - 类 Unix: '/', '/data'
       - Windows: 'C', 'C:', 'C:\\' 均可
+    磁盘容量通过 mount_probe 带超时读取，失联挂载点最多等待 2 秒，因此在线程池中执行，不阻塞事件循环。
     """
-    summary = get_system_summary(mount=mount)
+    summary = await run_in_threadpool(get_system_summary, mount=mount)
     return summary
 
 
 @router.get("/disks", response_model=DiskDevicesSnapshot)
-async def system_disks():
+async def system_disks(
+    since: Optional[int] = Query(
+        None,
+        ge=0,
+        description="上一次响应中的 cursor；只返回此后的新增/移除",
+    ),
+):
     """
     返回当前所有已挂载磁盘设备列表，
-    并给出相较于上一次调用时新增/移除的设备。
-    可用于前端轮询检测 U 盘/移动硬盘接入/拔出。
+    并给出 since 游标之后新增/移除的设备（不传 since 时 added 为全部设备）。
+    可用于前端轮询检测 U 盘/移动硬盘接入/拔出：每个客户端保存自己的 cursor，
+    Linux 上挂载表变化会立即反映在事件中，无需等待后台枚举。
+    每个设备附带所在块设备的读写吞吐、IOPS、await 与利用率（后台每 2 秒采样）。
     """
-    snapshot = get_disk_devices_snapshot()
+    snapshot = get_disk_devices_snapshot(since=since)
     return snapshot
 
 
+@router.get("/disks/io-history", response_model=DiskIoHistory)
+async def system_disk_io_history(
+    device: str = Query(..., description="块设备名（sda / nvme0n1）或分区路径（/dev/sda1）"),
+    limit: int = Query(300, ge=1, le=1800, description="最近 N 个采样点（每 2 秒一个，最多 1 小时）"),
+    max_points: Optional[int] = Query(None, ge=3, le=1800, description="降采样后的最大点数"),
+    downsample: Literal["lttb", "max", "avg"] = Query("lttb", description="降采样方法"),
+):
+    """
+    返回块设备的 I/O 曲线：读写 MB/s、IOPS、await（ms）与利用率（%）。
+    """
+    try:
+        return get_disk_io_history(device, limit=limit, max_points=max_points, method=downsample)
+    except KeyError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"no I/O history for device '{device}', available: {', '.join(list_disk_io_devices())}",
+        )
+
+
 @router.get("/processes", response_model=ProcessesOverview)
 async def system_processes(
     limit: int = Query(
@@ -66,17 +108,55 @@ async def system_processes(
         ge=1,
         le=50,
         description="返回前 N 个占用最高的进程（1~50，默认 10）",
-    )
+    ),
+    group_by: Optional[Literal["name", "user", "cgroup", "container"]] = Query(
+        None,
+        description="按进程名 / 用户 / cgroup / 容器聚合，额外返回前 N 个分组",
+    ),
 ):
     """
     返回当前主机的 Top 进程信息：
       - top_by_cpu: 按 CPU 排序的前 N 个进程
       - top_by_memory: 按内存排序的前 N 个进程
+      - top_by_io: 按磁盘读写速率（字节/秒）排序的前 N 个进程，附带 socket 数（Linux）
+      - pss_mb / uss_mb: 低频采样的 PSS / USS（Linux，仅 Top 候选，尚未采样时为空）
+      - groups_by_cpu / groups_by_memory: 指定 group_by 时的分组汇总
+        （CPU、RSS、进程数、线程数；container 分组根据 /proc/<pid>/cgroup 归属到 docker 容器）
     """
-    overview = get_processes_overview(limit=limit)
+    overview = get_processes_overview(limit=limit, group_by=group_by)
     return overview
 
 
+@router.get("/processes/search", response_model=ProcessSearchResult)
+async def system_processes_search(
+    q: Optional[str] = Query(None, max_length=200, description="同时匹配进程名 / 命令行 / 用户的正则（不区分大小写）"),
+    name: Optional[str] = Query(None, max_length=200, description="进程名正则"),
+    cmdline: Optional[str] = Query(None, max_length=200, description="命令行正则"),
+    user: Optional[str] = Query(None, max_length=200, description="用户名正则"),
+    sort: Literal["cpu", "memory", "io", "read", "write", "threads", "pid", "name", "user"] = Query(
+        "cpu",
+        description="排序字段",
+    ),
+    order: Literal["asc", "desc"] = Query("desc", description="排序方向"),
+    limit: int = Query(50, ge=1, le=500, description="每页条数（1~500，默认 50）"),
+    cursor: Optional[str] = Query(None, description="上一页返回的 next_cursor"),
+):
+    """
+    在内存中的进程表上搜索全部进程（不触发新的采样）：
+      - 多个过滤条件同时生效
+      - next_cursor 不为空时携带它请求下一页；只有按 pid / name / user 排序时翻页结果才不受快照刷新影响
+      - 含嵌套量词（如 (a+)+）的正则会被拒绝（400，启发式检测）；匹配在线程池中执行，不阻塞事件循环
+    """
+    try:
+        return await run_in_threadpool(
+            search_processes,
+            q=q, name=name, cmdline=cmdline, user=user,
+            sort=sort, order=order, limit=limit, cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
 @router.get("/sensors", response_model=SensorsOverview)
 async def system_sensors():
     """
@@ -105,15 +185,90 @@ async def system_events(
         ge=10,
         le=1000,
         description="返回最近的系统事件条数（10~1000，默认 100）",
-    )
+    ),
+    since: Optional[int] = Query(
+        None,
+        ge=0,
+        description="上一次响应中的 cursor；只返回此后的事件（最多 limit 条）",
+    ),
+    q: Optional[str] = Query(
+        None,
+        max_length=200,
+        description="全文检索，多个词之间为 AND，不区分大小写，例如 q=oom killed",
+    ),
+    unit: Optional[List[str]] = Query(
+        None,
+        description="按 systemd unit 过滤，可重复传入；不带后缀时同时匹配 <unit>.service",
+    ),
+    priority: Optional[int] = Query(
+        None,
+        ge=0,
+        le=7,
+        description="只返回该优先级及更严重的事件（0=emerg ... 3=err, 4=warning ... 7=debug）",
+    ),
+    start: Optional[datetime] = Query(
+        None,
+        alias="from",
+        description="时间下界（ISO 时间或 unix 秒，无时区时按 UTC）",
+    ),
+    end: Optional[datetime] = Query(
+        None,
+        alias="to",
+        description="时间上界",
+    ),
+    before: Optional[int] = Query(
+        None,
+        ge=1,
+        description="只返回 seq 小于该值的事件，传上一页响应中的 next_before 向更早翻页",
+    ),
 ):
     """
     系统事件 / 日志概要。
-      - Linux: 使用 journalctl -n
+      - Linux: 后台常驻 journalctl -f -o json 写入内存缓冲区，这里只读取缓冲区；
+        事件带 unit / priority / pid，响应中的 cursor 可作为下次请求的 since
+      - q / unit / priority / from / to：在服务端由倒排索引检索，
+        例如最近 6 小时的 OOM：?q=oom&priority=3&from=<6 小时前>；
+        q 至少要包含一个两个字符以上的词或一个汉字
       - macOS: 使用 log show --last 1h
       - 其它平台: 返回空列表
     """
-    return get_system_events(limit=limit)
+    if since is not None and before is not None:
+        raise HTTPException(status_code=400, detail="'since' and 'before' cannot be combined")
+    try:
+        filters = build_event_filter(q=q, units=unit, priority=priority, start=start, end=end)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    # 检索在 ring 锁内遍历候选，一次性 journalctl 也会阻塞，都放到线程池执行
+    return await run_in_threadpool(
+        get_system_events, limit=limit, since=since, filters=filters, before=before,
+    )
+
+
+@router.get("/events/rates", response_model=EventRatesOverview)
+async def system_event_rates(
+    history: int = Query(
+        15,
+        ge=0,
+        le=60,
+        description="每个序列附带最近多少分钟的每分钟计数（0~60，默认 15）",
+    ),
+    limit: int = Query(
+        50,
+        ge=1,
+        le=512,
+        description="最多返回的 unit 数，按当前速率降序",
+    ),
+    bursts_only: bool = Query(
+        False,
+        description="只返回处于突发状态的 unit",
+    ),
+):
+    """
+    系统事件速率：按 unit / priority 统计最近 60 秒的事件数，并与 EWMA 基线比较标记突发，
+    例如 sshd 平时每分钟 2 条、现在 400 条时 burst=true。
+    计数在 journal 读取线程写入事件时增量累计，请求只读取快照。
+    """
+    return get_event_rates(history=history, limit=limit, bursts_only=bursts_only)
 
 
 @router.get("/resource-trend", response_model=ResourceTrend)
@@ -121,16 +276,67 @@ async def system_resource_trend(
     limit: int = Query(
         100,
         ge=10,
-        le=1000,
-        description="返回最近的资源采样点数量（10~1000，默认 100）",
-    )
+        le=86400,
+        description="返回最近的资源采样点数量（10~86400，默认 100）；较大时建议配合 max_points",
+    ),
+    start: Optional[datetime] = Query(
+        None,
+        alias="from",
+        description="区间查询起点（ISO 时间或 unix 秒，无时区时按 UTC）；传入后忽略 limit",
+    ),
+    end: Optional[datetime] = Query(
+        None,
+        alias="to",
+        description="区间查询终点，默认当前时间",
+    ),
+    step: Optional[int] = Query(
+        None,
+        ge=1,
+        description="区间查询时每个点聚合的秒数，默认按约 300 个点自动计算",
+    ),
+    interface: Optional[str] = Query(
+        None,
+        description="网络曲线使用的网卡：@wan（默认出口网卡）或网卡名；默认所有非回环网卡之和，仅用于最近点查询",
+    ),
+    max_points: Optional[int] = Query(
+        None,
+        ge=3,
+        le=5000,
+        description="最多返回的点数，超过时在服务端降采样（通常取图表宽度的像素数）",
+    ),
+    downsample: Literal["lttb", "max", "avg"] = Query(
+        "lttb",
+        description="降采样方法：lttb 保留形状与尖峰的原始点；max / avg 为分桶最大值 / 平均值",
+    ),
 ):
     """
     CPU / 内存 / 网络的简易趋势。
-    每次调用会 push 一个新的点，然后返回最近 limit 个点。
+      - 不传 from：后台每秒采样一个点，这里只返回最近 limit 个点
+      - 传 from/to/step：从持久化存储读取区间数据，自动选择 raw(1s, 1h) /
+        1m(7d) / 1h(1y) 层级，按 step 聚合为平均值；SQLite 查询在线程池中执行，不阻塞事件循环
+      - interface：网络速率来自相邻两次采样的网卡字节增量，可按网卡或 @wan 查看
+      - max_points：例如 ?limit=86400&max_points=300 只返回 300 个点，尖峰仍然可见
     建议前端 3~5 秒轮询一次。
     """
-    return get_resource_trend(limit=limit)
+    if start is None:
+        try:
+            return get_resource_trend(
+                limit=limit, interface=interface, max_points=max_points, method=downsample,
+            )
+        except KeyError:
+            raise HTTPException(
+                status_code=404,
+                detail=f"no trend series for interface '{interface}', available: {', '.join(list_trend_interfaces())}",
+            )
+    if interface is not None:
+        raise HTTPException(status_code=400, detail="'interface' is only supported without 'from'")
+    try:
+        return await run_in_threadpool(
+            get_resource_trend_range,
+            start=start, end=end, step=step, max_points=max_points, method=downsample,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 
 @router.get("/schedule", response_model=ScheduleOverview)
@@ -4,5 +4,9 @@ from . import system
 from . import network
 from . import monitor
 from . import docker
+from . import collector
+from . import cache
+from . import host
+from . import metrics
 
-__all__ = ["system", "network", "monitor", "docker"]
+__all__ = ["system", "network", "monitor", "docker", "collector", "cache", "host", "metrics"]
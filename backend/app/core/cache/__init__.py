@@ -0,0 +1,11 @@
+# backend/app/core/cache/__init__.py
+
+from .ttl import CACHE_POLICIES, CachePolicy, TTLCache, cached, configure_cache
+
+__all__ = [
+    "CACHE_POLICIES",
+    "CachePolicy",
+    "TTLCache",
+    "cached",
+    "configure_cache",
+]
@@ -0,0 +1,211 @@
+# backend/app/core/cache/ttl.py
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachePolicy:
+    """
+    单个区块的缓存策略：
+      - ttl: 结果在 ttl 秒内视为新鲜，直接返回
+      - max_stale: 过期后 max_stale 秒内仍直接返回旧值，同时在后台刷新；
+                   超过后调用方需要等待重新计算
+    """
+    ttl: float
+    max_stale: float
+
+
+# 各区块的缓存策略，可按需修改或通过 configure_cache() 调整
+CACHE_POLICIES: Dict[str, CachePolicy] = {
+    "public_ip": CachePolicy(ttl=300.0, max_stale=3600.0),
+    "connectivity": CachePolicy(ttl=15.0, max_stale=120.0),
+    "docker": CachePolicy(ttl=10.0, max_stale=120.0),
+    "docker_containers": CachePolicy(ttl=30.0, max_stale=300.0),
+    "lan_devices": CachePolicy(ttl=60.0, max_stale=600.0),
+    "metrics": CachePolicy(ttl=5.0, max_stale=30.0),
+}
+
+_DEFAULT_POLICY = CachePolicy(ttl=10.0, max_stale=60.0)
+
+# 同步函数的后台刷新线程池
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+
+
+def configure_cache(section: str, ttl: float, max_stale: Optional[float] = None) -> None:
+    CACHE_POLICIES[section] = CachePolicy(
+        ttl=ttl,
+        max_stale=max_stale if max_stale is not None else ttl * 10,
+    )
+
+
+@dataclass
+class _Entry:
+    value: Any
+    stored_at: float  # time.monotonic()
+
+
+class TTLCache:
+    """
+    带 stale-while-revalidate 与 single-flight 的 TTL 缓存：
+      - 新鲜：直接返回
+      - 过期但在 max_stale 内：立即返回旧值，并触发一次后台刷新
+      - 无值或过旧：同一 key 的并发调用共享同一次计算
+    同时支持普通函数（线程）与 async 函数（事件循环任务）。
+    """
+
+    def __init__(self, section: str) -> None:
+        self.section = section
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._inflight: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def policy(self) -> CachePolicy:
+        return CACHE_POLICIES.get(self.section, _DEFAULT_POLICY)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _lookup(self, key: Hashable) -> tuple[Optional[_Entry], bool]:
+        """
+        返回 (entry, fresh)。entry 为 None 表示没有可用值（不存在或已超过 max_stale）。
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None, False
+        age = time.monotonic() - entry.stored_at
+        policy = self.policy
+        if age < policy.ttl:
+            return entry, True
+        if age < policy.ttl + policy.max_stale:
+            return entry, False
+        return None, False
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = _Entry(value=value, stored_at=time.monotonic())
+
+    # ---------- 同步 ----------
+
+    def get_sync(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry, fresh = self._lookup(key)
+            if entry is not None and fresh:
+                return entry.value
+
+            fut: Optional[Future] = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = Future()
+                self._inflight[key] = fut
+
+        if entry is not None:
+            # 过期但可用：返回旧值，后台刷新（已有刷新在跑时不重复提交）
+            if leader:
+                _refresh_executor.submit(self._compute_sync, key, compute, fut)
+            return entry.value
+
+        if leader:
+            self._compute_sync(key, compute, fut)
+        return fut.result()
+
+    def _compute_sync(self, key: Hashable, compute: Callable[[], Any], fut: Future) -> None:
+        try:
+            value = compute()
+        except BaseException as exc:  # noqa: BLE001
+            logger.warning("cache %s refresh failed: %s", self.section, exc)
+            fut.set_exception(exc)
+        else:
+            self._store(key, value)
+            fut.set_result(value)
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is fut:
+                    self._inflight.pop(key, None)
+
+    # ---------- 异步 ----------
+
+    async def get_async(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        loop = asyncio.get_running_loop()
+        entry, fresh = self._lookup(key)
+        if entry is not None and fresh:
+            return entry.value
+
+        task: Optional[asyncio.Task] = self._inflight.get(key)
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(compute())
+            task.add_done_callback(functools.partial(self._finish_async, key))
+            self._inflight[key] = task
+
+        if entry is not None:
+            return entry.value
+        # shield：某个调用方被取消时不影响其它等待同一计算的调用方
+        return await asyncio.shield(task)
+
+    def _finish_async(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            self._inflight.pop(key, None)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("cache %s refresh failed: %s", self.section, exc)
+            return
+        self._store(key, task.result())
+
+
+def _default_key(*args: Any, **kwargs: Any) -> Hashable:
+    return args, tuple(sorted(kwargs.items()))
+
+
+def cached(section: str, key: Optional[Callable[..., Hashable]] = None):
+    """
+    装饰器：按区块策略缓存函数结果。
+      @cached("public_ip")
+      def _get_public_ip(...): ...
+
+      @cached("connectivity", key=lambda routes: routes.default_gateway)
+      def _build_connectivity(routes): ...
+    被装饰的函数额外提供 .cache（TTLCache 实例）与 .cache_clear()。
+    """
+    key_func = key or _default_key
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache = TTLCache(section)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await cache.get_async(
+                    key_func(*args, **kwargs),
+                    lambda: func(*args, **kwargs),
+                )
+
+            wrapper: Any = async_wrapper
+        else:
+            @functools.wraps(func)
+            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return cache.get_sync(
+                    key_func(*args, **kwargs),
+                    lambda: func(*args, **kwargs),
+                )
+
+            wrapper = sync_wrapper
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
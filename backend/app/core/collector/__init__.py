@@ -0,0 +1,9 @@
+# backend/app/core/collector/__init__.py
+
+from .engine import Collector, Sample, collector
+
+__all__ = [
+    "Collector",
+    "Sample",
+    "collector",
+]
@@ -0,0 +1,170 @@
+# backend/app/core/collector/engine.py
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Sample:
+    """
+    某个采集任务的一次结果，创建后不再修改：
+      - name: 任务名，例如 "cpu" / "disks"
+      - value: 采集函数的返回值（通常是 Pydantic 模型）
+      - collected_at: 采集完成时的 time.time()
+      - duration_ms: 本次采集耗时
+    """
+    name: str
+    value: Any
+    collected_at: float
+    duration_ms: float
+
+
+@dataclass
+class _Job:
+    name: str
+    func: Callable[[], Any]
+    interval: float
+    thread: Optional[threading.Thread] = None
+    last_error: Optional[str] = None
+    # 同一任务同时只执行一次：后台循环与 run_once 的外部调用（如挂载表监听）串行，
+    # 避免较早开始、较晚结束的一轮覆盖更新的结果
+    run_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class Collector:
+    """
+    后台采样引擎：
+      - 每个注册的任务在独立的守护线程里按固定间隔执行
+      - 最新结果以不可变 Sample 保存，整张表采用写时复制，读取无需加锁
+      - 接口只读取最新快照，不再在请求路径里调用 psutil
+    未启动（例如脚本里直接 import）时，get() 会退化为同步调用采集函数。
+    """
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, _Job] = {}
+        self._samples: Mapping[str, Sample] = MappingProxyType({})
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def register(self, name: str, func: Callable[[], Any], interval: float) -> None:
+        """
+        注册采集任务。重复注册同名任务会覆盖之前的函数/间隔。
+        """
+        with self._lock:
+            self._jobs[name] = _Job(name=name, func=func, interval=max(float(interval), 0.1))
+        if self._running:
+            self._spawn(self._jobs[name])
+
+    def jobs(self) -> Dict[str, float]:
+        """
+        返回 任务名 -> 采样间隔（秒）。
+        """
+        return {name: job.interval for name, job in self._jobs.items()}
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._stop.clear()
+        self._running = True
+        for job in list(self._jobs.values()):
+            self._spawn(job)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        if not self._running:
+            return
+        self._running = False
+        self._stop.set()
+        for job in list(self._jobs.values()):
+            if job.thread is not None:
+                job.thread.join(timeout=timeout)
+                job.thread = None
+
+    def snapshot(self) -> Mapping[str, Sample]:
+        """
+        返回当前所有任务的最新结果（只读视图）。
+        """
+        return self._samples
+
+    def latest(self, name: str) -> Optional[Sample]:
+        return self._samples.get(name)
+
+    def get(self, name: str, fallback: Optional[Callable[[], Any]] = None) -> Any:
+        """
+        读取某个任务的最新值：
+          - 已有采样结果时直接返回（微秒级）
+          - 引擎未启动或首轮尚未完成时，同步调用 fallback / 任务函数兜底
+        """
+        sample = self._samples.get(name)
+        if sample is not None:
+            return sample.value
+
+        func = fallback
+        if func is None:
+            job = self._jobs.get(name)
+            if job is None:
+                raise KeyError(f"collector job not registered: {name}")
+            func = job.func
+        return func()
+
+    def run_once(self, name: str) -> Optional[Sample]:
+        """
+        立即执行一次任务并更新快照；失败时保留上一轮结果并返回 None。
+        与同一任务正在进行的一轮串行执行：采集与发布结果整体加锁。
+        """
+        job = self._jobs[name]
+        with job.run_lock:
+            start = time.perf_counter()
+            try:
+                value = job.func()
+            except Exception as exc:  # noqa: BLE001
+                job.last_error = str(exc)
+                logger.exception("collector job %s failed: %s", name, exc)
+                return None
+
+            job.last_error = None
+            sample = Sample(
+                name=name,
+                value=value,
+                collected_at=time.time(),
+                duration_ms=(time.perf_counter() - start) * 1000.0,
+            )
+            with self._lock:
+                samples = dict(self._samples)
+                samples[name] = sample
+                self._samples = MappingProxyType(samples)
+            return sample
+
+    def _spawn(self, job: _Job) -> None:
+        if job.thread is not None and job.thread.is_alive():
+            return
+        job.thread = threading.Thread(
+            target=self._loop,
+            args=(job,),
+            name=f"collector-{job.name}",
+            daemon=True,
+        )
+        job.thread.start()
+
+    def _loop(self, job: _Job) -> None:
+        while not self._stop.is_set():
+            start = time.monotonic()
+            self.run_once(job.name)
+            elapsed = time.monotonic() - start
+            # 采集本身耗时计入间隔，保证节奏稳定；至少让出 50ms
+            self._stop.wait(max(job.interval - elapsed, 0.05))
+
+
+# 全局单例：各模块在 import 时注册任务，app.main 在启动时 start()
+collector = Collector()
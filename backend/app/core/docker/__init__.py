@@ -1,7 +1,8 @@
 # backend/app/core/docker/__init__.py
 
-from .info import get_docker_overview
+from .info import get_container_names, get_docker_overview
 
 __all__ = [
+    "get_container_names",
     "get_docker_overview",
 ]
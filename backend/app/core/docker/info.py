@@ -13,6 +13,7 @@ from uuid import uuid4
 
 import httpx
 
+from app.core.cache import cached
 from app.core.docker.config import (
     DockerServiceConfig,
     load_service_configs,
@@ -113,6 +114,22 @@ def _list_containers_sync() -> List[Dict]:
     return containers
 
 
+@cached("docker_containers")
+def get_container_names() -> Dict[str, str]:
+    """
+    容器短 ID（12 位）-> 容器名，用于把进程的 cgroup 归属到容器。
+    """
+    if not _docker_cli_available():
+        return {}
+    names: Dict[str, str] = {}
+    for payload in _list_containers_sync():
+        container_id = (payload.get("ID") or "")[:12]
+        name = (payload.get("Names") or "").strip()
+        if container_id and name:
+            names[container_id] = name
+    return names
+
+
 async def _list_containers() -> List[Dict]:
     if not _docker_cli_available():
         return []
@@ -300,7 +317,13 @@ async def _discover_untracked_services(
     return auto_configs
 
 
+@cached("docker")
 async def get_docker_overview() -> DockerOverview:
+    """
+    汇总所有服务的容器状态与探活结果。
+    结果按 "docker" 策略缓存：并发请求共享一次 docker inspect + 探活，
+    服务配置变更后调用 get_docker_overview.cache_clear() 失效。
+    """
     configs = load_service_configs()
     known_containers: Set[str] = {cfg.container for cfg in configs if cfg.container}
     known_slugs: Set[str] = {cfg.slug for cfg in configs}
@@ -0,0 +1,13 @@
+# backend/app/core/host/__init__.py
+
+from .overview import SECTIONS, get_host_overview, resolve_sections
+from .stream import HostStreamHub, diff_json, hub as stream_hub
+
+__all__ = [
+    "HostStreamHub",
+    "SECTIONS",
+    "diff_json",
+    "get_host_overview",
+    "resolve_sections",
+    "stream_hub",
+]
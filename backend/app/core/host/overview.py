@@ -0,0 +1,174 @@
+# backend/app/core/host/overview.py
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.docker import get_docker_overview
+from app.core.monitor import get_monitor_overview
+from app.core.network import get_network_overview
+from app.core.system import (
+    get_disk_devices_snapshot,
+    get_processes_overview,
+    get_sensors_overview,
+    get_system_summary,
+    get_uptime_info,
+)
+from app.models.host import HostOverview, HostSectionStatus
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class HostSection:
+    """
+    首页聚合里的一个区块：
+      - func: 同步函数（放到线程池执行）或 async 函数
+      - deadline: 本区块最多等待的秒数，超时后返回上一次的结果（stale）或缺省
+    """
+    name: str
+    func: Callable[[], Any]
+    deadline: float
+
+
+# 区块定义；deadline 按各区块的最坏耗时设定，
+# 首页整体耗时上限 = 最大的 deadline，而不是各区块之和
+SECTIONS: Dict[str, HostSection] = {
+    s.name: s
+    for s in (
+        HostSection("system", lambda: get_system_summary(mount=None), deadline=1.0),
+        HostSection("disks", get_disk_devices_snapshot, deadline=1.0),
+        HostSection("processes", lambda: get_processes_overview(limit=10), deadline=1.0),
+        HostSection("sensors", get_sensors_overview, deadline=1.0),
+        HostSection("uptime", get_uptime_info, deadline=1.0),
+        HostSection("network", get_network_overview, deadline=2.0),
+        HostSection("monitor", get_monitor_overview, deadline=3.0),
+        HostSection("docker", get_docker_overview, deadline=3.0),
+    )
+}
+
+# 同步区块使用的线程池（和默认 executor 隔离，避免被 docker inspect 等占满）
+_executor = ThreadPoolExecutor(max_workers=len(SECTIONS), thread_name_prefix="host-section")
+
+# 区块名 -> (最后一次成功的结果, 完成时间 time.time())
+_last_good: Dict[str, Tuple[Any, float]] = {}
+# 区块名 -> 仍在运行的任务；超时的任务继续在后台跑完，下一次请求直接复用
+_inflight: Dict[str, asyncio.Future] = {}
+
+
+def _remember(name: str, fut: asyncio.Future) -> None:
+    if _inflight.get(name) is fut:
+        _inflight.pop(name, None)
+    if fut.cancelled():
+        return
+    exc = fut.exception()
+    if exc is not None:
+        logger.warning("host section %s failed: %s", name, exc)
+        return
+    _last_good[name] = (fut.result(), time.time())
+
+
+def _start_section(section: HostSection) -> asyncio.Future:
+    loop = asyncio.get_running_loop()
+    fut = _inflight.get(section.name)
+    if fut is not None and not fut.done() and fut.get_loop() is loop:
+        return fut
+
+    if inspect.iscoroutinefunction(section.func):
+        fut = asyncio.ensure_future(section.func())
+    else:
+        fut = loop.run_in_executor(_executor, section.func)
+    fut.add_done_callback(lambda f, name=section.name: _remember(name, f))
+    _inflight[section.name] = fut
+    return fut
+
+
+async def _run_section(section: HostSection) -> Tuple[Any, HostSectionStatus]:
+    start = time.perf_counter()
+    fut = _start_section(section)
+    status = "ok"
+    message: Optional[str] = None
+    value: Any = None
+
+    try:
+        # shield：超时只是不再等待，任务本身继续执行并更新 _last_good
+        value = await asyncio.wait_for(asyncio.shield(fut), timeout=section.deadline)
+        collected_ts = time.time()
+    except asyncio.TimeoutError:
+        status = "timeout"
+        message = f"exceeded deadline {section.deadline:.1f}s"
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("failed to load %s section: %s", section.name, exc)
+        status = "error"
+        message = str(exc)
+
+    if status != "ok":
+        last = _last_good.get(section.name)
+        if last is not None:
+            value, collected_ts = last
+            status = "stale"
+        else:
+            collected_ts = None
+            status = "missing"
+
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    return value, HostSectionStatus(
+        status=status,
+        elapsed_ms=round(elapsed_ms, 2),
+        deadline_ms=section.deadline * 1000.0,
+        collected_at=(
+            datetime.fromtimestamp(collected_ts, tz=timezone.utc) if collected_ts else None
+        ),
+        message=message,
+    )
+
+
+def resolve_sections(
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> List[str]:
+    """
+    根据 include / exclude 计算需要采集的区块（保持 SECTIONS 中的顺序）。
+    include 为空表示全部；出现未知区块名时抛出 ValueError。
+    """
+    include_set = {name for name in include or [] if name}
+    exclude_set = {name for name in exclude or [] if name}
+    unknown = (include_set | exclude_set) - set(SECTIONS)
+    if unknown:
+        raise ValueError(f"unknown sections: {', '.join(sorted(unknown))}")
+
+    return [
+        name
+        for name in SECTIONS
+        if (not include_set or name in include_set) and name not in exclude_set
+    ]
+
+
+async def get_host_overview(
+    sections: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+) -> HostOverview:
+    """
+    并发组装首页聚合视图：
+      - sections / exclude 选择需要的区块，未选中的区块不会执行，对应字段为 None
+      - 每个区块在线程池 / 事件循环中并发执行，各自有 deadline
+      - 按时完成的区块 status=ok；超时或失败时返回上一次的结果（stale），
+        从未成功过则为 missing，对应字段为 None
+      - sections 中给出每个被选中区块的状态与耗时
+    """
+    names = resolve_sections(sections, exclude)
+    results = await asyncio.gather(*(_run_section(SECTIONS[name]) for name in names))
+
+    payload: Dict[str, Any] = {}
+    statuses: Dict[str, HostSectionStatus] = {}
+    for name, (value, status) in zip(names, results):
+        payload[name] = value
+        statuses[name] = status
+
+    return HostOverview(**payload, sections=statuses)
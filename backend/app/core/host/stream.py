@@ -0,0 +1,207 @@
+# backend/app/core/host/stream.py
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Set
+
+from app.core.host.overview import SECTIONS, get_host_overview
+
+logger = logging.getLogger(__name__)
+
+# 推送节奏（秒）：有订阅者时每隔 STREAM_INTERVAL 组装一次首页快照
+STREAM_INTERVAL = 2.0
+# 每个订阅者最多积压的帧数，超过后丢弃积压并在下一帧重发全量快照
+SUBSCRIBER_QUEUE_SIZE = 16
+
+
+def _escape(key: str) -> str:
+    # JSON Pointer（RFC 6901）转义
+    return key.replace("~", "~0").replace("/", "~1")
+
+
+def diff_json(prev: Any, curr: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    计算两个 JSON 结构之间的差异，输出 JSON Patch（RFC 6902）风格的操作列表：
+      - dict 逐 key 递归，新增 add、消失 remove、变化 replace
+      - 等长 list 逐元素递归，长度变化时整体 replace
+      - 其它值不相等时 replace
+    """
+    if isinstance(prev, dict) and isinstance(curr, dict):
+        ops: List[Dict[str, Any]] = []
+        for key, value in curr.items():
+            child = f"{path}/{_escape(str(key))}"
+            if key not in prev:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(diff_json(prev[key], value, child))
+        for key in prev:
+            if key not in curr:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(str(key))}"})
+        return ops
+
+    if isinstance(prev, list) and isinstance(curr, list) and len(prev) == len(curr):
+        ops = []
+        for index, (a, b) in enumerate(zip(prev, curr)):
+            ops.extend(diff_json(a, b, f"{path}/{index}"))
+        return ops
+
+    if prev != curr or type(prev) is not type(curr):
+        return [{"op": "replace", "path": path, "value": curr}]
+    return []
+
+
+def _visible(path: str, sections: FrozenSet[str]) -> bool:
+    # "/system/cpu/usagePct" -> system；"/sections/docker" -> docker
+    parts = path.split("/", 3)
+    if parts[1] == "sections":
+        return len(parts) < 3 or parts[2] in sections
+    return parts[1] in sections
+
+
+@dataclass
+class StreamTick:
+    """
+    一次采样结果，所有订阅者共享同一个对象；
+    编码后的帧按区块过滤条件缓存，相同条件的订阅者只编码一次。
+    """
+    seq: int
+    ts: float
+    data: Dict[str, Any]
+    ops: List[Dict[str, Any]]
+    _encoded: Dict[Any, Optional[str]] = field(default_factory=dict)
+
+    def render(self, sections: FrozenSet[str], snapshot: bool) -> Optional[str]:
+        key = (sections, snapshot)
+        if key in self._encoded:
+            return self._encoded[key]
+
+        if snapshot:
+            data = {name: value for name, value in self.data.items() if name in sections}
+            data["sections"] = {
+                name: status
+                for name, status in self.data.get("sections", {}).items()
+                if name in sections
+            }
+            frame: Optional[Dict[str, Any]] = {
+                "type": "snapshot", "seq": self.seq, "ts": self.ts, "data": data,
+            }
+        else:
+            ops = [op for op in self.ops if _visible(op["path"], sections)]
+            frame = {"type": "patch", "seq": self.seq, "ts": self.ts, "ops": ops} if ops else None
+
+        encoded = json.dumps(frame, separators=(",", ":"), ensure_ascii=False) if frame else None
+        self._encoded[key] = encoded
+        return encoded
+
+
+class StreamSubscriber:
+    def __init__(self, hub: "HostStreamHub", sections: List[str]) -> None:
+        self.hub = hub
+        self.sections: FrozenSet[str] = frozenset(sections)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        # 尚未收到全量快照（新连接或积压被丢弃）时为 False
+        self.synced = False
+
+    def offer(self, tick: StreamTick) -> None:
+        try:
+            self.queue.put_nowait(tick)
+        except asyncio.QueueFull:
+            # 消费太慢：丢掉积压，下一帧改为全量快照
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.synced = False
+            self.queue.put_nowait(tick)
+
+    async def next_frame(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        等待下一条需要发送给该订阅者的帧（已编码 JSON）。
+        timeout 到期仍没有帧时返回 None，可用于发送心跳。
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                tick: StreamTick = await asyncio.wait_for(self.queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                return None
+            frame = tick.render(self.sections, snapshot=not self.synced)
+            self.synced = True
+            if frame is not None:
+                return frame
+
+
+class HostStreamHub:
+    """
+    首页实时推送的共享采样器：
+      - 只在有订阅者时运行，每 interval 秒组装一次（只包含订阅者关心的区块的并集）
+      - 与上一次结果做 diff，只向订阅者推送变化的字段
+      - 每个订阅者一个有界队列，新连接 / 积压溢出时推送全量快照
+    """
+
+    def __init__(self, interval: float = STREAM_INTERVAL) -> None:
+        self.interval = interval
+        self._subscribers: Set[StreamSubscriber] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._state: Dict[str, Any] = {}
+        self._seq = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, sections: Optional[List[str]] = None) -> StreamSubscriber:
+        sub = StreamSubscriber(self, sections or list(SECTIONS))
+        self._subscribers.add(sub)
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._state = {}
+            self._task = asyncio.create_task(self._run())
+        # 新订阅者立即触发一轮采样，尽快拿到全量快照
+        self._wake.set()
+        return sub
+
+    def unsubscribe(self, sub: StreamSubscriber) -> None:
+        self._subscribers.discard(sub)
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _tick(self) -> None:
+        names = sorted(set().union(*(sub.sections for sub in self._subscribers)))
+        overview = await get_host_overview(sections=names)
+        data = overview.model_dump(mode="json", include=set(names))
+        # 区块状态只推送 ok/stale/missing，耗时每次都会变，不参与 diff
+        data["sections"] = {name: st.status for name, st in overview.sections.items()}
+
+        prev = {name: value for name, value in self._state.items() if name in data}
+        ops = diff_json(prev, data)
+        self._state = data
+        self._seq += 1
+        tick = StreamTick(seq=self._seq, ts=time.time(), data=data, ops=ops)
+        for sub in list(self._subscribers):
+            if sub.synced and not ops:
+                continue
+            sub.offer(tick)
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            self._wake.clear()
+            try:
+                await self._tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("host stream tick failed: %s", exc)
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+# 全局单例：所有 WebSocket / SSE 连接共享一个采样循环
+hub = HostStreamHub()
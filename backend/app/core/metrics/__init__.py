@@ -0,0 +1,9 @@
+# backend/app/core/metrics/__init__.py
+
+from .exposition import CONTENT_TYPE, MetricWriter, render_metrics
+
+__all__ = [
+    "CONTENT_TYPE",
+    "MetricWriter",
+    "render_metrics",
+]
@@ -0,0 +1,223 @@
+# backend/app/core/metrics/exposition.py
+from __future__ import annotations
+
+import math
+import time
+from typing import Dict, List, Optional
+
+from app.core.cache import cached
+from app.core.collector import collector
+from app.core.host import get_host_overview
+from app.core.system.uptime import get_uptime_info
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_PREFIX = "homepage_"
+_GB = 1024**3
+
+
+def _escape(value: str) -> str:
+    """
+    OpenMetrics 中标签值与 HELP 文本的转义规则相同：反斜杠、双引号、换行。
+    """
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "NaN"
+    if isinstance(value, float) and math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class MetricWriter:
+    """
+    最小化的 OpenMetrics 文本格式生成器：
+      - family() 声明 TYPE / HELP（/ UNIT）
+      - sample() 追加一行样本；counter 的样本名自动加 _total
+      - render() 以 "# EOF" 结尾
+    """
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+        self._types: Dict[str, str] = {}
+
+    def family(self, name: str, mtype: str, help_text: str, unit: Optional[str] = None) -> None:
+        full = _PREFIX + name
+        self._types[full] = mtype
+        self._lines.append(f"# TYPE {full} {mtype}")
+        if unit:
+            self._lines.append(f"# UNIT {full} {unit}")
+        self._lines.append(f"# HELP {full} {_escape(help_text)}")
+
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        full = _PREFIX + name
+        sample_name = full + "_total" if self._types.get(full) == "counter" else full
+        if labels:
+            body = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            sample_name = f"{sample_name}{{{body}}}"
+        self._lines.append(f"{sample_name} {_format_value(value)}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines + ["# EOF"]) + "\n"
+
+
+def _write_collector(w: MetricWriter) -> None:
+    samples = collector.snapshot()
+    now = time.time()
+    w.family("collector_sample_age_seconds", "gauge", "Seconds since the last successful sample of a collector job.", "seconds")
+    for name, sample in sorted(samples.items()):
+        w.sample("collector_sample_age_seconds", now - sample.collected_at, {"job": name})
+    w.family("collector_sample_duration_seconds", "gauge", "Duration of the last sample of a collector job.", "seconds")
+    for name, sample in sorted(samples.items()):
+        w.sample("collector_sample_duration_seconds", sample.duration_ms / 1000.0, {"job": name})
+
+
+def _write_cpu(w: MetricWriter) -> None:
+    cpu = collector.get("cpu")
+    w.family("cpu_usage_percent", "gauge", "CPU usage percent, cpu=\"all\" for the whole host.")
+    w.sample("cpu_usage_percent", cpu.usagePct, {"cpu": "all"})
+    for index, usage in enumerate(cpu.perCoreUsage):
+        w.sample("cpu_usage_percent", usage, {"cpu": str(index)})
+
+    w.family("cpu_mode_percent", "gauge", "CPU time percent by mode.")
+    for mode, value in (
+        ("user", cpu.userPct),
+        ("system", cpu.systemPct),
+        ("idle", cpu.idlePct),
+        ("iowait", cpu.iowaitPct),
+    ):
+        w.sample("cpu_mode_percent", value, {"mode": mode})
+
+    w.family("load_average", "gauge", "System load average.")
+    for period, value in (("1m", cpu.load1), ("5m", cpu.load5), ("15m", cpu.load15)):
+        w.sample("load_average", value, {"period": period})
+
+    w.family("cpu_cores", "gauge", "Number of logical CPU cores.")
+    w.sample("cpu_cores", cpu.cores)
+
+
+def _write_memory(w: MetricWriter) -> None:
+    mem = collector.get("memory")
+    w.family("memory_usage_percent", "gauge", "Memory usage percent.")
+    w.sample("memory_usage_percent", mem.usagePct)
+    w.family("memory_bytes", "gauge", "Memory size by kind.", "bytes")
+    for kind, value in (
+        ("total", mem.totalGb),
+        ("used", mem.usedGb),
+        ("available", mem.availableGb),
+        ("cached", mem.cachedGb),
+    ):
+        w.sample("memory_bytes", value * _GB, {"kind": kind})
+    w.family("swap_usage_percent", "gauge", "Swap usage percent.")
+    w.sample("swap_usage_percent", mem.swapUsagePct)
+    w.family("swap_bytes", "gauge", "Swap size by kind.", "bytes")
+    w.sample("swap_bytes", mem.swapTotalGb * _GB, {"kind": "total"})
+    w.sample("swap_bytes", mem.swapUsedGb * _GB, {"kind": "used"})
+
+
+def _write_disks(w: MetricWriter) -> None:
+    devices = collector.get("disks")
+    w.family("disk_unreachable", "gauge", "Whether the mount did not answer statvfs in time.")
+    for d in devices:
+        w.sample("disk_unreachable", 1 if d.status == "unreachable" else 0, {"device": d.device, "mount": d.mount})
+    # 失联挂载点的容量是旧值，不导出
+    devices = [d for d in devices if d.status == "ok"]
+    w.family("disk_usage_percent", "gauge", "Filesystem usage percent per mount.")
+    for d in devices:
+        w.sample("disk_usage_percent", d.usagePct, {"device": d.device, "mount": d.mount, "fstype": d.fsType})
+    w.family("disk_bytes", "gauge", "Filesystem size per mount by kind.", "bytes")
+    for d in devices:
+        labels = {"device": d.device, "mount": d.mount}
+        w.sample("disk_bytes", d.totalGb * _GB, {**labels, "kind": "total"})
+        w.sample("disk_bytes", d.usedGb * _GB, {**labels, "kind": "used"})
+        w.sample("disk_bytes", d.freeGb * _GB, {**labels, "kind": "free"})
+    w.family("disk_inodes_usage_percent", "gauge", "Inode usage percent per mount.")
+    for d in devices:
+        if d.inodesPct is not None:
+            w.sample("disk_inodes_usage_percent", d.inodesPct, {"device": d.device, "mount": d.mount})
+    w.family("disk_full_in_seconds", "gauge", "Estimated time until the filesystem is full at the recent growth rate.", "seconds")
+    for d in devices:
+        if d.hoursUntilFull is not None:
+            w.sample("disk_full_in_seconds", d.hoursUntilFull * 3600, {"device": d.device, "mount": d.mount})
+    w.family("disk_removable", "gauge", "Whether the mount is guessed to be removable.")
+    for d in devices:
+        w.sample("disk_removable", d.isRemovable, {"device": d.device, "mount": d.mount})
+
+
+def _write_network(w: MetricWriter) -> None:
+    network = collector.get("network")
+    interfaces = network.interfaces
+    w.family("network_receive_bytes", "counter", "Bytes received per interface.", "bytes")
+    for iface in interfaces:
+        w.sample("network_receive_bytes", iface.rx.bytes, {"interface": iface.name})
+    w.family("network_transmit_bytes", "counter", "Bytes transmitted per interface.", "bytes")
+    for iface in interfaces:
+        w.sample("network_transmit_bytes", iface.tx.bytes, {"interface": iface.name})
+    w.family("network_up", "gauge", "Whether the interface is up.")
+    for iface in interfaces:
+        w.sample("network_up", iface.state == "up", {"interface": iface.name, "type": iface.type or "unknown"})
+    w.family("network_internet_up", "gauge", "Whether the internet probe succeeded.")
+    w.sample("network_internet_up", network.connectivity.internet_ok)
+    w.family("network_internet_latency_seconds", "gauge", "Latency of the internet probe.", "seconds")
+    latency = network.connectivity.internet_latency_ms
+    w.sample("network_internet_latency_seconds", latency / 1000.0 if latency is not None else None)
+
+
+def _write_uptime(w: MetricWriter) -> None:
+    uptime = get_uptime_info()
+    w.family("boot_time_seconds", "gauge", "Unix time the host booted.", "seconds")
+    w.sample("boot_time_seconds", uptime.boot_time.timestamp())
+
+
+def _write_monitor(w: MetricWriter, monitor) -> None:
+    if monitor is None:
+        return
+    w.family("monitor_target_up", "gauge", "Whether a monitor target is online.")
+    for t in monitor.targets:
+        w.sample("monitor_target_up", t.status == "online", {"target": t.name, "type": t.type})
+    w.family("monitor_target_latency_seconds", "gauge", "Latency of a monitor target probe.", "seconds")
+    for t in monitor.targets:
+        value = t.latency_ms / 1000.0 if t.latency_ms is not None else None
+        w.sample("monitor_target_latency_seconds", value, {"target": t.name, "type": t.type})
+
+
+def _write_docker(w: MetricWriter, docker) -> None:
+    if docker is None:
+        return
+    w.family("docker_service_running", "gauge", "Whether the service container is running.")
+    for svc in docker.services:
+        w.sample("docker_service_running", svc.state == "running", {"service": svc.slug, "name": svc.name})
+    w.family("docker_service_online", "gauge", "Whether the service is considered online.")
+    for svc in docker.services:
+        w.sample("docker_service_online", svc.online, {"service": svc.slug, "name": svc.name})
+    w.family("docker_service_healthy", "gauge", "Container health check result, NaN when unknown.")
+    for svc in docker.services:
+        w.sample("docker_service_healthy", svc.healthy, {"service": svc.slug, "name": svc.name})
+
+
+@cached("metrics")
+async def render_metrics() -> str:
+    """
+    生成 OpenMetrics 文本：
+      - CPU / 内存 / 磁盘 / 网卡直接读取 collector 快照
+      - monitor / docker 通过首页聚合的 deadline 机制获取（超时返回上一次结果）
+    渲染结果按 "metrics" 策略缓存，高频抓取只返回同一份文本。
+    """
+    extra = await get_host_overview(sections=["monitor", "docker"])
+
+    w = MetricWriter()
+    _write_collector(w)
+    _write_cpu(w)
+    _write_memory(w)
+    _write_disks(w)
+    _write_network(w)
+    _write_uptime(w)
+    _write_monitor(w, extra.monitor)
+    _write_docker(w, extra.docker)
+    return w.render()
@@ -6,6 +6,7 @@ import subprocess
 from datetime import datetime
 from typing import List
 
+from app.core.cache import cached
 from app.models.network import LanDevice, LanDevicesOverview
 
 
@@ -42,7 +43,13 @@ def _parse_arp_output(output: str) -> List[LanDevice]:
     return devices
 
 
+@cached("lan_devices")
 def get_lan_devices() -> LanDevicesOverview:
+    """
+    读取 ARP 表并反查主机名。
+    结果按 "lan_devices" 策略缓存：并发请求共享一次 arp + 反向 DNS，
+    过期后先返回旧值再后台刷新。
+    """
     system = platform.system().lower()
     output = ""
 
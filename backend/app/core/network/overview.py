@@ -9,6 +9,8 @@ from urllib.error import URLError
 
 import psutil
 
+from app.core.cache import cached
+from app.core.collector import collector
 from app.models.network import (
     NetworkOverview,
     NetworkSummary,
@@ -24,6 +26,8 @@ from app.models.network import (
 # name -> (io, timestamp)
 _LAST_IO: Dict[str, Tuple[psutil._common.snetio, float]] = {}
 
+# 后台采集网络概览（网卡计数 / 路由 / 连通性）的间隔（秒）
+NETWORK_SAMPLE_INTERVAL = 10.0
 
 
 def _measure_tcp_latency(host: str, port: int, timeout: float = 2.0) -> Tuple[Optional[float], bool]:
@@ -161,10 +165,12 @@ def _get_default_gateway_and_routes() -> Routes:
     )
 
 
+@cached("public_ip")
 def _get_public_ip(timeout: float = 2.0) -> Optional[str]:
     """
     获取公网 IP（如果机器可以访问外网）。
     不可达 / 超时时返回 None。
+    结果按 "public_ip" 策略缓存，过期后先返回旧值再后台刷新。
     """
     try:
         with urllib_request.urlopen("https://api.ipify.org", timeout=timeout) as resp:
@@ -318,12 +324,14 @@ def _build_interfaces(routes: Routes) -> Tuple[List[NetworkInterface], float, fl
     return interfaces, total_rx_mbps, total_tx_mbps, wan_rx_mbps, wan_tx_mbps
 
 
+@cached("connectivity", key=lambda routes: routes.default_gateway)
 def _build_connectivity(routes: Routes) -> Connectivity:
     """
     连通性检查（跨平台）：
     - gateway_ok: 连接默认网关（如果有）
     - internet_ok: 连接外网固定 IP（例如 1.1.1.1:443）
     - dns_ok: 解析 example.com
+    结果按默认网关缓存（"connectivity" 策略），并发调用只探测一次。
     """
     gateway_ok = False
     gateway_latency: Optional[float] = None
@@ -371,9 +379,9 @@ def _build_connectivity(routes: Routes) -> Connectivity:
     )
 
 
-def get_network_overview() -> NetworkOverview:
+def collect_network_overview() -> NetworkOverview:
     """
-    主入口：返回 NetworkOverview，兼容 Linux / macOS / Windows。
+    采集一次 NetworkOverview，兼容 Linux / macOS / Windows。
     每个网卡各自根据上一次采样计算速率。
     """
     routes = _get_default_gateway_and_routes()
@@ -399,3 +407,12 @@ def get_network_overview() -> NetworkOverview:
         routes=routes,
     )
 
+
+def get_network_overview() -> NetworkOverview:
+    """
+    主入口：返回后台 collector 最近一次采集的 NetworkOverview。
+    """
+    return collector.get("network")
+
+
+collector.register("network", collect_network_overview, interval=NETWORK_SAMPLE_INTERVAL)
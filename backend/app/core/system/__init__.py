@@ -2,11 +2,12 @@
 
 from .summary import get_system_summary
 from .disks import get_disk_devices_snapshot
-from .processes import get_processes_overview
+from .disk_io import get_disk_io_history, list_disk_io_devices
+from .processes import get_processes_overview, search_processes
 from .sensors import get_sensors_overview
 from .uptime import get_uptime_info
-from .events import get_system_events
-from .resource_trend import get_resource_trend
+from .events import build_event_filter, get_event_rates, get_system_events
+from .resource_trend import get_resource_trend, get_resource_trend_range, list_trend_interfaces
 from .schedule import get_schedule_overview
 from .files import list_files
 from .security_logins import get_login_history
@@ -14,11 +15,18 @@ from .security_logins import get_login_history
 __all__ = [
     "get_system_summary",
     "get_disk_devices_snapshot",
+    "get_disk_io_history",
+    "list_disk_io_devices",
     "get_processes_overview",
+    "search_processes",
     "get_sensors_overview",
     "get_uptime_info",
     "get_system_events",
+    "build_event_filter",
+    "get_event_rates",
     "get_resource_trend",
+    "get_resource_trend_range",
+    "list_trend_interfaces",
     "get_schedule_overview",
     "list_files",
     "get_login_history",
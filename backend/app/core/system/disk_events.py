@@ -0,0 +1,136 @@
+# backend/app/core/system/disk_events.py
+"""
+磁盘接入 / 移除事件：
+  - DiskEventLog：带序号的事件日志（最近 1000 条），每个客户端用自己的游标读取，
+    多个标签页轮询互不影响
+  - MountWatcher：Linux 上对 /proc/self/mountinfo 做 poll()，挂载表变化时内核置 POLLPRI，
+    立即重新采样 "disks" 任务，不必等 10 秒一次的后台枚举
+其它平台只依赖后台枚举（每 10 秒）发现变化。
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
+
+try:  # Windows 没有 select.poll
+    import select
+    _POLL_FLAGS = select.POLLPRI | select.POLLERR
+except (ImportError, AttributeError):  # pragma: no cover
+    select = None
+    _POLL_FLAGS = 0
+
+from app.core.collector import collector
+from app.models.system import DiskEvent
+
+logger = logging.getLogger(__name__)
+
+# 保留的事件条数；游标早于最旧事件时返回 truncated
+DISK_EVENT_LOG_SIZE = 1000
+
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+# poll 超时（毫秒），用于检查停止信号
+MOUNT_POLL_TIMEOUT_MS = 1000
+# 收到变化后等待的秒数，合并一次挂载多个分区产生的连续事件
+MOUNT_DEBOUNCE = 0.2
+
+
+class DiskEventLog:
+    """
+    由 "disks" 任务每次采样后调用 observe()，与上一次的设备集合比较并追加事件。
+    第一次 observe() 只记录基线，不产生事件。
+    """
+
+    def __init__(self, capacity: int = DISK_EVENT_LOG_SIZE) -> None:
+        self._events: Deque[DiskEvent] = deque(maxlen=capacity)
+        self._seq = 0
+        self._devices: Optional[Dict[str, str]] = None  # device -> mount
+        self._lock = threading.Lock()
+
+    @property
+    def cursor(self) -> int:
+        return self._seq
+
+    def observe(self, devices: Iterable[Tuple[str, str]]) -> None:
+        current = dict(devices)
+        with self._lock:
+            previous = self._devices
+            self._devices = current
+            if previous is None:
+                return
+            now = datetime.utcnow()
+            for device in sorted(current.keys() - previous.keys()):
+                self._append("added", device, current[device], now)
+            for device in sorted(previous.keys() - current.keys()):
+                self._append("removed", device, previous[device], now)
+
+    def _append(self, kind: str, device: str, mount: str, ts: datetime) -> None:
+        self._seq += 1
+        self._events.append(DiskEvent(seq=self._seq, kind=kind, device=device, mount=mount, ts=ts))
+
+    def since(self, cursor: int) -> Tuple[List[DiskEvent], bool]:
+        """
+        返回序号大于 cursor 的事件，以及是否有事件已被丢弃（truncated）。
+        cursor 大于当前序号（服务重启）时视为丢失，返回日志中的全部事件。
+        """
+        with self._lock:
+            events = list(self._events)
+            seq = self._seq
+        if cursor > seq:
+            return events, True
+        oldest = events[0].seq if events else seq + 1
+        return [e for e in events if e.seq > cursor], cursor < oldest - 1
+
+
+class MountWatcher:
+    """
+    挂载表监听线程，由 app.main 的 lifespan 启动 / 停止。
+    """
+
+    def __init__(self) -> None:
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @staticmethod
+    def available() -> bool:
+        return select is not None and hasattr(select, "poll") and os.path.exists(MOUNTINFO_PATH)
+
+    def start(self) -> None:
+        if not self.available() or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="mount-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        try:
+            with open(MOUNTINFO_PATH, "rb") as fh:
+                poller = select.poll()
+                poller.register(fh, _POLL_FLAGS)
+                fh.read()
+                while not self._stop.is_set():
+                    if not poller.poll(MOUNT_POLL_TIMEOUT_MS):
+                        continue
+                    if self._stop.wait(MOUNT_DEBOUNCE):
+                        break
+                    # 读一遍清除就绪状态，合并去抖期间的其它变化
+                    poller.poll(0)
+                    fh.seek(0)
+                    fh.read()
+                    collector.run_once("disks")
+        except OSError as exc:
+            logger.warning("mount watcher stopped: %s", exc)
+
+
+# 全局单例
+disk_events = DiskEventLog()
+mount_watcher = MountWatcher()
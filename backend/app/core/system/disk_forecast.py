@@ -0,0 +1,134 @@
+# backend/app/core/system/disk_forecast.py
+"""
+挂载点增长预测：对已用空间（以及已用 inode）随时间的变化做指数加权线性回归，
+估计增长速率与“多久写满”。
+回归只保存 5 个加权累加和，每次采样 O(1) 更新，不回看历史，
+因此可以在每轮 "disks" 采样时为全部挂载点计算：
+  - 旧样本的权重按半衰期衰减（默认 6 小时），近期的增长趋势占主导
+  - 时间原点始终平移到最新样本，避免大时间戳带来的精度损失
+进程重启后从头累积，覆盖 FORECAST_MIN_SPAN 之前不给出预测。
+"""
+from __future__ import annotations
+
+import math
+import threading
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# 样本权重的半衰期（秒）
+FORECAST_HALF_LIFE = 6 * 3600.0
+# 样本覆盖的最短时间跨度（秒），之前不给出预测
+FORECAST_MIN_SPAN = 30 * 60.0
+# 超过该值的写满时间视为“不会写满”（小时）
+FORECAST_MAX_HOURS = 24 * 365.0
+
+
+class GrowthRegression:
+    """
+    y = a + b * t 的指数加权最小二乘，t 以最新样本为原点（秒）。
+    """
+    __slots__ = ("sw", "st", "sy", "stt", "sty", "last_t", "first_t")
+
+    def __init__(self) -> None:
+        self.sw = self.st = self.sy = self.stt = self.sty = 0.0
+        self.last_t: Optional[float] = None
+        self.first_t: Optional[float] = None
+
+    def add(self, t: float, y: float) -> None:
+        if self.last_t is not None:
+            dt = t - self.last_t
+            if dt <= 0:
+                return
+            decay = math.exp(-dt * math.log(2) / FORECAST_HALF_LIFE)
+            sw, st, sy = self.sw * decay, self.st * decay, self.sy * decay
+            stt, sty = self.stt * decay, self.sty * decay
+            # 原点平移 dt：t' = t - dt
+            self.stt = stt - 2 * dt * st + dt * dt * sw
+            self.sty = sty - dt * sy
+            self.st = st - dt * sw
+            self.sw, self.sy = sw, sy
+        else:
+            self.first_t = t
+        self.last_t = t
+        self.sw += 1.0
+        self.sy += y
+
+    @property
+    def span(self) -> float:
+        if self.first_t is None or self.last_t is None:
+            return 0.0
+        return self.last_t - self.first_t
+
+    def slope(self) -> Optional[float]:
+        """
+        每秒的增长量；样本跨度不足时为 None。
+        """
+        if self.span < FORECAST_MIN_SPAN:
+            return None
+        denom = self.sw * self.stt - self.st * self.st
+        if denom <= 0:
+            return None
+        return (self.sw * self.sty - self.st * self.sy) / denom
+
+
+class Forecast(NamedTuple):
+    growth_per_hour: Optional[float]   # 已用量每小时的增长（负数表示在减少）
+    hours_until_full: Optional[float]  # 按当前趋势写满所需小时数；不增长或远超一年时为 None
+
+
+def _forecast(reg: GrowthRegression, free: float) -> Forecast:
+    slope = reg.slope()
+    if slope is None:
+        return Forecast(None, None)
+    hours = None
+    if slope > 0:
+        hours = free / slope / 3600.0
+        if hours > FORECAST_MAX_HOURS:
+            hours = None
+    return Forecast(slope * 3600.0, hours)
+
+
+class DiskForecaster:
+    """
+    按挂载点保存空间 / inode 两组回归，由 "disks" 任务调用 observe()。
+    """
+
+    def __init__(self) -> None:
+        self._regs: Dict[str, Tuple[GrowthRegression, GrowthRegression]] = {}
+        self._lock = threading.Lock()
+
+    def observe(
+        self,
+        mount: str,
+        t: float,
+        used: int,
+        free: int,
+        inodes: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[Forecast, Forecast]:
+        """
+        加入一个样本，返回 (空间预测, inode 预测)；inodes 为 (总数, 空闲数)。
+        """
+        with self._lock:
+            regs = self._regs.get(mount)
+            if regs is None:
+                regs = self._regs[mount] = (GrowthRegression(), GrowthRegression())
+            space_reg, inode_reg = regs
+            space_reg.add(t, float(used))
+            space = _forecast(space_reg, float(free))
+            inode = Forecast(None, None)
+            if inodes is not None:
+                total, ifree = inodes
+                inode_reg.add(t, float(total - ifree))
+                inode = _forecast(inode_reg, float(ifree))
+            return space, inode
+
+    def forget(self, mounts) -> None:
+        """
+        丢弃已不存在的挂载点。
+        """
+        with self._lock:
+            for mount in set(self._regs) - set(mounts):
+                del self._regs[mount]
+
+
+# 全局单例
+disk_forecaster = DiskForecaster()
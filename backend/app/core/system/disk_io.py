@@ -0,0 +1,218 @@
+# backend/app/core/system/disk_io.py
+"""
+块设备 I/O 采样：后台每 2 秒读取一次 psutil.disk_io_counters(perdisk=True)（Linux 上即 /proc/diskstats），
+由两次采样之间的增量计算每个设备的：
+  - 读 / 写吞吐（MB/s）与 IOPS
+  - 平均等待时间 await（ms）：Δ(读耗时 + 写耗时) / Δ(读次数 + 写次数)，与 iostat 一致
+  - 利用率 util（%）：Δbusy_time / 窗口，仅 Linux / FreeBSD 提供
+每个设备保留最近 1 小时的曲线（列式环形缓冲区），供前端绘图。
+分区通过 /sys/class/block 映射到所在的块设备（/dev/sda1 -> sda，/dev/mapper/x -> dm-0）。
+"""
+from __future__ import annotations
+
+import functools
+import os
+import re
+import time
+from datetime import datetime
+from typing import Dict, List, NamedTuple, Optional
+
+import psutil
+
+from app.core.collector import collector
+from app.core.system.downsample import DownsampleMethod, downsample
+from app.core.system.resource_trend import TrendRing
+from app.models.system import DiskIoHistory, DiskIoPoint
+
+# 后台采样间隔（秒）
+DISK_IO_SAMPLE_INTERVAL = 2.0
+# 每个设备保留的点数：1 小时 / 2 秒
+DISK_IO_HISTORY_POINTS = 1800
+
+_BYTES_PER_MB = 1024 * 1024
+
+# 不记录的虚拟设备
+_IGNORED_PREFIXES = ("loop", "ram")
+
+# 没有 sysfs 时按名称推断分区所在的块设备：nvme0n1p2 / mmcblk0p1 / sda1 / disk0s1
+_PARTITION_PATTERNS = (
+    re.compile(r"^((?:nvme\d+n\d+)|(?:mmcblk\d+))p\d+$"),
+    re.compile(r"^((?:[shv]|xv)d[a-z]+)\d+$"),
+    re.compile(r"^(disk\d+)s\d+"),
+)
+
+_HISTORY_COLUMNS = ("ts", "read_mbps", "write_mbps", "read_iops", "write_iops", "await_ms", "util_pct")
+
+
+class DiskIoRates(NamedTuple):
+    read_mbps: float
+    write_mbps: float
+    read_iops: float
+    write_iops: float
+    await_ms: float
+    util_pct: Optional[float]  # 平台不提供 busy_time 时为 None
+
+
+class DiskIoMeter:
+    """
+    对 disk_io_counters 做差分（nowrap=True 时 psutil 已处理 32 位回绕）。
+    计数减小（设备重新接入）时本轮不输出该设备的速率；本轮采样中不存在的设备连同曲线一起丢弃。
+    只由 collector 的 "disk_io" 任务调用。
+    """
+
+    def __init__(self) -> None:
+        self._prev: Dict[str, object] = {}
+        self._prev_at: Optional[float] = None
+        self.rings: Dict[str, TrendRing] = {}
+
+    def sample(self) -> Dict[str, DiskIoRates]:
+        now = time.monotonic()
+        wall_now = time.time()
+        counters = psutil.disk_io_counters(perdisk=True, nowrap=True) or {}
+        counters = {name: c for name, c in counters.items() if not name.startswith(_IGNORED_PREFIXES)}
+
+        rates: Dict[str, DiskIoRates] = {}
+        window = now - self._prev_at if self._prev_at is not None else None
+        for name, cur in counters.items():
+            ring = self.rings.get(name)
+            if ring is None:
+                # 设备第一次出现时即可查询曲线（尚无数据点）；写时复制，请求线程可直接遍历
+                ring = TrendRing(DISK_IO_HISTORY_POINTS, _HISTORY_COLUMNS)
+                self.rings = {**self.rings, name: ring}
+            prev = self._prev.get(name)
+            if prev is None or not window:
+                continue
+            result = _rates(cur, prev, window)
+            if result is None:
+                continue
+            rates[name] = result
+            ring.append(
+                wall_now,
+                result.read_mbps, result.write_mbps,
+                result.read_iops, result.write_iops,
+                result.await_ms,
+                result.util_pct if result.util_pct is not None else -1.0,
+            )
+
+        if len(self.rings) > len(counters):
+            # 此时 rings 已包含本轮所有设备，多出来的就是已移除的设备（U 盘、dm 重建等），避免 rings 只增不减
+            self.rings = {name: ring for name, ring in self.rings.items() if name in counters}
+
+        self._prev = counters
+        self._prev_at = now
+        return rates
+
+
+def _rates(cur, prev, window: float) -> Optional[DiskIoRates]:
+    reads = cur.read_count - prev.read_count
+    writes = cur.write_count - prev.write_count
+    read_bytes = cur.read_bytes - prev.read_bytes
+    write_bytes = cur.write_bytes - prev.write_bytes
+    io_time = (cur.read_time - prev.read_time) + (cur.write_time - prev.write_time)
+    if min(reads, writes, read_bytes, write_bytes, io_time) < 0:
+        return None
+
+    util = None
+    busy = getattr(cur, "busy_time", None)
+    if busy is not None:
+        util = min(max(busy - prev.busy_time, 0) / (window * 1000.0) * 100.0, 100.0)
+
+    ios = reads + writes
+    return DiskIoRates(
+        read_mbps=read_bytes / _BYTES_PER_MB / window,
+        write_mbps=write_bytes / _BYTES_PER_MB / window,
+        read_iops=reads / window,
+        write_iops=writes / window,
+        await_ms=io_time / ios if ios else 0.0,
+        util_pct=util,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _parent_block(name: str) -> Optional[str]:
+    """
+    分区名 -> 所在块设备名；本身就是整块设备（或无法判断）时返回 None。
+    """
+    sys_path = f"/sys/class/block/{name}"
+    if os.path.exists(sys_path):
+        if os.path.exists(f"{sys_path}/partition"):
+            return os.path.basename(os.path.dirname(os.path.realpath(sys_path)))
+        return None
+    for pattern in _PARTITION_PATTERNS:
+        match = pattern.match(name)
+        if match:
+            return match.group(1)
+    return None
+
+
+def resolve_block_device(device: str, known: Dict[str, object]) -> Optional[str]:
+    """
+    把 /dev/sda1、/dev/mapper/vg-root、sda 等映射到 known 中的块设备名：
+    优先取分区所在的整块设备，计数中没有整块设备时取分区本身。
+    """
+    path = os.path.realpath(device) if device.startswith("/dev/") else device
+    name = os.path.basename(path)
+    parent = _parent_block(name)
+    for candidate in (parent, name):
+        if candidate is not None and candidate in known:
+            return candidate
+    return None
+
+
+def latest_disk_io() -> Dict[str, DiskIoRates]:
+    """
+    最近一次采样的各设备速率；采样尚未完成时为空。
+    """
+    sample = collector.latest("disk_io")
+    return sample.value if sample is not None else {}
+
+
+def list_disk_io_devices() -> List[str]:
+    return sorted(disk_io_meter.rings)
+
+
+def get_disk_io_history(
+    device: str,
+    limit: int = 300,
+    max_points: Optional[int] = None,
+    method: DownsampleMethod = "lttb",
+) -> DiskIoHistory:
+    """
+    返回某个块设备（或分区 / 设备路径）最近 limit 个采样点。
+    设备未知时抛出 KeyError。
+    """
+    rings = disk_io_meter.rings
+    name = resolve_block_device(device, rings)
+    if name is None:
+        raise KeyError(device)
+
+    ts, *series = rings[name].tail(limit)
+    applied = None
+    if max_points is not None and len(ts) > max_points:
+        ts, series = downsample(ts, series, max_points, method)
+        applied = method
+
+    read_mbps, write_mbps, read_iops, write_iops, await_ms, util_pct = series
+    return DiskIoHistory(
+        device=name,
+        interval_seconds=DISK_IO_SAMPLE_INTERVAL,
+        downsample=applied,
+        points=[
+            DiskIoPoint(
+                ts=datetime.utcfromtimestamp(ts[i]),
+                read_mbps=round(read_mbps[i], 3),
+                write_mbps=round(write_mbps[i], 3),
+                read_iops=round(read_iops[i], 1),
+                write_iops=round(write_iops[i], 1),
+                await_ms=round(await_ms[i], 2),
+                util_pct=round(util_pct[i], 1) if util_pct[i] >= 0 else None,
+            )
+            for i in range(len(ts))
+        ],
+    )
+
+
+# 全局单例：由后台 "disk_io" 任务刷新
+disk_io_meter = DiskIoMeter()
+
+collector.register("disk_io", disk_io_meter.sample, interval=DISK_IO_SAMPLE_INTERVAL)
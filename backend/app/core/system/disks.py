@@ -1,15 +1,21 @@
 # backend/app/core/disks_info.py
 import os
+import time
 from datetime import datetime, timezone
-from typing import List, Set
+from typing import Dict, List, Optional
 
 import psutil
 
-from app.models.system import DiskDevice, DiskDevicesSnapshot
+from app.core.collector import collector
+from app.core.system.disk_events import disk_events
+from app.core.system.disk_forecast import disk_forecaster
+from app.core.system.disk_io import DiskIoRates, latest_disk_io, resolve_block_device
+from app.core.system.mount_probe import mount_probe
+from app.models.system import DiskDevice, DiskDevicesSnapshot, DiskEvent
 
 
-# 模块级变量：保存上一轮的 device 集合，用于计算 added/removed
-_last_devices: Set[str] = set()
+# 后台枚举磁盘的间隔（秒）
+DISKS_SAMPLE_INTERVAL = 10.0
 
 
 def _guess_is_removable(partition: psutil._common.sdiskpart) -> bool:
@@ -44,68 +50,140 @@ def _guess_is_removable(partition: psutil._common.sdiskpart) -> bool:
     return False
 
 
+def _round_opt(value: Optional[float], ndigits: int) -> Optional[float]:
+    return round(value, ndigits) if value is not None else None
+
+
 def list_disk_devices() -> List[DiskDevice]:
     """
     列出当前系统所有“正常挂载”的磁盘分区。
     自动适配 mac / Linux / Windows，文件系统类型由 OS 决定。
+    无响应的挂载点标记为 unreachable，容量取最后一次成功的结果（从未成功时为 0）。
+    每个挂载点附带 inode 使用情况，以及按近期趋势估计的增长速率与写满时间（增量回归，不回看历史）。
     """
     devices: List[DiskDevice] = []
 
     partitions = psutil.disk_partitions(all=False)
+    # 各挂载点并行探测，失联的网络挂载最多拖慢本轮 DISK_USAGE_TIMEOUT 秒，之后按退避跳过
+    probes = mount_probe.probe(p.mountpoint for p in partitions)
+    mount_probe.retain(probes)
 
+    now = time.time()
     for p in partitions:
         mount = p.mountpoint
-        try:
-            usage = psutil.disk_usage(mount)
-        except (PermissionError, FileNotFoundError):
+        probe = probes[mount]
+        if probe.status == "error":
+            # 无权限 / 挂载点已消失
             continue
+        usage = probe.usage
+        inodes = probe.inodes
 
-        total_gb = usage.total / 1024**3
-        used_gb = usage.used / 1024**3
-        free_gb = usage.free / 1024**3
-
-        is_removable = _guess_is_removable(p)
+        growth = until_full = until_inodes_full = None
+        if probe.status == "ok":
+            space, inode = disk_forecaster.observe(mount, now, usage.used, usage.free, inodes)
+            if space.growth_per_hour is not None:
+                growth = space.growth_per_hour / 1024**3
+            until_full, until_inodes_full = space.hours_until_full, inode.hours_until_full
 
         devices.append(
             DiskDevice(
                 device=p.device,
                 mount=mount,
                 fsType=p.fstype or "unknown",
-                usagePct=round(usage.percent, 1),
-                totalGb=round(total_gb, 1),
-                usedGb=round(used_gb, 1),
-                freeGb=round(free_gb, 1),
-                isRemovable=is_removable,
+                usagePct=round(usage.percent, 1) if usage else 0.0,
+                totalGb=round(usage.total / 1024**3, 1) if usage else 0.0,
+                usedGb=round(usage.used / 1024**3, 1) if usage else 0.0,
+                freeGb=round(usage.free / 1024**3, 1) if usage else 0.0,
+                isRemovable=_guess_is_removable(p),
+                status=probe.status,
+                inodesTotal=inodes[0] if inodes else None,
+                inodesUsed=inodes[0] - inodes[1] if inodes else None,
+                inodesPct=round((inodes[0] - inodes[1]) / inodes[0] * 100, 1) if inodes else None,
+                growthGbPerHour=_round_opt(growth, 4),
+                hoursUntilFull=_round_opt(until_full, 1),
+                hoursUntilInodesFull=_round_opt(until_inodes_full, 1),
             )
         )
 
+    disk_forecaster.forget(p.mountpoint for p in partitions)
     return devices
 
 
-def get_disk_devices_snapshot() -> DiskDevicesSnapshot:
+def _with_io(device: DiskDevice, io: Dict[str, DiskIoRates]) -> DiskDevice:
     """
-    返回当前设备列表 + 和上一轮相比的新增/删除。
-    变化记录只保存在进程内存中，重启服务后会重新开始计算。
+    附加分区所在块设备的最新 I/O 速率（返回副本，不修改 collector 中的快照）。
+    """
+    block = resolve_block_device(device.device, io)
+    if block is None:
+        return device
+    rates = io[block]
+    return device.model_copy(update={
+        "blockDevice": block,
+        "readMBps": round(rates.read_mbps, 3),
+        "writeMBps": round(rates.write_mbps, 3),
+        "readIops": round(rates.read_iops, 1),
+        "writeIops": round(rates.write_iops, 1),
+        "awaitMs": round(rates.await_ms, 2),
+        "utilPct": round(rates.util_pct, 1) if rates.util_pct is not None else None,
+    })
+
+
+def collect_disk_devices() -> List[DiskDevice]:
+    """
+    "disks" 任务：枚举设备并把与上一轮相比的变化写入事件日志。
+    除每 10 秒一次外，Linux 上挂载表变化时由 MountWatcher 立即触发。
     """
-    global _last_devices
-
     devices = list_disk_devices()
-    current_ids = {d.device for d in devices}
+    disk_events.observe((d.device, d.mount) for d in devices)
+    return devices
 
-    if not _last_devices:
-        added = list(current_ids)
+
+def get_disk_devices_snapshot(since: Optional[int] = None) -> DiskDevicesSnapshot:
+    """
+    返回当前设备列表 + 新增/删除：
+      - since 为空：added 为当前全部设备（与首次调用一致）
+      - since 为上一次返回的 cursor：只返回该游标之后的变化，每个客户端各自维护游标，互不影响；
+        events 为原始事件，added / removed 为净变化（先插入后拔出的设备不出现）
+    事件只保存在进程内存中，游标失效（服务重启或事件过多被丢弃）时 truncated 为 true。
+    设备列表来自后台 collector 的最新快照。
+    """
+    devices = list(collector.get("disks"))
+    cursor = disk_events.cursor
+
+    events: List[DiskEvent] = []
+    truncated = False
+    if since is None:
+        added = sorted({d.device for d in devices})
         removed: List[str] = []
     else:
-        added = list(current_ids - _last_devices)
-        removed = list(_last_devices - current_ids)
-
-    _last_devices = current_ids
+        events, truncated = disk_events.since(since)
+        # 同一设备的事件交替出现，奇数次才有净变化，方向取最后一次
+        last: Dict[str, str] = {}
+        counts: Dict[str, int] = {}
+        for event in events:
+            last[event.device] = event.kind
+            counts[event.device] = counts.get(event.device, 0) + 1
+        changed = [device for device, n in counts.items() if n % 2 == 1]
+        added = sorted(d for d in changed if last[d] == "added")
+        removed = sorted(d for d in changed if last[d] == "removed")
+        if events:
+            cursor = events[-1].seq
+
+    io = latest_disk_io()
+    if io:
+        devices = [_with_io(d, io) for d in devices]
 
     snapshot_id = datetime.now(timezone.utc).isoformat()
 
     return DiskDevicesSnapshot(
         devices=devices,
-        added=sorted(added),
-        removed=sorted(removed),
+        added=added,
+        removed=removed,
         snapshotId=snapshot_id,
+        cursor=cursor,
+        events=events,
+        truncated=truncated,
     )
+
+
+collector.register("disks", collect_disk_devices, interval=DISKS_SAMPLE_INTERVAL)
@@ -0,0 +1,91 @@
+# backend/app/core/system/downsample.py
+from typing import List, Literal, Sequence, Tuple
+
+# lttb: 保留原始点，按三角形面积挑选最能代表形状的点
+# max / avg: 均分为 max_points 个桶，每个桶取最大值 / 平均值
+DownsampleMethod = Literal["lttb", "max", "avg"]
+
+Columns = Tuple[List[float], List[List[float]]]
+
+
+def lttb_indices(xs: Sequence[float], series: Sequence[Sequence[float]], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets，返回保留点的下标（升序，含首尾）。
+    多条序列共用同一组下标：每条序列按自身取值范围归一化后，三角形面积相加再比较，
+    任意一条序列上的尖峰都能被选中。
+    """
+    length = len(xs)
+    if threshold >= length or threshold < 3:
+        return list(range(length))
+
+    spans = []
+    for ys in series:
+        lo, hi = min(ys), max(ys)
+        spans.append(hi - lo or 1.0)
+
+    every = (length - 2) / (threshold - 2)
+    a = 0
+    picked = [0]
+    for i in range(threshold - 2):
+        # 下一个桶的平均点（三角形的第三个顶点）
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, length)
+        count = avg_end - avg_start
+        avg_x = sum(xs[avg_start:avg_end]) / count
+        avg_ys = [sum(ys[avg_start:avg_end]) / count for ys in series]
+
+        # 当前桶中与上一个选中点、下一个桶平均点构成最大面积的点
+        ax = xs[a]
+        best, best_area = -1, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            dx_a = ax - avg_x
+            dx_j = ax - xs[j]
+            area = 0.0
+            for ys, avg_y, span in zip(series, avg_ys, spans):
+                ay = ys[a]
+                area += abs(dx_a * (ys[j] - ay) - dx_j * (avg_y - ay)) / span
+            if area > best_area:
+                best, best_area = j, area
+        picked.append(best)
+        a = best
+
+    picked.append(length - 1)
+    return picked
+
+
+def bucket_reduce(xs: Sequence[float], series: Sequence[Sequence[float]], buckets: int, how: str) -> Columns:
+    """
+    把序列均分为 buckets 个桶，每个桶输出一个点：
+    时间取桶内第一个点，各序列取最大值（how="max"）或平均值（how="avg"）。
+    """
+    length = len(xs)
+    if buckets >= length or buckets < 1:
+        return list(xs), [list(ys) for ys in series]
+
+    out_x: List[float] = []
+    out_series: List[List[float]] = [[] for _ in series]
+    for b in range(buckets):
+        lo = b * length // buckets
+        hi = (b + 1) * length // buckets
+        out_x.append(xs[lo])
+        for out, ys in zip(out_series, series):
+            chunk = ys[lo:hi]
+            out.append(max(chunk) if how == "max" else sum(chunk) / len(chunk))
+    return out_x, out_series
+
+
+def downsample(
+    xs: Sequence[float],
+    series: Sequence[Sequence[float]],
+    max_points: int,
+    method: DownsampleMethod = "lttb",
+) -> Columns:
+    """
+    把 (xs, series...) 列数据压缩到不超过 max_points 个点，点数本来就不多时原样返回。
+    """
+    if len(xs) <= max_points:
+        return list(xs), [list(ys) for ys in series]
+    if method == "lttb":
+        keep = lttb_indices(xs, series, max_points)
+        return [xs[i] for i in keep], [[ys[i] for i in keep] for ys in series]
+    return bucket_reduce(xs, series, max_points, method)
@@ -0,0 +1,244 @@
+# backend/app/core/system/event_index.py
+"""
+系统事件的倒排索引，随事件写入 / 挤出缓冲区增量维护：
+  - 词项：消息转小写后按字母 / 数字 / 下划线切分，中日韩文字逐字切分；单个字母与超长的词（哈希等）不入索引，
+    查询时按子串校验
+  - unit、priority 各自一组倒排表
+  - 每个倒排表是按 seq 升序的 array('q')；事件总是从最旧的一端挤出，
+    删除只需把表头偏移 +1，定期压缩
+查询选最短的倒排表驱动遍历，其余条件用二分查找（词项）或直接比较记录字段（unit / priority / 时间）校验，
+只遍历到凑够 limit 条为止。
+"""
+from __future__ import annotations
+
+import heapq
+import re
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+# 中日韩文字没有空格分词，逐字入索引；查询时按所有字取交集，再按原文子串校验相邻
+_CJK = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff"
+_CJK_CHAR = re.compile(f"[{_CJK}]")
+# 其余文字按 Unicode 字母 / 数字 / 下划线切分
+_TOKEN_PATTERN = re.compile(f"[{_CJK}]|[^\\W{_CJK}]+")
+
+# 过短的词项几乎出现在每条消息里，不值得索引（单个汉字除外）
+_MIN_TOKEN_LEN = 2
+# 过长的词项通常是哈希 / base64，只会撑大词典
+_MAX_TOKEN_LEN = 40
+
+# 倒排表头部空洞超过该长度且超过一半时压缩
+_COMPACT_MIN = 64
+
+
+def _indexable(token: str) -> bool:
+    if len(token) < _MIN_TOKEN_LEN:
+        return _CJK_CHAR.match(token) is not None
+    return len(token) <= _MAX_TOKEN_LEN
+
+
+def tokenize(text: str) -> Set[str]:
+    return {token for token in _TOKEN_PATTERN.findall(text.lower()) if _indexable(token)}
+
+
+def split_query(text: str) -> Tuple[List[str], List[str]]:
+    """
+    把查询文本拆为 (索引中的词项, 需要按子串校验的片段)，都转为小写。
+    按空白分段：恰好是一个可索引词的段只查索引；其余的段（含标点、多个汉字、
+    单个字母、超长的词）在索引结果上再按整段子串校验，例如 "oom-killer"、"内存不足"、"-"。
+    """
+    indexed: List[str] = []
+    scanned: List[str] = []
+    for chunk in text.lower().split():
+        tokens = _TOKEN_PATTERN.findall(chunk)
+        indexed.extend(token for token in tokens if _indexable(token))
+        if not (len(tokens) == 1 and tokens[0] == chunk and _indexable(chunk)):
+            scanned.append(chunk)
+    return indexed, scanned
+
+
+class EventFilter(NamedTuple):
+    """
+    /system/events 的过滤条件，各条件之间为 AND。
+    """
+    terms: Tuple[str, ...] = ()                 # 索引中的词项
+    scanned: Tuple[str, ...] = ()               # 按子串校验的片段（见 split_query）
+    units: Optional[FrozenSet[str]] = None      # 任一 unit 命中即可
+    max_priority: Optional[int] = None          # 只保留 priority <= max_priority（更严重）的事件
+    start_us: Optional[int] = None              # 时间下界（含），微秒
+    end_us: Optional[int] = None                # 时间上界（含），微秒
+
+    @property
+    def empty(self) -> bool:
+        return self == _NO_FILTER
+
+    def match(
+        self,
+        message: str,
+        unit: Optional[str],
+        priority: Optional[int],
+        ts_us: int,
+        check_terms: bool = True,
+    ) -> bool:
+        """
+        逐条校验；走索引时词项已由倒排表保证，传 check_terms=False。
+        """
+        if self.units is not None and unit not in self.units:
+            return False
+        if self.max_priority is not None and (priority is None or priority > self.max_priority):
+            return False
+        if self.start_us is not None and ts_us < self.start_us:
+            return False
+        if self.end_us is not None and ts_us > self.end_us:
+            return False
+        if self.scanned or (check_terms and self.terms):
+            lowered = message.lower()
+            if not all(word in lowered for word in self.scanned):
+                return False
+            if check_terms and self.terms and not tokenize(lowered).issuperset(self.terms):
+                return False
+        return True
+
+
+_NO_FILTER = EventFilter()
+
+
+class Postings:
+    """
+    升序的 seq 列表；start 之前的元素已被挤出。
+    """
+    __slots__ = ("seqs", "start")
+
+    def __init__(self) -> None:
+        self.seqs = array("q")
+        self.start = 0
+
+    def __len__(self) -> int:
+        return len(self.seqs) - self.start
+
+    def append(self, seq: int) -> None:
+        self.seqs.append(seq)
+
+    def evict(self, seq: int) -> None:
+        if self.start < len(self.seqs) and self.seqs[self.start] == seq:
+            self.start += 1
+            if self.start >= _COMPACT_MIN and self.start * 2 >= len(self.seqs):
+                del self.seqs[:self.start]
+                self.start = 0
+
+    def contains(self, seq: int) -> bool:
+        i = bisect_left(self.seqs, seq, self.start)
+        return i < len(self.seqs) and self.seqs[i] == seq
+
+    def iter_range(self, lo: int, hi: int, descending: bool) -> Iterator[int]:
+        """
+        遍历 lo <= seq < hi 的元素。
+        """
+        left = bisect_left(self.seqs, lo, self.start)
+        right = bisect_left(self.seqs, hi, left)
+        seqs = self.seqs
+        if descending:
+            for i in range(right - 1, left - 1, -1):
+                yield seqs[i]
+        else:
+            for i in range(left, right):
+                yield seqs[i]
+
+
+def _merge(lists: Sequence[Postings], lo: int, hi: int, descending: bool) -> Iterator[int]:
+    """
+    多个倒排表的并集（各表之间没有重复 seq，例如不同 priority）。
+    """
+    iterators = [p.iter_range(lo, hi, descending) for p in lists]
+    if descending:
+        return (-seq for seq in heapq.merge(*((-s for s in it) for it in iterators)))
+    return heapq.merge(*iterators)
+
+
+class EventIndex:
+    """
+    由持有事件缓冲区的一方在同一把锁内调用 add / evict / candidates。
+    """
+
+    def __init__(self) -> None:
+        self.terms: Dict[str, Postings] = {}
+        self.units: Dict[str, Postings] = {}
+        self.priorities: Dict[int, Postings] = {}
+
+    @staticmethod
+    def _add_to(table: Dict, key, seq: int) -> None:
+        postings = table.get(key)
+        if postings is None:
+            postings = table[key] = Postings()
+        postings.append(seq)
+
+    @staticmethod
+    def _evict_from(table: Dict, key, seq: int) -> None:
+        postings = table.get(key)
+        if postings is None:
+            return
+        postings.evict(seq)
+        if not postings:
+            del table[key]
+
+    def add(self, seq: int, message: str, unit: Optional[str], priority: Optional[int]) -> None:
+        for term in tokenize(message):
+            self._add_to(self.terms, term, seq)
+        if unit:
+            self._add_to(self.units, unit, seq)
+        if priority is not None:
+            self._add_to(self.priorities, priority, seq)
+
+    def evict(self, seq: int, message: str, unit: Optional[str], priority: Optional[int]) -> None:
+        for term in tokenize(message):
+            self._evict_from(self.terms, term, seq)
+        if unit:
+            self._evict_from(self.units, unit, seq)
+        if priority is not None:
+            self._evict_from(self.priorities, priority, seq)
+
+    def candidates(
+        self,
+        lo: int,
+        hi: int,
+        descending: bool,
+        terms: Iterable[str] = (),
+        units: Optional[Iterable[str]] = None,
+        max_priority: Optional[int] = None,
+    ) -> Tuple[Iterator[int], Callable[[int], bool]]:
+        """
+        返回 (候选 seq 迭代器, 词项校验函数)：
+          - 迭代器来自最短的条件（某个词项 / unit 集合 / priority 集合 / seq 区间 [lo, hi)）
+          - 校验函数检查其余词项；unit / priority / 时间由调用方对记录直接比较
+        任一词项不在索引中时没有结果。
+        """
+        term_lists: List[Postings] = []
+        for term in dict.fromkeys(terms):
+            postings = self.terms.get(term)
+            if postings is None:
+                return iter(()), lambda seq: False
+            term_lists.append(postings)
+        term_lists.sort(key=len)
+
+        # 条件名 -> (候选数, 迭代器工厂)
+        options: Dict[str, Tuple[int, Callable[[], Iterator[int]]]] = {
+            "range": (hi - lo, lambda: iter(range(hi - 1, lo - 1, -1) if descending else range(lo, hi))),
+        }
+        if term_lists:
+            first = term_lists[0]
+            options["term"] = (len(first), lambda: first.iter_range(lo, hi, descending))
+        if units is not None:
+            unit_lists = [self.units[u] for u in units if u in self.units]
+            options["unit"] = (sum(map(len, unit_lists)), lambda: _merge(unit_lists, lo, hi, descending))
+        if max_priority is not None:
+            prio_lists = [p for level, p in self.priorities.items() if level <= max_priority]
+            options["priority"] = (sum(map(len, prio_lists)), lambda: _merge(prio_lists, lo, hi, descending))
+
+        kind = min(options, key=lambda name: options[name][0])
+        rest = term_lists[1:] if kind == "term" else term_lists
+
+        def check(seq: int) -> bool:
+            return all(p.contains(seq) for p in rest)
+
+        return options[kind][1](), check
@@ -0,0 +1,213 @@
+# backend/app/core/system/event_rates.py
+"""
+系统事件速率与突发检测，由 journal 读取线程在写入每条事件时调用 observe()：
+  - 按 unit（没有 unit 的事件如内核日志按 SYSLOG_IDENTIFIER 归类）、priority 以及总量各维护一组
+    每分钟一个桶的环形计数（最近 60 分钟）
+  - 每个桶结束时用其计数更新指数加权的均值 / 方差（半衰期 1 小时），作为该序列的基线
+  - 当前速率取最近 60 秒的滑动窗口近似：当前桶 + 上一个桶按未覆盖比例折算
+  - 当前速率同时超过基线的 BURST_RATIO 倍与 BURST_SIGMA 个标准差、且不低于 BURST_MIN_RATE 时视为突发
+每条事件只更新计数；桶切换时基线按闭式解跳过中间的空桶，最多清零 EVENT_RATE_HISTORY 个槽位，与事件量无关。
+桶按事件自身的时间戳划分，启动时回读的历史日志也会计入基线。
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from array import array
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# 每个桶的秒数
+EVENT_RATE_BUCKET = 60
+# 每个序列保留的桶数（60 分钟）
+EVENT_RATE_HISTORY = 60
+# 基线的半衰期（桶数）
+EVENT_RATE_HALF_LIFE = 60
+# 结束的桶少于该数量时基线尚未稳定，不判断突发
+BURST_WARMUP = 15
+# 突发阈值：速率 >= 基线 * BURST_RATIO，且 >= 基线 + BURST_SIGMA * 标准差，且 >= BURST_MIN_RATE（条 / 分钟）
+BURST_RATIO = 5.0
+BURST_SIGMA = 4.0
+BURST_MIN_RATE = 30.0
+# 最多单独统计的 unit 数，超出后归入 OTHER_UNIT，避免大量临时 unit（session-N.scope 等）撑大内存
+EVENT_RATE_MAX_UNITS = 512
+OTHER_UNIT = "(other)"
+UNKNOWN_UNIT = "(unknown)"
+
+_ALPHA = 1.0 - 0.5 ** (1.0 / EVENT_RATE_HALF_LIFE)
+
+# syslog 优先级名称
+PRIORITY_NAMES = {
+    0: "emerg", 1: "alert", 2: "crit", 3: "err",
+    4: "warning", 5: "notice", 6: "info", 7: "debug",
+}
+
+
+class RateSeries:
+    """
+    一组每分钟计数的环形桶与 EWMA 基线；bucket 为当前（未结束）桶的编号（时间戳 // 桶宽）。
+    """
+    __slots__ = ("counts", "bucket", "mean", "var", "norm", "closed")
+
+    def __init__(self, bucket: int) -> None:
+        self.counts = array("l", bytes(array("l").itemsize * EVENT_RATE_HISTORY))
+        self.bucket = bucket
+        self.mean = 0.0
+        self.var = 0.0
+        self.norm = 0.0   # 1 - (1 - α)^closed，用于修正从 0 起步的偏差
+        self.closed = 0
+
+    def _close(self, value: float) -> None:
+        diff = value - self.mean
+        incr = _ALPHA * diff
+        self.mean += incr
+        self.var = (1.0 - _ALPHA) * (self.var + diff * incr)
+        self.norm = self.norm * (1.0 - _ALPHA) + _ALPHA
+        self.closed += 1
+
+    def _close_empty(self, n: int) -> None:
+        """
+        连续 n 个空桶，等价于 n 次 _close(0) 的闭式解：
+        mean *= d^n，var = d^n * (var + mean^2 * (1 - d^n))，其中 d = 1 - α。
+        """
+        decay = (1.0 - _ALPHA) ** n
+        self.var = decay * (self.var + self.mean * self.mean * (1.0 - decay))
+        self.mean *= decay
+        self.norm = self.norm * decay + (1.0 - decay)
+        self.closed += n
+
+    def advance(self, bucket: int) -> None:
+        """
+        把当前桶推进到 bucket：结束当前桶，中间的空桶按闭式解计入基线，并清零复用的槽位。
+        """
+        gap = bucket - self.bucket
+        if gap <= 0:
+            return
+        self._close(self.counts[self.bucket % EVENT_RATE_HISTORY])
+        if gap > 1:
+            self._close_empty(gap - 1)
+        for i in range(1, min(gap, EVENT_RATE_HISTORY) + 1):
+            self.counts[(self.bucket + i) % EVENT_RATE_HISTORY] = 0
+        self.bucket = bucket
+
+    def add(self, bucket: int) -> None:
+        if bucket > self.bucket:
+            self.advance(bucket)
+        elif bucket <= self.bucket - EVENT_RATE_HISTORY:
+            return  # 早于保留范围的乱序事件
+        self.counts[bucket % EVENT_RATE_HISTORY] += 1
+
+    @property
+    def idle(self) -> bool:
+        return not any(self.counts) and self.mean / max(self.norm, 1e-9) < 0.01
+
+    def baseline(self) -> Optional[Tuple[float, float]]:
+        """
+        (均值, 标准差)，单位为条 / 桶；预热期间为 None。
+        """
+        if self.closed < BURST_WARMUP:
+            return None
+        return self.mean / self.norm, math.sqrt(max(self.var / self.norm, 0.0))
+
+    def rate(self, now: float) -> float:
+        """
+        最近一个桶宽内的事件数（滑动窗口近似）。
+        """
+        elapsed = min(max(now / EVENT_RATE_BUCKET - self.bucket, 0.0), 1.0)
+        current = self.counts[self.bucket % EVENT_RATE_HISTORY]
+        previous = self.counts[(self.bucket - 1) % EVENT_RATE_HISTORY] if self.closed else 0
+        return current + previous * (1.0 - elapsed)
+
+    def history(self, n: int) -> List[int]:
+        n = min(n, EVENT_RATE_HISTORY)
+        return [self.counts[(self.bucket - i) % EVENT_RATE_HISTORY] for i in range(n - 1, -1, -1)]
+
+
+class RateReading(NamedTuple):
+    key: str
+    per_minute: float
+    baseline_per_minute: Optional[float]
+    stddev_per_minute: Optional[float]
+    burst: bool
+    history: List[int]
+
+
+def _reading(key: str, series: RateSeries, now: float, history: int) -> RateReading:
+    scale = 60.0 / EVENT_RATE_BUCKET
+    rate = series.rate(now)
+    baseline = series.baseline()
+    if baseline is None:
+        return RateReading(key, rate * scale, None, None, False, series.history(history))
+    mean, std = baseline
+    burst = (
+        rate * scale >= BURST_MIN_RATE
+        and rate >= mean * BURST_RATIO
+        and rate >= mean + BURST_SIGMA * std
+    )
+    return RateReading(key, rate * scale, mean * scale, std * scale, burst, series.history(history))
+
+
+class EventRates:
+    """
+    写入方为 journal 读取线程，读取方为请求线程；snapshot() 顺带把各序列推进到当前时间并清理空闲的 unit。
+    """
+
+    def __init__(self) -> None:
+        self._total: Optional[RateSeries] = None
+        self._units: Dict[str, RateSeries] = {}
+        self._priorities: Dict[int, RateSeries] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, ts_us: int, unit: Optional[str], priority: Optional[int]) -> None:
+        bucket = ts_us // (EVENT_RATE_BUCKET * 1_000_000)
+        key = unit or UNKNOWN_UNIT
+        with self._lock:
+            if self._total is None:
+                self._total = RateSeries(bucket)
+            self._total.add(bucket)
+            series = self._units.get(key)
+            if series is None:
+                if len(self._units) >= EVENT_RATE_MAX_UNITS:
+                    key = OTHER_UNIT
+                    series = self._units.get(key)
+                if series is None:
+                    series = self._units[key] = RateSeries(bucket)
+            series.add(bucket)
+            if priority is not None:
+                series = self._priorities.get(priority)
+                if series is None:
+                    series = self._priorities[priority] = RateSeries(bucket)
+                series.add(bucket)
+
+    def snapshot(
+        self,
+        history: int = 0,
+        now: Optional[float] = None,
+    ) -> Tuple[Optional[RateReading], List[RateReading], List[RateReading]]:
+        """
+        返回 (总量, 各 unit, 各 priority)；unit 按当前速率降序，priority 按级别升序。
+        """
+        now = time.time() if now is None else now
+        bucket = int(now // EVENT_RATE_BUCKET)
+        with self._lock:
+            for key in list(self._units):
+                series = self._units[key]
+                series.advance(bucket)
+                if series.idle:
+                    del self._units[key]
+            total = None
+            if self._total is not None:
+                self._total.advance(bucket)
+                total = _reading("all", self._total, now, history)
+            units = [_reading(key, s, now, history) for key, s in self._units.items()]
+            priorities = []
+            for level in sorted(self._priorities):
+                series = self._priorities[level]
+                series.advance(bucket)
+                priorities.append(_reading(PRIORITY_NAMES.get(level, str(level)), series, now, history))
+        units.sort(key=lambda r: r.per_minute, reverse=True)
+        return total, units, priorities
+
+
+# 全局单例
+event_rates = EventRates()
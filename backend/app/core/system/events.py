@@ -2,26 +2,21 @@
 import platform
 import subprocess
 from datetime import datetime
-from typing import List
+from typing import Iterable, List, Optional
 
-from app.models.system import SystemEvent, SystemEventsOverview
+from app.core.system.event_index import EventFilter, split_query
+from app.core.system.event_rates import EVENT_RATE_BUCKET, RateReading, event_rates
+from app.core.system.journal import JOURNAL_BACKLOG, journal_reader, journal_ring, parse_journal_entry
+from app.models.system import EventRate, EventRatesOverview, SystemEvent, SystemEventsOverview
 
 
 def _parse_linux_journal(lines: List[str]) -> List[SystemEvent]:
+    # journalctl -o json：每行一个 JSON 对象
     events: List[SystemEvent] = []
     for line in lines:
-        # journalctl -o short-iso: 2025-12-11T17:00:00+08:00 hostname process[pid]: message
-        if not line.strip():
-            continue
-        try:
-            ts_str, rest = line.split(" ", 1)
-            timestamp = datetime.fromisoformat(ts_str)
-        except Exception:
-            # fallback: 当前时间
-            timestamp = datetime.utcnow()
-            rest = line
-
-        events.append(SystemEvent(timestamp=timestamp, message=rest.strip()))
+        parsed = parse_journal_entry(line)
+        if parsed is not None:
+            events.append(parsed[0].to_event())
     return events
 
 
@@ -40,14 +35,116 @@ def _parse_macos_log(lines: List[str]) -> List[SystemEvent]:
     return events
 
 
-def get_system_events(limit: int = 100) -> SystemEventsOverview:
+def _to_us(value: datetime) -> int:
+    # 无时区的时间按 UTC 处理，与 /system/resource-trend 一致
+    if value.tzinfo is None:
+        return int((value - datetime(1970, 1, 1)).total_seconds() * 1_000_000)
+    return int(value.timestamp() * 1_000_000)
+
+
+def build_event_filter(
+    q: Optional[str] = None,
+    units: Optional[Iterable[str]] = None,
+    priority: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> EventFilter:
+    """
+    把请求参数转为 EventFilter；unit 不带后缀时同时匹配 <unit>.service。
+    from / to 可能一个带时区一个不带，统一换算为微秒后比较；to 不晚于 from 时抛出 ValueError。
+    q 中没有任何可索引的词（只有单个字母 / 标点）时也抛出 ValueError，避免逐条扫描整个缓冲区。
+    """
+    start_us = _to_us(start) if start is not None else None
+    end_us = _to_us(end) if end is not None else None
+    if start_us is not None and end_us is not None and end_us <= start_us:
+        raise ValueError("'to' must be later than 'from'")
+    terms, scanned = split_query(q or "")
+    if scanned and not terms:
+        raise ValueError("'q' must contain a word of at least 2 letters/digits or a CJK character")
+    unit_set = None
+    if units:
+        names = set()
+        for unit in units:
+            names.add(unit)
+            if "." not in unit:
+                names.add(f"{unit}.service")
+        unit_set = frozenset(names)
+    return EventFilter(
+        terms=tuple(dict.fromkeys(terms)),
+        scanned=tuple(dict.fromkeys(scanned)),
+        units=unit_set,
+        max_priority=priority,
+        start_us=start_us,
+        end_us=end_us,
+    )
+
+
+def _from_ring(
+    limit: int,
+    since: Optional[int],
+    filters: EventFilter,
+    before: Optional[int],
+) -> SystemEventsOverview:
+    if not filters.empty or before is not None:
+        page = journal_ring.search(filters, limit, since=since, before=before)
+        return SystemEventsOverview(
+            items=page.items,
+            cursor=page.cursor,
+            truncated=page.truncated,
+            has_more=page.has_more,
+            next_before=page.next_before,
+        )
+    if since is None:
+        items = journal_ring.recent(limit)
+        truncated = False
+        cursor = items[-1].seq if items else journal_ring.cursor
+    else:
+        items, truncated = journal_ring.since(since, limit)
+        cursor = items[-1].seq if items else min(since, journal_ring.cursor)
+    return SystemEventsOverview(items=items, cursor=cursor, truncated=truncated)
+
+
+def _journalctl_args(limit: int, filters: EventFilter) -> List[str]:
+    """
+    一次性执行 journalctl 时尽量让它自己过滤；全文词项仍在这里逐条校验，因此多读一些。
+    """
+    args = ["journalctl", "-o", "json", "--no-pager"]
+    args += ["-n", str(JOURNAL_BACKLOG if filters.terms or filters.scanned else limit)]
+    for unit in sorted(filters.units or ()):
+        args += ["-u", unit]
+    if filters.max_priority is not None:
+        args += ["-p", f"0..{filters.max_priority}"]
+    if filters.start_us is not None:
+        args.append(f"--since=@{filters.start_us / 1_000_000:.6f}")
+    if filters.end_us is not None:
+        args.append(f"--until=@{filters.end_us / 1_000_000:.6f}")
+    return args
+
+
+def get_system_events(
+    limit: int = 100,
+    since: Optional[int] = None,
+    filters: Optional[EventFilter] = None,
+    before: Optional[int] = None,
+) -> SystemEventsOverview:
+    """
+    Linux 上优先读取常驻 journalctl 读取线程的内存缓冲区（不 fork）：
+      - since 为空：最近 limit 条
+      - since 为上一次返回的 cursor：此后的最早 limit 条，cursor 推进到最后一条
+      - filters 非空：走倒排索引检索，语义同上，before 用于向更早翻页
+    读取线程未运行时（脚本调用 / 未启动 lifespan）退化为一次性执行 journalctl，不支持 since / before。
+    """
     system = platform.system().lower()
+    filters = filters or EventFilter()
     events: List[SystemEvent] = []
 
+    if system == "linux" and journal_reader.running:
+        return _from_ring(limit, since, filters, before)
+
     try:
         if system == "linux":
             result = subprocess.run(
-                ["journalctl", "-n", str(limit), "-o", "short-iso"],
+                _journalctl_args(limit, filters),
                 capture_output=True,
                 text=True,
                 check=False,
@@ -61,7 +158,7 @@ def get_system_events(limit: int = 100) -> SystemEventsOverview:
                 text=True,
                 check=False,
             )
-            lines = result.stdout.splitlines()[-limit:]
+            lines = result.stdout.splitlines()
             events = _parse_macos_log(lines)
         else:
             # Windows / 其它平台：暂时返回空列表
@@ -69,4 +166,37 @@ def get_system_events(limit: int = 100) -> SystemEventsOverview:
     except Exception:
         events = []
 
-    return SystemEventsOverview(items=events)
+    if not filters.empty:
+        events = [
+            e for e in events
+            if filters.match(e.message, e.unit, e.priority, _to_us(e.timestamp))
+        ]
+    has_more = len(events) > limit
+    return SystemEventsOverview(items=events[-limit:], has_more=has_more)
+
+
+def _to_model(reading: RateReading) -> EventRate:
+    return EventRate(**reading._asdict())
+
+
+def get_event_rates(
+    history: int = 0,
+    limit: int = 50,
+    bursts_only: bool = False,
+) -> EventRatesOverview:
+    """
+    各 unit / priority 的事件速率，由 journal 读取线程写入时增量累计，这里只读取。
+    读取线程未运行（非 Linux / 未启动 lifespan）时各列表为空。
+    """
+    total, units, priorities = event_rates.snapshot(history=history)
+    bursts = [r.key for r in units if r.burst]
+    if bursts_only:
+        units = [r for r in units if r.burst]
+    return EventRatesOverview(
+        bucket_seconds=EVENT_RATE_BUCKET,
+        generated_at=datetime.utcnow(),
+        total=_to_model(total) if total is not None else None,
+        units=[_to_model(r) for r in units[:limit]],
+        priorities=[_to_model(r) for r in priorities],
+        bursts=bursts,
+    )
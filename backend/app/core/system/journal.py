@@ -0,0 +1,385 @@
+# backend/app/core/system/journal.py
+"""
+systemd journal 增量读取：
+  - 后台线程常驻运行 `journalctl -f -o json`，逐行解析为结构化事件，写入有界环形缓冲区
+  - 事件带递增序号 seq，客户端用 since=<seq> 只读取新事件；/system/events 不再每次 fork journalctl
+  - journalctl 退出（journald 重启、日志轮转异常等）后按退避重启，并用 --after-cursor 从断点继续
+  - 写入缓冲区时增量维护倒排索引（见 event_index），按 unit / priority / 时间 / 全文词项检索
+  - 同时按 unit / priority 累计每分钟事件数并检测突发（见 event_rates）
+时间戳取 __REALTIME_TIMESTAMP（微秒），不再依赖文本格式解析。
+"""
+from __future__ import annotations
+
+import json
+import logging
+import shutil
+import subprocess
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from app.core.system.event_index import EventFilter, EventIndex
+from app.core.system.event_rates import EventRates, event_rates
+from app.models.system import SystemEvent
+
+logger = logging.getLogger(__name__)
+
+# 内存中保留的事件条数（含索引约 0.5 KB / 条，写满约 100 MB）
+JOURNAL_RING_SIZE = 200_000
+# 首次启动时回读的历史条数，使检索能覆盖服务启动前的一段时间
+JOURNAL_BACKLOG = 20_000
+# journalctl 退出后的重启退避（秒）：5、10、20 ... 最长 5 分钟
+JOURNAL_RESTART_BACKOFF = 5.0
+JOURNAL_RESTART_BACKOFF_MAX = 300.0
+# 一次检索最多检查的候选条数，限制选择性很差的条件占用锁的时间
+SEARCH_SCAN_MAX = 10_000
+
+# syslog 优先级 -> level
+_PRIORITY_LEVELS = {
+    0: "error", 1: "error", 2: "error", 3: "error",
+    4: "warning",
+    5: "info", 6: "info",
+    7: "debug",
+}
+
+# 缓冲区表头空洞至少达到该条数（且超过容量的 1/4）时压缩
+_RING_COMPACT_MIN = 1024
+
+
+def _text(value: Any) -> Optional[str]:
+    """
+    journal JSON 中非 UTF-8 字段以字节数组输出，重复字段以字符串数组输出。
+    """
+    if value is None:
+        return None
+    if isinstance(value, list):
+        if value and all(isinstance(v, int) for v in value):
+            return bytes(value).decode("utf-8", "replace")
+        return _text(value[0]) if value else None
+    return str(value)
+
+
+def _int(value: Any) -> Optional[int]:
+    text = _text(value)
+    try:
+        return int(text) if text is not None else None
+    except ValueError:
+        return None
+
+
+class JournalRecord(NamedTuple):
+    """
+    缓冲区中的紧凑记录；SystemEvent 只在返回给请求时构造。
+    """
+    seq: int
+    ts_us: int                 # __REALTIME_TIMESTAMP，微秒
+    priority: Optional[int]
+    pid: Optional[int]
+    unit: Optional[str]
+    source: Optional[str]
+    message: str
+
+    def to_event(self) -> SystemEvent:
+        return SystemEvent(
+            timestamp=datetime.fromtimestamp(self.ts_us / 1_000_000, tz=timezone.utc),
+            level=_PRIORITY_LEVELS.get(self.priority) if self.priority is not None else None,
+            source=self.source,
+            message=self.message,
+            seq=self.seq or None,
+            unit=self.unit,
+            priority=self.priority,
+            pid=self.pid,
+        )
+
+
+def parse_journal_entry(line: str) -> Optional[Tuple[JournalRecord, Optional[str]]]:
+    """
+    解析一行 `journalctl -o json`，返回 (记录, journal 游标)；无法解析或没有时间戳时返回 None。
+    记录的 seq 为 0，由 JournalRing.append 分配。
+    """
+    try:
+        entry: Dict[str, Any] = json.loads(line)
+    except ValueError:
+        return None
+    realtime = _int(entry.get("__REALTIME_TIMESTAMP"))
+    if realtime is None:
+        return None
+
+    unit = _text(entry.get("_SYSTEMD_UNIT")) or _text(entry.get("UNIT"))
+    source = _text(entry.get("SYSLOG_IDENTIFIER")) or unit
+    record = JournalRecord(
+        seq=0,
+        ts_us=realtime,
+        priority=_int(entry.get("PRIORITY")),
+        pid=_int(entry.get("_PID")) or _int(entry.get("SYSLOG_PID")),
+        # unit / source 取值很少，驻留后缓冲区中只保留一份
+        unit=sys.intern(unit) if unit else None,
+        source=sys.intern(source) if source else None,
+        message=(_text(entry.get("MESSAGE")) or "").strip(),
+    )
+    return record, _text(entry.get("__CURSOR"))
+
+
+class SearchPage(NamedTuple):
+    items: List[SystemEvent]
+    cursor: int
+    truncated: bool
+    has_more: bool
+    next_before: Optional[int]
+
+
+class JournalRing:
+    """
+    带序号的事件环形缓冲区，同时维护倒排索引。写入方为读取线程，读取方为请求线程。
+      - 记录保存在 list 中，seq 连续递增，按下标直接定位；挤出时只移动表头偏移，定期压缩
+      - _ts_max 为时间戳的前缀最大值（journal 时间偶有回拨），可二分出时间区间对应的 seq 区间
+    recent / since 为 O(limit)；search 只遍历最短倒排表中位于区间内的部分。
+    """
+
+    def __init__(self, capacity: int = JOURNAL_RING_SIZE) -> None:
+        self.capacity = capacity
+        self._records: List[JournalRecord] = []
+        self._ts_max = array("q")
+        self._head = 0  # _records[_head] 为最旧的记录
+        self._seq = 0
+        self._index = EventIndex()
+        self._lock = threading.Lock()
+
+    @property
+    def cursor(self) -> int:
+        return self._seq
+
+    def __len__(self) -> int:
+        return len(self._records) - self._head
+
+    def _first_seq(self) -> int:
+        return self._seq - len(self) + 1
+
+    def append(self, record: JournalRecord) -> None:
+        with self._lock:
+            self._seq += 1
+            record = record._replace(seq=self._seq)
+            ts_max = max(record.ts_us, self._ts_max[-1]) if self._ts_max else record.ts_us
+            self._records.append(record)
+            self._ts_max.append(ts_max)
+            self._index.add(record.seq, record.message, record.unit, record.priority)
+            if len(self) > self.capacity:
+                self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        oldest = self._records[self._head]
+        self._index.evict(oldest.seq, oldest.message, oldest.unit, oldest.priority)
+        self._head += 1
+        if self._head >= _RING_COMPACT_MIN and self._head * 4 >= self.capacity:
+            del self._records[:self._head]
+            del self._ts_max[:self._head]
+            self._head = 0
+
+    def _at(self, seq: int) -> JournalRecord:
+        return self._records[self._head + seq - self._first_seq()]
+
+    def recent(self, limit: int) -> List[SystemEvent]:
+        """
+        最近 limit 条，按时间升序。
+        """
+        with self._lock:
+            n = min(limit, len(self))
+            rows = self._records[len(self._records) - n:]
+        return [r.to_event() for r in rows]
+
+    def since(self, cursor: int, limit: int) -> Tuple[List[SystemEvent], bool]:
+        """
+        序号大于 cursor 的最早 limit 条（按时间升序），以及 cursor 之后是否有事件已被挤出缓冲区。
+        cursor 大于当前序号（服务重启）时视为丢失，从最旧的事件开始返回。
+        """
+        with self._lock:
+            first = self._first_seq()
+            if cursor > self._seq:
+                start, truncated = 0, True
+            else:
+                start = max(cursor - first + 1, 0)
+                truncated = cursor < first - 1
+            start += self._head
+            rows = self._records[start:min(start + limit, len(self._records))]
+        return [r.to_event() for r in rows], truncated
+
+    def _seq_bounds(self, filters: EventFilter) -> Tuple[int, int]:
+        """
+        时间条件对应的 seq 区间 [lo, hi)。
+        """
+        lo, hi = self._first_seq(), self._seq + 1
+        if filters.start_us is not None:
+            lo += bisect_left(self._ts_max, filters.start_us, self._head) - self._head
+        if filters.end_us is not None:
+            hi = self._first_seq() + bisect_right(self._ts_max, filters.end_us, self._head) - self._head
+        return lo, hi
+
+    def search(
+        self,
+        filters: EventFilter,
+        limit: int,
+        since: Optional[int] = None,
+        before: Optional[int] = None,
+    ) -> SearchPage:
+        """
+        按条件检索，返回按时间升序的一页事件：
+          - since 为空：最新的 limit 条匹配；has_more 时把 next_before 作为 before 传回，继续向更早检索
+          - since 为上一次的游标：此后最早的 limit 条匹配；has_more 表示还有更新的匹配未返回
+        游标为已检查过的最大 seq，之后用同样的条件带 since 轮询即可只拿到新匹配。
+        每次最多检查 SEARCH_SCAN_MAX 个候选，超出时提前返回（has_more 为真，可能不足 limit 条），
+        以免选择性很差的条件长时间占用锁。
+        """
+        with self._lock:
+            lo, hi = self._seq_bounds(filters)
+            first = self._first_seq()
+            cursor, truncated = self._seq, False
+            descending = since is None
+            if since is not None:
+                if since > self._seq:
+                    truncated = True
+                else:
+                    truncated = since < first - 1
+                    lo = max(lo, since + 1)
+            if before is not None:
+                hi = min(hi, before)
+
+            seqs, check = self._index.candidates(
+                lo, hi, descending,
+                terms=filters.terms,
+                units=filters.units,
+                max_priority=filters.max_priority,
+            )
+            rows: List[JournalRecord] = []
+            stopped_at: Optional[int] = None  # 尚未返回的第一个候选
+            for examined, seq in enumerate(seqs):
+                if examined == SEARCH_SCAN_MAX:
+                    stopped_at = seq
+                    break
+                if not check(seq):
+                    continue
+                record = self._at(seq)
+                if not filters.match(record.message, record.unit, record.priority, record.ts_us, check_terms=False):
+                    continue
+                if len(rows) == limit:
+                    stopped_at = seq
+                    break
+                rows.append(record)
+
+        next_before = None
+        if descending:
+            rows.reverse()
+            if stopped_at is not None:
+                next_before = stopped_at + 1
+        elif stopped_at is not None:
+            cursor = stopped_at - 1
+        return SearchPage([r.to_event() for r in rows], cursor, truncated, stopped_at is not None, next_before)
+
+
+class JournalReader:
+    """
+    常驻 journalctl 读取线程，由 app.main 的 lifespan 启动 / 停止。
+    """
+
+    def __init__(self, ring: JournalRing, rates: EventRates) -> None:
+        self.ring = ring
+        self.rates = rates
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._proc: Optional[subprocess.Popen] = None
+        self._last_cursor: Optional[str] = None
+
+    @staticmethod
+    def available() -> bool:
+        return shutil.which("journalctl") is not None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if not self.available() or self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="journal-reader", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        proc = self._proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _command(self) -> List[str]:
+        cmd = ["journalctl", "-f", "-o", "json", "--no-pager"]
+        if self._last_cursor:
+            cmd.append(f"--after-cursor={self._last_cursor}")
+        else:
+            cmd += ["-n", str(JOURNAL_BACKLOG)]
+        return cmd
+
+    def _run(self) -> None:
+        backoff = JOURNAL_RESTART_BACKOFF
+        while not self._stop.is_set():
+            produced = self._follow()
+            if produced:
+                backoff = JOURNAL_RESTART_BACKOFF
+            if self._stop.wait(backoff):
+                break
+            if not produced:
+                backoff = min(backoff * 2, JOURNAL_RESTART_BACKOFF_MAX)
+
+    def _follow(self) -> int:
+        """
+        运行一次 journalctl 直到其退出，返回写入的事件数。
+        """
+        resume = self._last_cursor is not None
+        try:
+            self._proc = subprocess.Popen(
+                self._command(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+        except OSError as exc:
+            logger.warning("failed to start journalctl: %s", exc)
+            return 0
+
+        produced = 0
+        try:
+            for line in self._proc.stdout:
+                parsed = parse_journal_entry(line)
+                if parsed is None:
+                    continue
+                record, cursor = parsed
+                # --after-cursor 已定位到断点之后；部分版本会重复输出断点本身，只检查第一条。
+                # 不按时间戳过滤：journal 时间可能回退，乱序条目同样要保留
+                if resume:
+                    resume = False
+                    if cursor == self._last_cursor:
+                        continue
+                self.ring.append(record)
+                self.rates.observe(record.ts_us, record.unit or record.source, record.priority)
+                self._last_cursor = cursor or self._last_cursor
+                produced += 1
+        finally:
+            if self._proc.poll() is None:
+                self._proc.terminate()
+            try:
+                self._proc.wait(timeout=2.0)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+            self._proc = None
+        return produced
+
+
+# 全局单例
+journal_ring = JournalRing()
+journal_reader = JournalReader(journal_ring, event_rates)
@@ -0,0 +1,218 @@
+# backend/app/core/system/mount_probe.py
+"""
+带超时的挂载点容量探测。
+psutil.disk_usage 与 inode 统计本质都是 statvfs：失联的 NFS / CIFS 挂载会让调用无限期阻塞，且无法中断。
+这里每次调用放进一个独立的守护线程，并为每个挂载点维护状态：
+  - 超时的挂载点标记为 unreachable，按指数退避（15s、30s、60s ... 最长 15 分钟）跳过
+  - 同一挂载点最多只有一个调用在途，卡住的线程不会越积越多；在途线程总数另有上限
+    （DISK_USAGE_MAX_INFLIGHT），达到上限时新的探测直接视为 unreachable，不再起线程。
+    其中 DISK_USAGE_RESERVED 个名额只留给此前正常的挂载点，失联的挂载点再多也不会挤掉它们
+  - 不使用固定大小的线程池：卡住的调用不会占满工作线程、让正常的挂载点排队超时；
+    守护线程也不会在进程退出时被等待
+  - 卡住的调用最终返回后，下一次探测立即恢复
+  - 只为 disk_partitions() 中的挂载点保存状态，已卸载的挂载点由 retain() 清理；
+    /system/summary?mount= 传入的其它路径每次单独探测、不保存状态，且使用独立的小额度，
+    卡住的路径不会挤占正常挂载点的名额
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass
+from typing import Dict, Iterable, Literal, NamedTuple, Optional, Tuple
+
+import psutil
+
+# 单次探测等待的秒数（同一轮的所有挂载点并行等待）
+DISK_USAGE_TIMEOUT = 2.0
+# 失联挂载点的退避：首次 15 秒，之后每次翻倍，最长 15 分钟
+UNREACHABLE_BACKOFF = 15.0
+UNREACHABLE_BACKOFF_MAX = 900.0
+# 同时在途（含卡住）的探测线程上限：已知挂载点共用 DISK_USAGE_MAX_INFLIGHT 个，
+# 其中 DISK_USAGE_RESERVED 个只给上次探测成功的挂载点；其它路径（用户输入）另外共用 DISK_USAGE_MAX_ADHOC 个
+DISK_USAGE_MAX_INFLIGHT = 64
+DISK_USAGE_RESERVED = 16
+DISK_USAGE_MAX_ADHOC = 4
+
+MountStatus = Literal["ok", "unreachable", "error"]
+
+
+class MountReading(NamedTuple):
+    usage: psutil._common.sdiskusage
+    inodes: Optional[Tuple[int, int]]  # (总数, 空闲数)；Windows 或文件系统不报告 inode 时为 None
+
+
+class MountUsage(NamedTuple):
+    status: MountStatus
+    usage: Optional[psutil._common.sdiskusage]  # unreachable 时为最后一次成功的结果（可能为空）
+    error: Optional[BaseException] = None       # status == "error" 时的异常（无权限、挂载点不存在等）
+    inodes: Optional[Tuple[int, int]] = None    # 同 MountReading.inodes
+
+
+def _read_mount(mount: str) -> MountReading:
+    usage = psutil.disk_usage(mount)
+    inodes = None
+    if hasattr(os, "statvfs"):
+        try:
+            st = os.statvfs(mount)
+        except OSError:
+            st = None
+        # btrfs / 部分网络文件系统的 f_files 为 0，表示不限制 inode
+        if st is not None and st.f_files:
+            inodes = (st.f_files, st.f_ffree)
+    return MountReading(usage, inodes)
+
+
+def _to_usage(status: MountStatus, reading: Optional[MountReading]) -> MountUsage:
+    if reading is None:
+        return MountUsage(status, None)
+    return MountUsage(status, reading.usage, inodes=reading.inodes)
+
+
+@dataclass
+class _MountState:
+    failures: int = 0
+    retry_at: float = 0.0                       # time.monotonic()，之前直接返回 unreachable
+    pending: Optional[Future] = None            # 在途的 disk_usage 调用
+    submitted_at: float = 0.0                   # pending 的提交时间
+    last: Optional[MountReading] = None
+
+
+class MountProbe:
+    def __init__(self) -> None:
+        self._states: Dict[str, _MountState] = {}
+        self._lock = threading.Lock()
+        self._inflight = 0          # 已知挂载点的在途线程数（含卡住的）
+        self._adhoc_inflight = 0    # usage() 探测其它路径的在途线程数
+
+    def _release(self, adhoc: bool) -> None:
+        with self._lock:
+            if adhoc:
+                self._adhoc_inflight -= 1
+            else:
+                self._inflight -= 1
+
+    def _submit(self, mount: str, adhoc: bool = False) -> Future:
+        """
+        在新的守护线程中读取挂载点；调用卡住时只占用这一个线程与一个在途名额，直到返回。
+        调用方须已持有 self._lock 并计入在途数。
+        """
+        future: Future = Future()
+
+        def run() -> None:
+            try:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(_read_mount(mount))
+                except BaseException as exc:  # noqa: BLE001
+                    future.set_exception(exc)
+            finally:
+                self._release(adhoc)
+
+        threading.Thread(target=run, name="disk-usage", daemon=True).start()
+        return future
+
+    def _mark_unreachable(self, state: _MountState, now: float) -> None:
+        state.failures += 1
+        state.retry_at = now + min(UNREACHABLE_BACKOFF * 2 ** (state.failures - 1), UNREACHABLE_BACKOFF_MAX)
+
+    def probe(self, mounts: Iterable[str]) -> Dict[str, MountUsage]:
+        """
+        并行探测一组挂载点，最多等待 DISK_USAGE_TIMEOUT 秒。
+        """
+        now = time.monotonic()
+        results: Dict[str, MountUsage] = {}
+        waiting: Dict[str, Future] = {}
+
+        with self._lock:
+            for mount in dict.fromkeys(mounts):
+                state = self._states.setdefault(mount, _MountState())
+                if state.pending is not None:
+                    if not state.pending.done() and now - state.submitted_at < DISK_USAGE_TIMEOUT:
+                        # 另一个调用方刚提交的探测：共用同一个结果
+                        waiting[mount] = state.pending
+                        continue
+                    if not state.pending.done():
+                        # 上一次调用仍然卡住：退避到期也不再提交，继续延长退避
+                        if now >= state.retry_at:
+                            self._mark_unreachable(state, now)
+                        results[mount] = _to_usage("unreachable", state.last)
+                        continue
+                    # 卡住的调用已经返回：挂载点恢复，立即重新探测
+                    if state.pending.exception() is None:
+                        state.failures, state.retry_at = 0, 0.0
+                        state.last = state.pending.result()
+                    state.pending = None
+                if now < state.retry_at:
+                    results[mount] = _to_usage("unreachable", state.last)
+                    continue
+                limit = DISK_USAGE_MAX_INFLIGHT - (DISK_USAGE_RESERVED if state.failures else 0)
+                if self._inflight >= limit:
+                    # 在途线程已达上限（大量挂载点同时卡住）：本轮视为不可达，但不计入退避
+                    results[mount] = _to_usage("unreachable", state.last)
+                    continue
+                self._inflight += 1
+                state.pending = waiting[mount] = self._submit(mount)
+                state.submitted_at = now
+
+        if not waiting:
+            return results
+        done, _ = wait(waiting.values(), timeout=DISK_USAGE_TIMEOUT)
+
+        with self._lock:
+            for mount, fut in waiting.items():
+                state = self._states[mount]
+                if fut not in done:
+                    if state.retry_at <= now:  # 共用探测时只计一次失败
+                        self._mark_unreachable(state, now)
+                    results[mount] = _to_usage("unreachable", state.last)
+                    continue
+                if state.pending is fut:
+                    state.pending = None
+                exc = fut.exception()
+                if exc is not None:
+                    results[mount] = MountUsage("error", None, exc)
+                    continue
+                state.failures, state.retry_at = 0, 0.0
+                state.last = fut.result()
+                results[mount] = _to_usage("ok", state.last)
+        return results
+
+    def retain(self, mounts: Iterable[str]) -> None:
+        """
+        只保留 mounts 中挂载点的状态（由 /system/disks 的后台任务按 disk_partitions() 调用）。
+        被丢弃的挂载点上卡住的线程仍占用在途名额，直到调用返回。
+        """
+        keep = set(mounts)
+        with self._lock:
+            for mount in [m for m in self._states if m not in keep]:
+                del self._states[mount]
+
+    def usage(self, mount: str) -> MountUsage:
+        """
+        探测单个路径：已知挂载点走带状态的 probe()；其它路径（用户输入）单独探测一次，不保存状态。
+        """
+        with self._lock:
+            known = mount in self._states
+        if known:
+            return self.probe([mount])[mount]
+
+        with self._lock:
+            if self._adhoc_inflight >= DISK_USAGE_MAX_ADHOC:
+                return MountUsage("unreachable", None)
+            self._adhoc_inflight += 1
+            future = self._submit(mount, adhoc=True)
+        done, _ = wait([future], timeout=DISK_USAGE_TIMEOUT)
+        if not done:
+            return MountUsage("unreachable", None)
+        exc = future.exception()
+        if exc is not None:
+            return MountUsage("error", None, exc)
+        return _to_usage("ok", future.result())
+
+
+# 全局单例：/system/disks 的后台任务与 /system/summary 共用同一份挂载点状态
+mount_probe = MountProbe()
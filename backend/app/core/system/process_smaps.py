@@ -0,0 +1,102 @@
+# backend/app/core/system/process_smaps.py
+"""
+进程 PSS / USS 采样。
+RSS 会把共享库、共享内存重复计入每个进程（gunicorn / php-fpm 等 worker 池尤其明显），
+PSS 按共享进程数均摊共享页，USS 只统计进程独占的页。
+两者来自 /proc/<pid>/smaps_rollup，读取代价远高于 stat，因此：
+  - 独立的低频后台任务，线程 nice 值调低，不拖慢主进程表的采样
+  - 只访问进程表快照中的 CPU / 内存 Top 候选
+  - 结果按 (pid, create_time) 缓存，进程退出后随快照清理
+仅 Linux（/proc 批量读取可用时）提供，其它平台相关字段为空。
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from itertools import chain
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+
+from app.core.collector import collector
+from app.core.system.procfs import ProcfsReader
+from app.core.system.process_table import ProcessKey, ProcessTableSnapshot, process_table
+
+logger = logging.getLogger(__name__)
+
+# 后台采样间隔（秒）
+SMAPS_SAMPLE_INTERVAL = 30.0
+# 同一进程的结果在该时长内不重复读取（秒）
+SMAPS_MAX_AGE = 120.0
+# 采样线程的 nice 增量（Linux 上 nice 值按线程生效）
+SMAPS_NICE = 10
+
+
+class SmapsUsage(NamedTuple):
+    pss: Optional[int]   # 字节；无权限读取时为 None（同样缓存，避免每轮重试）
+    uss: Optional[int]   # 字节
+    sampled_at: float    # time.monotonic()
+
+
+class SmapsSampler:
+    """
+    缓存以只读映射整体替换发布，请求线程查询无需加锁。
+    只由 collector 的 "process_smaps" 任务调用 sample()。
+    """
+
+    def __init__(self) -> None:
+        self._reader = ProcfsReader()
+        self._cache: Mapping[ProcessKey, SmapsUsage] = MappingProxyType({})
+        self._niced_thread: Optional[int] = None
+
+    def lookup(self, pid: int, create_time: float) -> Optional[SmapsUsage]:
+        usage = self._cache.get((pid, create_time))
+        return usage if usage is not None and usage.pss is not None else None
+
+    def _lower_priority(self) -> None:
+        if not hasattr(os, "setpriority"):
+            return
+        tid = threading.get_native_id()
+        if self._niced_thread == tid:
+            return
+        try:
+            current = os.getpriority(os.PRIO_PROCESS, tid)
+            os.setpriority(os.PRIO_PROCESS, tid, min(current + SMAPS_NICE, 19))
+        except OSError as exc:
+            logger.debug("failed to lower smaps sampler priority: %s", exc)
+        self._niced_thread = tid
+
+    def sample(self) -> int:
+        """
+        为最近一次进程表快照中的 Top 候选刷新 PSS / USS，返回本轮实际读取的进程数。
+        快照尚未产生时不触发同步采样，等待下一轮。
+        """
+        latest = collector.latest("processes")
+        if latest is None or process_table.backend != "procfs":
+            return 0
+        self._lower_priority()
+
+        snapshot: ProcessTableSnapshot = latest.value
+        alive = {(row.pid, row.create_time) for row in snapshot.rows}
+        cache = {key: usage for key, usage in self._cache.items() if key in alive}
+
+        now = time.monotonic()
+        read = 0
+        for row in chain(snapshot.top_by_rss, snapshot.top_by_cpu, snapshot.top_by_io):
+            key = (row.pid, row.create_time)
+            prev = cache.get(key)
+            if prev is not None and now - prev.sampled_at < SMAPS_MAX_AGE:
+                continue
+            usage = self._reader.read_smaps_rollup(row.pid)
+            read += 1
+            cache[key] = SmapsUsage(usage[0], usage[1], now) if usage is not None else SmapsUsage(None, None, now)
+
+        self._cache = MappingProxyType(cache)
+        return read
+
+
+# 全局单例：由后台 "process_smaps" 任务刷新
+process_smaps = SmapsSampler()
+
+collector.register("process_smaps", process_smaps.sample, interval=SMAPS_SAMPLE_INTERVAL)
@@ -0,0 +1,327 @@
+# backend/app/core/system/process_table.py
+from __future__ import annotations
+
+import heapq
+import re
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import psutil
+
+from app.core.system.procfs import ProcfsReader, ProcStat, full_name
+
+ProcessKey = Tuple[int, float]  # (pid, create_time)，pid 被复用时 create_time 不同
+
+# 两次刷新的最小间隔（秒）：间隔过短时直接返回上一次快照，
+# 保证 CPU% 的统计窗口不会被频繁的同步调用压缩到毫秒级
+CPU_MIN_WINDOW = 1.0
+
+# 判断进程是否在上一轮之后才启动时允许的误差（秒），覆盖 create_time 按时钟滴答取整的偏差
+START_TIME_SLACK = 0.5
+
+# Linux 上是否使用 /proc 批量读取（不可用时自动回退到 psutil）
+PROCFS_READER_ENABLED = True
+
+# cgroup 路径中的 64 位容器 ID：docker-<id>.scope / /docker/<id> / cri-containerd-<id> / libpod-<id>
+_CONTAINER_ID_PATTERN = re.compile(r"([0-9a-f]{64})")
+
+
+def _read_cgroup(pid: int) -> Optional[str]:
+    """
+    读取 /proc/<pid>/cgroup，返回进程所在的 cgroup 路径：
+      - cgroup v2：唯一的 "0::<path>" 行
+      - cgroup v1：优先 name=systemd，其次第一个非空路径
+    非 Linux 或无权限时返回 None。
+    """
+    try:
+        with open(f"{psutil.PROCFS_PATH}/{pid}/cgroup", "r", encoding="utf-8") as fh:
+            lines = fh.read().splitlines()
+    except OSError:
+        return None
+    fallback = None
+    for line in lines:
+        hierarchy, _, rest = line.partition(":")
+        controllers, _, path = rest.partition(":")
+        if hierarchy == "0" and controllers == "":
+            return path
+        if controllers == "name=systemd":
+            return path
+        if fallback is None and path and path != "/":
+            fallback = path
+    return fallback
+
+
+def container_id_from_cgroup(cgroup: Optional[str]) -> Optional[str]:
+    if not cgroup:
+        return None
+    match = _CONTAINER_ID_PATTERN.search(cgroup)
+    return match.group(1) if match else None
+
+
+class ProcessRow(NamedTuple):
+    """
+    进程表中一个进程在某次采样时的只读视图（元组，创建成本远低于 Pydantic 模型）。
+    """
+    pid: int
+    create_time: float
+    name: str
+    username: Optional[str]
+    cmdline: Optional[str]
+    cpu_pct: float
+    rss: int
+    memory_pct: float
+    num_threads: int
+    cgroup: Optional[str]
+    container_id: Optional[str]   # 完整 64 位容器 ID，不在容器中为 None
+    read_bps: Optional[float]     # 块设备读取速率（字节/秒），无权限读取 io 计数时为 None
+    write_bps: Optional[float]    # 块设备写入速率（字节/秒）
+    sockets: Optional[int] = None  # 打开的 socket 数，只为 top_by_io 候选统计
+
+
+@dataclass(frozen=True)
+class ProcessTableSnapshot:
+    """
+    一轮采样的结果：全部进程行 + 预先用堆选出的 CPU / 内存 Top 候选（降序）。
+    cpu_window 为本轮 CPU% 的统计窗口（秒），首轮为 None。
+    """
+    collected_at: datetime
+    cpu_window: Optional[float]
+    rows: Tuple[ProcessRow, ...]
+    top_by_cpu: Tuple[ProcessRow, ...]
+    top_by_rss: Tuple[ProcessRow, ...]
+    top_by_io: Tuple[ProcessRow, ...]
+
+
+def _io_counters(proc: psutil.Process) -> Optional[Tuple[int, int]]:
+    try:
+        io = proc.io_counters()
+    except (psutil.AccessDenied, AttributeError, NotImplementedError):
+        # 无权限，或平台不支持（macOS）
+        return None
+    return io.read_bytes, io.write_bytes
+
+
+def _psutil_sockets(proc: psutil.Process) -> Optional[int]:
+    """
+    psutil 路径下的 socket 数（inet + unix），无权限或平台不支持时返回 None。
+    """
+    try:
+        return len(proc.net_connections(kind="all"))
+    except (psutil.Error, AttributeError, NotImplementedError):
+        return None
+
+
+class _Entry:
+    """
+    进程表中常驻的一项：进程生命周期内只读一次的字段，以及上一轮的 CPU 时间。
+    psutil 路径下同时保存 psutil.Process 对象。
+    """
+    __slots__ = ("proc", "name", "username", "cmdline", "cgroup", "container_id", "cpu_total", "io")
+
+    def __init__(
+        self,
+        pid: int,
+        name: str,
+        username: Optional[str],
+        cmdline: Optional[str],
+        proc: Optional[psutil.Process] = None,
+    ) -> None:
+        self.proc = proc
+        self.name = name
+        self.username = username
+        self.cmdline = cmdline
+        self.cgroup = _read_cgroup(pid)
+        self.container_id = container_id_from_cgroup(self.cgroup)
+        self.cpu_total: Optional[float] = None  # 上一轮的 user + system CPU 秒
+        self.io: Optional[Tuple[int, int]] = None  # 上一轮的 (read_bytes, write_bytes)
+
+    @classmethod
+    def from_process(cls, proc: psutil.Process) -> "_Entry":
+        # 以下字段代价较高（读取 cmdline、uid -> 用户名、cgroup），每个进程只读一次
+        pid = proc.pid
+        try:
+            name = proc.name() or f"pid-{pid}"
+        except (psutil.AccessDenied, psutil.ZombieProcess):
+            name = f"pid-{pid}"
+        try:
+            username: Optional[str] = proc.username()
+        except (psutil.AccessDenied, psutil.ZombieProcess, KeyError):
+            username = None
+        try:
+            args = proc.cmdline()
+            cmdline: Optional[str] = " ".join(args) if args else None
+        except (psutil.AccessDenied, psutil.ZombieProcess):
+            cmdline = None
+        return cls(pid, name, username, cmdline, proc=proc)
+
+    @classmethod
+    def from_procfs(cls, reader: ProcfsReader, stat: ProcStat) -> "_Entry":
+        args = reader.read_cmdline(stat.pid)
+        return cls(
+            stat.pid,
+            full_name(stat.name, args) or f"pid-{stat.pid}",
+            reader.read_username(stat.pid),
+            " ".join(args) if args else None,
+        )
+
+
+class _Counters(NamedTuple):
+    """
+    每轮刷新的廉价计数。
+    """
+    cpu_total: float
+    rss: int
+    num_threads: int
+    io: Optional[Tuple[int, int]]  # (read_bytes, write_bytes)，无权限时为 None
+
+
+def _rate(total: float, prev: Optional[float], window: Optional[float], alive: Optional[float]) -> float:
+    """
+    计数器速率：上一轮已存在时取增量 / 窗口；上一轮之后才启动的进程启动前计数为 0，
+    窗口取其存活时长；首轮没有窗口、或无法确定起点（alive 为 None）时为 0。
+    """
+    if prev is not None and window:
+        return max((total - prev) / window, 0.0)
+    if alive is not None and alive > 0:
+        return max(total / alive, 0.0)
+    return 0.0
+
+
+class ProcessTable:
+    """
+    常驻进程表，按 (pid, create_time) 索引：
+      - 新进程第一次出现时读取 name / username / cmdline
+      - 之后每轮只刷新廉价的计数（CPU 时间、RSS、线程数、读写字节）
+      - CPU% = 两轮之间 CPU 时间的增量 / 墙钟时间（100% = 一个核心），
+        与调用方轮询频率、Process 对象是否被重建无关；读写速率同理
+      - socket 数只为 top_by_io 候选统计（procfs 逐个 readlink fd，psutil 路径用 net_connections）
+      - 本轮没有出现的进程从表中移除
+    Linux 上默认用 ProcfsReader 批量读取 /proc/<pid>/stat、statm 与 io，其它平台使用 psutil。
+    refresh(top) 返回不可变快照（含 Top 候选），供请求线程无锁读取。
+    只由 collector 的 "processes" 任务调用，不做并发保护。
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[ProcessKey, _Entry] = {}
+        self._last: Optional[ProcessTableSnapshot] = None
+        self._last_at: Optional[float] = None  # 上一轮的 time.monotonic()
+        self._reader = ProcfsReader()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def backend(self) -> str:
+        return "procfs" if PROCFS_READER_ENABLED and self._reader.available() else "psutil"
+
+    def _scan_psutil(self) -> Iterator[Tuple[ProcessKey, _Entry, _Counters]]:
+        # process_iter 会复用上一轮的 Process 对象，并识别 pid 复用
+        for proc in psutil.process_iter():
+            try:
+                key = (proc.pid, proc.create_time())
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = _Entry.from_process(proc)
+                proc = entry.proc
+                with proc.oneshot():
+                    rss = proc.memory_info().rss
+                    num_threads = proc.num_threads()
+                    times = proc.cpu_times()
+                    io = _io_counters(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                # 某些进程在采集过程中退出或者无权限，直接跳过即可
+                continue
+            yield key, entry, _Counters(times.user + times.system, rss, num_threads, io)
+
+    def _scan_procfs(self) -> Iterator[Tuple[ProcessKey, _Entry, _Counters]]:
+        reader = self._reader
+        for stat in reader.iter_stats():
+            key = (stat.pid, stat.create_time)
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry.from_procfs(reader, stat)
+            io = (stat.io_read, stat.io_write) if stat.io_read is not None and stat.io_write is not None else None
+            yield key, entry, _Counters(stat.cpu_total, stat.rss, stat.num_threads, io)
+
+    def refresh(self, top: int) -> ProcessTableSnapshot:
+        now = time.monotonic()
+        if self._last is not None and now - self._last_at < CPU_MIN_WINDOW:
+            return self._last
+
+        wall_now = time.time()
+        window = now - self._last_at if self._last_at is not None else None
+        total_mem = psutil.virtual_memory().total or 1
+        entries: Dict[ProcessKey, _Entry] = {}
+        rows = []
+
+        scan = self._scan_procfs if self.backend == "procfs" else self._scan_psutil
+        for key, entry, counters in scan():
+            # 上一轮之后才启动的进程：窗口取其存活时长。更早启动却不在表中的进程（上一轮读取失败、
+            # 本轮重新出现）没有可用的起点，本轮 CPU% / 读写速率记为 0，而不是把整个生命周期摊到窗口上
+            alive = None
+            if window is not None and entry.cpu_total is None:
+                age = wall_now - key[1]
+                if age <= window + START_TIME_SLACK:
+                    alive = min(age, window)
+            cpu_pct = _rate(counters.cpu_total, entry.cpu_total, window, alive) * 100.0
+            entry.cpu_total = counters.cpu_total
+
+            read_bps = write_bps = None
+            if counters.io is not None:
+                prev_io = entry.io
+                read_bps = _rate(counters.io[0], prev_io[0] if prev_io else None, window, alive)
+                write_bps = _rate(counters.io[1], prev_io[1] if prev_io else None, window, alive)
+            entry.io = counters.io
+
+            entries[key] = entry
+            rows.append(ProcessRow(
+                pid=key[0],
+                create_time=key[1],
+                name=entry.name,
+                username=entry.username,
+                cmdline=entry.cmdline,
+                cpu_pct=cpu_pct,
+                rss=counters.rss,
+                memory_pct=counters.rss / total_mem * 100.0,
+                num_threads=counters.num_threads,
+                cgroup=entry.cgroup,
+                container_id=entry.container_id,
+                read_bps=read_bps,
+                write_bps=write_bps,
+            ))
+
+        self._entries = entries
+        self._last_at = now
+        self._last = ProcessTableSnapshot(
+            collected_at=datetime.utcnow(),
+            cpu_window=round(window, 3) if window is not None else None,
+            rows=tuple(rows),
+            # O(n log top)，不对全部进程排序
+            top_by_cpu=tuple(heapq.nlargest(top, rows, key=attrgetter("cpu_pct"))),
+            top_by_rss=tuple(heapq.nlargest(top, rows, key=attrgetter("rss"))),
+            top_by_io=self._top_by_io(rows, top),
+        )
+        return self._last
+
+    def _top_by_io(self, rows: List[ProcessRow], top: int) -> Tuple[ProcessRow, ...]:
+        candidates = heapq.nlargest(
+            top,
+            (row for row in rows if row.read_bps is not None),
+            key=lambda row: row.read_bps + row.write_bps,
+        )
+        return tuple(row._replace(sockets=self._count_sockets(row)) for row in candidates)
+
+    def _count_sockets(self, row: ProcessRow) -> Optional[int]:
+        if self.backend == "procfs":
+            return self._reader.count_sockets(row.pid)
+        entry = self._entries.get((row.pid, row.create_time))
+        if entry is None or entry.proc is None:
+            return None
+        return _psutil_sockets(entry.proc)
+
+
+# 全局单例：由后台 "processes" 任务刷新
+process_table = ProcessTable()
@@ -1,71 +1,387 @@
 # app/core/processes_info.py
-from datetime import datetime
-from typing import List
+import base64
+import heapq
+import json
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Literal, NamedTuple, Optional, Sequence, Tuple
 
-import psutil
+from app.core.collector import collector
+from app.core.docker import get_container_names
+from app.core.docker.config import load_service_configs
+from app.core.system.process_smaps import process_smaps
+from app.core.system.process_table import ProcessRow, ProcessTableSnapshot, process_table
+from app.models.system import ProcessesOverview, ProcessGroup, ProcessInfo, ProcessSearchResult
 
-from app.models.system import ProcessesOverview, ProcessInfo
+# 后台遍历进程的间隔（秒）
+PROCESSES_SAMPLE_INTERVAL = 5.0
+# 后台刷新容器名 / 服务配置映射的间隔（秒），group_by=container 时使用
+CONTAINER_MAPPING_SAMPLE_INTERVAL = 10.0
+# 快照中保留的 Top N 候选数，与 /system/processes 的 limit 上限一致
+MAX_TOP_LIMIT = 50
 
+_BYTES_PER_MB = 1024 * 1024
 
-def get_processes_overview(limit: int = 10) -> ProcessesOverview:
+ProcessGroupBy = Literal["name", "user", "cgroup", "container"]
+# group_by=container 时不在任何容器中的进程归入该组
+HOST_GROUP = "host"
+
+# 每种分组方式最近一次的聚合结果，快照不变时直接复用
+# group_by -> (snapshot, key -> [cpu_pct, rss, memory_pct, process_count, thread_count])
+_group_cache: Dict[str, Tuple[ProcessTableSnapshot, Dict[str, List[float]]]] = {}
+
+# 最近一次构建的响应，快照不变时直接复用（PSS / USS 随快照刷新，最多滞后一个采样周期）
+# (limit, group_by) -> (snapshot, overview)
+_overview_cache: Dict[Tuple[int, Optional[str]], Tuple[ProcessTableSnapshot, ProcessesOverview]] = {}
+
+
+ProcessSortKey = Literal["cpu", "memory", "io", "read", "write", "threads", "pid", "name", "user"]
+
+# 排序键 -> 取值函数；io 计数不可读时按 -1 排在最后
+_SORT_VALUES: Dict[str, Callable[[ProcessRow], Any]] = {
+    "cpu": lambda row: row.cpu_pct,
+    "memory": lambda row: row.rss,
+    "io": lambda row: row.read_bps + row.write_bps if row.read_bps is not None else -1.0,
+    "read": lambda row: row.read_bps if row.read_bps is not None else -1.0,
+    "write": lambda row: row.write_bps if row.write_bps is not None else -1.0,
+    "threads": lambda row: row.num_threads,
+    "pid": lambda row: row.pid,
+    "name": lambda row: row.name.lower(),
+    "user": lambda row: (row.username or "").lower(),
+}
+
+# 搜索正则的最大长度
+MAX_PATTERN_LENGTH = 200
+
+# 最近几次搜索的过滤结果，翻页时同一快照 + 同一过滤条件不再重新匹配
+_SEARCH_CACHE_SIZE = 8
+_search_cache: "OrderedDict[Tuple, Tuple[ProcessTableSnapshot, List[ProcessRow]]]" = OrderedDict()
+# 搜索在线程池中执行，多个请求会同时读写 _search_cache
+_search_cache_lock = threading.Lock()
+
+
+def collect_processes_snapshot() -> ProcessTableSnapshot:
     """
-    获取当前主机的进程概览（Top 进程）。
-    - limit：返回前多少个占用最高的进程（CPU & 内存各 limit 个）
-    注意：CPU 百分比需要多次采样才能绝对准确，这里采用 psutil 的
-          非阻塞模式，随着你的接口被周期性调用，数值会逐渐稳定。
+    刷新常驻进程表并返回快照。
+    新进程只在第一次出现时读取 cmdline / username，其余进程只刷新 CPU / 内存 / 线程数。
     """
-    processes: List[ProcessInfo] = []
+    return process_table.refresh(top=MAX_TOP_LIMIT)
+
+
+class ContainerMapping(NamedTuple):
+    names: Dict[str, str]      # 容器短 ID（12 位）-> 容器名
+    services: Dict[str, str]   # 容器名 -> 配置中的服务 slug
+
+
+def collect_container_mapping() -> ContainerMapping:
+    """
+    由 collector 在后台调用：docker ps 与读取服务配置都不在请求路径内执行。
+    """
+    names = get_container_names()
+    services = {cfg.container: cfg.slug for cfg in load_service_configs() if cfg.container}
+    return ContainerMapping(names=names, services=services)
+
+
+def _to_model(row: ProcessRow) -> ProcessInfo:
+    smaps = process_smaps.lookup(row.pid, row.create_time)
+    return ProcessInfo(
+        pid=row.pid,
+        name=row.name,
+        username=row.username,
+        cpu_pct=row.cpu_pct,
+        memory_mb=row.rss / _BYTES_PER_MB,
+        memory_pct=row.memory_pct,
+        pss_mb=smaps.pss / _BYTES_PER_MB if smaps is not None else None,
+        uss_mb=smaps.uss / _BYTES_PER_MB if smaps is not None else None,
+        cmdline=row.cmdline,
+        threads=row.num_threads,
+        io_read_bps=round(row.read_bps, 1) if row.read_bps is not None else None,
+        io_write_bps=round(row.write_bps, 1) if row.write_bps is not None else None,
+        sockets=row.sockets,
+    )
 
-    # 预取一部分字段，避免频繁系统调用
-    for proc in psutil.process_iter(
-        ["pid", "name", "username", "memory_info", "memory_percent", "cmdline"]
-    ):
-        try:
-            with proc.oneshot():
-                pid = proc.info["pid"]
-                name = proc.info.get("name") or f"pid-{pid}"
-                username = proc.info.get("username")
-
-                mem_info = proc.info.get("memory_info")
-                mem_bytes = getattr(mem_info, "rss", 0) if mem_info else 0
-                mem_mb = mem_bytes / (1024 * 1024)
-                mem_pct = float(proc.info.get("memory_percent") or 0.0)
-
-                # 这里使用 0.0 非阻塞采样，
-                # 如果你每隔几秒轮询一次，这个值会相对合理
-                cpu_pct = float(proc.cpu_percent(interval=0.0))
-
-                cmdline_list = proc.info.get("cmdline") or []
-                cmdline = " ".join(cmdline_list) if cmdline_list else None
-
-                processes.append(
-                    ProcessInfo(
-                        pid=pid,
-                        name=name,
-                        username=username,
-                        cpu_pct=cpu_pct,
-                        memory_mb=mem_mb,
-                        memory_pct=mem_pct,
-                        cmdline=cmdline,
-                    )
-                )
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            # 某些进程在采集过程中退出或者无权限，直接跳过即可
-            continue
 
-    # 排序 & 取 Top N
-    processes_by_cpu = sorted(
-        processes, key=lambda p: p.cpu_pct, reverse=True
-    )[:limit]
+def _to_models(rows: Sequence[ProcessRow]) -> List[ProcessInfo]:
+    # 只为返回的行构建 Pydantic 模型
+    return [_to_model(row) for row in rows]
+
+
+def _group_key_func(group_by: ProcessGroupBy) -> Callable[[ProcessRow], str]:
+    if group_by == "name":
+        return lambda row: row.name
+    if group_by == "user":
+        return lambda row: row.username or "unknown"
+    if group_by == "cgroup":
+        return lambda row: row.cgroup or "unknown"
+
+    # 容器：cgroup 中的容器 ID 前 12 位与 docker ps 的短 ID 对应；docker 不认识的
+    # 容器（podman / k8s 等）以短 ID 作为分组键
+    names = collector.get("process_containers").names
+
+    def container_key(row: ProcessRow) -> str:
+        if row.container_id is None:
+            return HOST_GROUP
+        short_id = row.container_id[:12]
+        return names.get(short_id, short_id)
+
+    return container_key
+
+
+def _aggregate(snapshot: ProcessTableSnapshot, group_by: ProcessGroupBy) -> Dict[str, List[float]]:
+    """
+    一次遍历快照中的全部进程，按分组键累加 CPU / RSS / 内存占比 / 进程数 / 线程数。
+    """
+    cached = _group_cache.get(group_by)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+
+    key_of = _group_key_func(group_by)
+    groups: Dict[str, List[float]] = {}
+    for row in snapshot.rows:
+        key = key_of(row)
+        acc = groups.get(key)
+        if acc is None:
+            acc = groups[key] = [0.0, 0, 0.0, 0, 0]
+        acc[0] += row.cpu_pct
+        acc[1] += row.rss
+        acc[2] += row.memory_pct
+        acc[3] += 1
+        acc[4] += row.num_threads
+
+    _group_cache[group_by] = (snapshot, groups)
+    return groups
+
+
+def _group_models(
+    items: Sequence[Tuple[str, List[float]]],
+    services: Dict[str, str],
+) -> List[ProcessGroup]:
+    return [
+        ProcessGroup(
+            key=key,
+            cpu_pct=round(acc[0], 2),
+            memory_mb=acc[1] / _BYTES_PER_MB,
+            memory_pct=acc[2],
+            process_count=acc[3],
+            thread_count=acc[4],
+            service=services.get(key),
+        )
+        for key, acc in items
+    ]
+
+
+def get_processes_overview(limit: int = 10, group_by: Optional[ProcessGroupBy] = None) -> ProcessesOverview:
+    """
+    基于后台 collector 最近一次的进程表快照返回 CPU / 内存 Top N。
+    Top 候选在采样时已用堆选出，这里只截取并构建 limit 个模型。
+    group_by 不为空时，额外返回按 CPU / 内存排序的前 limit 个分组。
+    同一快照、同样参数的请求直接返回缓存的模型。
+    """
+    snapshot: ProcessTableSnapshot = collector.get("processes")
+    cache_key = (limit, group_by)
+    cached = _overview_cache.get(cache_key)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+
+    overview = _build_overview(snapshot, limit, group_by)
+    _overview_cache[cache_key] = (snapshot, overview)
+    return overview
 
-    processes_by_mem = sorted(
-        processes, key=lambda p: p.memory_mb, reverse=True
-    )[:limit]
 
+def _build_overview(
+    snapshot: ProcessTableSnapshot,
+    limit: int,
+    group_by: Optional[ProcessGroupBy],
+) -> ProcessesOverview:
     overview = ProcessesOverview(
-        total=len(processes),
-        collected_at=datetime.utcnow(),
-        top_by_cpu=processes_by_cpu,
-        top_by_memory=processes_by_mem,
+        total=len(snapshot.rows),
+        collected_at=snapshot.collected_at,
+        cpu_window_seconds=snapshot.cpu_window,
+        top_by_cpu=_to_models(snapshot.top_by_cpu[:limit]),
+        top_by_memory=_to_models(snapshot.top_by_rss[:limit]),
+        top_by_io=_to_models(snapshot.top_by_io[:limit]),
+    )
+    if group_by is None:
+        return overview
+
+    groups = _aggregate(snapshot, group_by)
+    services: Dict[str, str] = {}
+    if group_by == "container":
+        # 容器名 -> 配置中的服务 slug，与 /docker 返回的服务对应
+        services = collector.get("process_containers").services
+
+    overview.group_by = group_by
+    overview.groups_by_cpu = _group_models(
+        heapq.nlargest(limit, groups.items(), key=lambda item: item[1][0]), services,
+    )
+    overview.groups_by_memory = _group_models(
+        heapq.nlargest(limit, groups.items(), key=lambda item: item[1][1]), services,
     )
     return overview
+
+
+def _has_nested_quantifier(pattern: str) -> bool:
+    """
+    启发式检测 (a+)+、(\\w*x)*、(a{2,})+ 这类重复的分组内又有重复的写法：
+    回溯正则对它们可能出现指数级耗时，一个请求就能卡住工作线程。
+    只覆盖最常见的形式，(a|a)*、(a|aa)+ 这类分支重叠的写法检测不到；匹配在线程池中执行，
+    最坏情况下占住的是一个工作线程而不是事件循环。
+    """
+    stack: List[bool] = []        # 每层未闭合的分组内是否出现过量词
+    closed_repeat = False         # 刚闭合的分组内有量词
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            i += 2
+            closed_repeat = False
+            continue
+        if ch == "[":
+            # 跳过字符类，其中的 + * 只是普通字符
+            j = i + 1
+            if j < len(pattern) and pattern[j] == "^":
+                j += 1
+            if j < len(pattern) and pattern[j] == "]":
+                j += 1
+            while j < len(pattern) and pattern[j] != "]":
+                j += 2 if pattern[j] == "\\" else 1
+            i = j + 1
+            closed_repeat = False
+            continue
+        if ch == "(":
+            stack.append(False)
+        elif ch == ")":
+            closed_repeat = stack.pop() if stack else False
+            if closed_repeat and stack:
+                stack[-1] = True
+            i += 1
+            continue
+        elif ch in "*+{":
+            if closed_repeat:
+                return True
+            if stack:
+                stack[-1] = True
+        closed_repeat = False
+        i += 1
+    return False
+
+
+def _compile(pattern: Optional[str]) -> Optional["re.Pattern[str]"]:
+    if not pattern:
+        return None
+    if len(pattern) > MAX_PATTERN_LENGTH:
+        raise ValueError(f"regex longer than {MAX_PATTERN_LENGTH} characters")
+    if _has_nested_quantifier(pattern):
+        raise ValueError(f"regex {pattern!r} has a nested quantifier such as (a+)+, which can backtrack exponentially")
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as exc:
+        raise ValueError(f"invalid regex {pattern!r}: {exc}") from exc
+
+
+def _filter_rows(
+    snapshot: ProcessTableSnapshot,
+    q: Optional[str],
+    name: Optional[str],
+    cmdline: Optional[str],
+    user: Optional[str],
+) -> List[ProcessRow]:
+    cache_key = (q, name, cmdline, user)
+    with _search_cache_lock:
+        cached = _search_cache.get(cache_key)
+        if cached is not None and cached[0] is snapshot:
+            _search_cache.move_to_end(cache_key)
+            return cached[1]
+
+    q_re, name_re, cmdline_re, user_re = (_compile(p) for p in (q, name, cmdline, user))
+    rows: List[ProcessRow] = []
+    for row in snapshot.rows:
+        if name_re is not None and not name_re.search(row.name):
+            continue
+        if cmdline_re is not None and not cmdline_re.search(row.cmdline or ""):
+            continue
+        if user_re is not None and not user_re.search(row.username or ""):
+            continue
+        if q_re is not None and not (
+            q_re.search(row.name) or q_re.search(row.cmdline or "") or q_re.search(row.username or "")
+        ):
+            continue
+        rows.append(row)
+
+    with _search_cache_lock:
+        _search_cache[cache_key] = (snapshot, rows)
+        _search_cache.move_to_end(cache_key)
+        while len(_search_cache) > _SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+    return rows
+
+
+def _encode_cursor(key: Tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(key).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, pid, create_time = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("invalid cursor") from exc
+    return value, pid, create_time
+
+
+def search_processes(
+    q: Optional[str] = None,
+    name: Optional[str] = None,
+    cmdline: Optional[str] = None,
+    user: Optional[str] = None,
+    sort: ProcessSortKey = "cpu",
+    order: Literal["asc", "desc"] = "desc",
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> ProcessSearchResult:
+    """
+    在最近一次的进程表快照上搜索（不重新遍历 /proc）：
+      - q 同时匹配进程名 / 命令行 / 用户；name / cmdline / user 分别匹配对应字段（正则，不区分大小写）
+      - 按 sort 排序，(排序值, pid, create_time) 作为游标：按 pid / name / user 排序时排序值不变，
+        翻页期间快照刷新也不会重复或跳过同一进程；按 cpu / memory / io 等实时指标排序时，
+        快照刷新后进程的排序值会变化，可能越过游标被重复返回或漏掉
+      - 每页用堆取 limit 行，不对全部结果排序
+    正则或游标无效时抛出 ValueError。
+    """
+    snapshot: ProcessTableSnapshot = collector.get("processes")
+    rows = _filter_rows(snapshot, q, name, cmdline, user)
+
+    value_of = _SORT_VALUES[sort]
+
+    def sort_key(row: ProcessRow) -> Tuple:
+        return value_of(row), row.pid, row.create_time
+
+    candidates = rows
+    if cursor:
+        after = _decode_cursor(cursor)
+        try:
+            if order == "desc":
+                candidates = [row for row in rows if sort_key(row) < after]
+            else:
+                candidates = [row for row in rows if sort_key(row) > after]
+        except TypeError as exc:
+            # 游标来自另一种排序方式（例如数字与字符串比较）
+            raise ValueError("cursor does not match sort") from exc
+
+    pick = heapq.nlargest if order == "desc" else heapq.nsmallest
+    page = pick(limit + 1, candidates, key=sort_key)
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    return ProcessSearchResult(
+        total=len(snapshot.rows),
+        matched=len(rows),
+        collected_at=snapshot.collected_at,
+        items=_to_models(page),
+        next_cursor=_encode_cursor(list(sort_key(page[-1]))) if has_more else None,
+    )
+
+
+collector.register("processes", collect_processes_snapshot, interval=PROCESSES_SAMPLE_INTERVAL)
+collector.register("process_containers", collect_container_mapping, interval=CONTAINER_MAPPING_SAMPLE_INTERVAL)
@@ -0,0 +1,245 @@
+# backend/app/core/system/procfs.py
+"""
+Linux /proc 批量读取：进程表每轮只需要 stat / statm / io 三个文件，
+这里在一个循环里用同一块缓冲区读取，避免 psutil 每个属性一次 open + 解析的开销。
+非 Linux 平台（或 /proc 不可用）时 available() 为 False，由调用方回退到 psutil。
+"""
+from __future__ import annotations
+
+import os
+import sys
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import psutil
+
+try:  # 仅 Unix 提供
+    import pwd
+except ImportError:  # pragma: no cover
+    pwd = None
+
+# 单个 stat / statm 文件远小于该值；cmdline 可能更长，单独按需读取
+_BUF_SIZE = 4096
+
+# smaps_rollup 中计入 USS 的字段
+_SMAPS_PRIVATE_FIELDS = (b"\nPrivate_Clean:", b"\nPrivate_Dirty:", b"\nPrivate_Hugetlb:")
+
+# /proc/<pid>/stat 中 ")" 之后的字段下标（man 5 proc 的字段号 - 3）
+_STAT_STATE = 0
+_STAT_UTIME = 11
+_STAT_STIME = 12
+_STAT_NUM_THREADS = 17
+_STAT_STARTTIME = 19
+
+# comm 最长 15 个字符，超过时从 cmdline 中取完整名称（与 psutil 一致）
+_COMM_MAX_LEN = 15
+
+
+class ProcStat(NamedTuple):
+    pid: int
+    name: str           # stat 中的 comm，可能被截断为 15 个字符
+    create_time: float  # unix 秒，与 psutil.Process.create_time() 计算方式一致
+    cpu_total: float    # user + system CPU 秒
+    rss: int            # 字节
+    num_threads: int
+    io_read: Optional[int]   # /proc/<pid>/io 的 read_bytes，无权限时为 None
+    io_write: Optional[int]  # /proc/<pid>/io 的 write_bytes
+
+
+class ProcfsReader:
+    """
+    /proc 批量读取器，root 默认取 psutil.PROCFS_PATH（基准测试可指向合成的目录树）。
+    """
+
+    def __init__(self, root: Optional[str] = None) -> None:
+        self.root = root
+        self._buf = bytearray(_BUF_SIZE)
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self._clk_tck = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._boot_time: Optional[float] = None
+        self._boot_root: Optional[str] = None
+
+    @property
+    def proc_root(self) -> str:
+        return self.root or psutil.PROCFS_PATH
+
+    def available(self) -> bool:
+        return sys.platform.startswith("linux") and os.path.exists(os.path.join(self.proc_root, "stat"))
+
+    def _read(self, path: str) -> int:
+        """
+        读取文件到复用的缓冲区，返回字节数。
+        """
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.readv(fd, [self._buf])
+        finally:
+            os.close(fd)
+
+    def boot_time(self) -> float:
+        root = self.proc_root
+        if self._boot_time is None or self._boot_root != root:
+            with open(os.path.join(root, "stat"), "rb") as fh:
+                for line in fh:
+                    if line.startswith(b"btime"):
+                        self._boot_time = float(line.split()[1])
+                        break
+                else:
+                    self._boot_time = psutil.boot_time()
+            self._boot_root = root
+        return self._boot_time
+
+    def iter_stats(self) -> Iterator[ProcStat]:
+        """
+        遍历所有进程，每个进程读取 stat + statm + io（io 只对同用户或 root 可读）。
+        读取期间退出的进程直接跳过；僵尸进程同样跳过（与 psutil 路径一致）。
+        """
+        root = self.proc_root
+        buf = self._buf
+        boot_time = self.boot_time()
+        clk_tck = float(self._clk_tck)
+        page_size = self._page_size
+
+        for entry in os.listdir(root):
+            if not entry.isdigit():
+                continue
+            base = f"{root}/{entry}/"
+            try:
+                n = self._read(base + "stat")
+                lpar = buf.find(b"(", 0, n)
+                rpar = buf.rfind(b")", 0, n)
+                if lpar < 0 or rpar < 0:
+                    continue
+                name = buf[lpar + 1:rpar].decode("utf-8", "replace")
+                fields = buf[rpar + 2:n].split()
+                if fields[_STAT_STATE] == b"Z":
+                    continue
+                cpu_total = (int(fields[_STAT_UTIME]) + int(fields[_STAT_STIME])) / clk_tck
+                num_threads = int(fields[_STAT_NUM_THREADS])
+                create_time = boot_time + int(fields[_STAT_STARTTIME]) / clk_tck
+
+                n = self._read(base + "statm")
+                rss = int(buf[:n].split()[1]) * page_size
+            except (OSError, IndexError, ValueError):
+                continue
+
+            io_read = io_write = None
+            try:
+                n = self._read(base + "io")
+                io_read = _field(buf, n, b"\nread_bytes:")
+                io_write = _field(buf, n, b"\nwrite_bytes:")
+            except OSError:
+                pass
+
+            yield ProcStat(
+                pid=int(entry),
+                name=name,
+                create_time=create_time,
+                cpu_total=cpu_total,
+                rss=rss,
+                num_threads=num_threads,
+                io_read=io_read,
+                io_write=io_write,
+            )
+
+    def count_sockets(self, pid: int) -> Optional[int]:
+        """
+        统计进程打开的 socket 数（/proc/<pid>/fd 中指向 socket:[inode] 的描述符），无权限时返回 None。
+        需要逐个 readlink，只用于少量候选进程。
+        """
+        fd_dir = f"{self.proc_root}/{pid}/fd"
+        try:
+            fds = os.listdir(fd_dir)
+        except OSError:
+            return None
+        count = 0
+        for fd in fds:
+            try:
+                if os.readlink(f"{fd_dir}/{fd}").startswith("socket:"):
+                    count += 1
+            except OSError:
+                continue
+        return count
+
+    def read_smaps_rollup(self, pid: int) -> Optional[Tuple[int, int]]:
+        """
+        读取 /proc/<pid>/smaps_rollup，返回 (PSS, USS) 字节数；USS = Private_Clean + Private_Dirty + Private_Hugetlb。
+        内核生成该文件需要遍历进程全部映射，代价远高于 stat，只用于少量候选进程。
+        无权限（需要 ptrace 读权限）、进程已退出或内核 < 4.14 时返回 None。
+        """
+        try:
+            n = self._read(f"{self.proc_root}/{pid}/smaps_rollup")
+        except OSError:
+            return None
+        buf = self._buf
+        try:
+            pss = _kb_field(buf, n, b"\nPss:")
+            if pss is None:
+                return None
+            uss = sum(_kb_field(buf, n, label) or 0 for label in _SMAPS_PRIVATE_FIELDS)
+        except ValueError:
+            return None
+        return pss, uss
+
+    def read_cmdline(self, pid: int) -> Optional[List[str]]:
+        try:
+            with open(f"{self.proc_root}/{pid}/cmdline", "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return None
+        if not data:
+            return []
+        sep = b"\0" if b"\0" in data else b" "
+        return [arg.decode("utf-8", "replace") for arg in data.rstrip(sep).split(sep)]
+
+    def read_username(self, pid: int) -> Optional[str]:
+        """
+        取 status 中的真实 uid（与 psutil.Process.username() 一致），解析不到用户名时返回 uid 字符串。
+        """
+        try:
+            with open(f"{self.proc_root}/{pid}/status", "rb") as fh:
+                for line in fh:
+                    if line.startswith(b"Uid:"):
+                        uid = int(line.split()[1])
+                        break
+                else:
+                    return None
+        except (OSError, ValueError, IndexError):
+            return None
+        if pwd is None:
+            return str(uid)
+        try:
+            return pwd.getpwuid(uid).pw_name
+        except KeyError:
+            return str(uid)
+
+
+def _field(buf: bytearray, n: int, label: bytes) -> Optional[int]:
+    start = buf.find(label, 0, n)
+    if start < 0:
+        return None
+    start += len(label)
+    end = buf.find(b"\n", start, n)
+    return int(buf[start:end if end >= 0 else n])
+
+
+def _kb_field(buf: bytearray, n: int, label: bytes) -> Optional[int]:
+    """
+    "Label:   1234 kB" 形式的字段，返回字节数。
+    """
+    start = buf.find(label, 0, n)
+    if start < 0:
+        return None
+    start += len(label)
+    end = buf.find(b"\n", start, n)
+    return int(buf[start:end if end >= 0 else n].split()[0]) * 1024
+
+
+def full_name(comm: str, cmdline: Optional[List[str]]) -> str:
+    """
+    comm 被截断时用 cmdline[0] 的文件名补全。
+    """
+    if len(comm) >= _COMM_MAX_LEN and cmdline:
+        exe = os.path.basename(cmdline[0])
+        if exe.startswith(comm):
+            return exe
+    return comm
@@ -1,43 +1,321 @@
 # backend/app/core/resource_trend.py
-from collections import deque
+import math
+import threading
+import time
+from array import array
 from datetime import datetime
-from typing import Deque
+from typing import Dict, List, Optional, Tuple
 
 import psutil
 
+from app.core.collector import collector
+from app.core.system.downsample import DownsampleMethod, downsample
+from app.core.system.trend_store import METRICS, trend_store
 from app.models.system import ResourcePoint, ResourceTrend
 
-# 最多保存多少个点，例如 3600 = 最近 1 小时（按 1 秒一次）
-_MAX_POINTS = 3600
-_points: Deque[ResourcePoint] = deque(maxlen=_MAX_POINTS)
+# 内存中最多保存多少个点，86400 = 最近 1 天（按 1 秒一次）
+# 每个点只占 5 个 double（40 字节），1 天约 3.3 MB，启动时一次性分配
+_MAX_POINTS = 86400
+
+# 每个网卡单独保存的点数（1 小时）；网卡较多时避免按天分配
+_IFACE_MAX_POINTS = 3600
+
+# 后台采样间隔（秒）
+TREND_SAMPLE_INTERVAL = 1.0
+
+# 区间查询未指定 step 时，目标返回的点数
+_DEFAULT_RANGE_POINTS = 300
+
+# 区间查询使用 lttb 时，先按 max_points 的多少倍读取聚合点再挑选
+_LTTB_OVERSAMPLE = 4
+
+# 32 位网卡计数器（部分驱动 / 平台）的回绕周期
+_COUNTER_WRAP = 2**32
+
+# interface 参数取该值时，使用 network 任务识别出的默认出口网卡；
+# "@" 不会出现在网卡名中，不会与名为 wan 的真实网卡（OpenWrt 默认）共用一个序列
+WAN_INTERFACE = "@wan"
+
+_POINT_COLUMNS = ("ts", "cpu", "mem", "rx", "tx")
+_IFACE_COLUMNS = ("ts", "rx", "tx")
+
+
+class TrendRing:
+    """
+    列式环形缓冲区：每一列（时间戳 / cpu / mem / rx / tx ...）占一个预分配的 array('d')。
+      - append() 只覆盖写入下标，不创建任何对象
+      - tail(n) 只拷贝最近 n 个点的列数据，O(n)
+    读写都在锁内完成，写入方为 collector 线程，读取方为请求线程。
+    """
+
+    def __init__(self, capacity: int, columns: Tuple[str, ...] = _POINT_COLUMNS) -> None:
+        self.capacity = capacity
+        self.columns = columns
+        self._cols = [array("d", bytes(8 * capacity)) for _ in columns]
+        self._head = 0   # 下一个写入位置
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, *values: float) -> None:
+        with self._lock:
+            i = self._head
+            for col, value in zip(self._cols, values):
+                col[i] = value
+            self._head = (i + 1) % self.capacity
+            if self._size < self.capacity:
+                self._size += 1
+
+    def tail(self, n: int) -> Tuple[List[float], ...]:
+        """
+        返回最近 n 个点的各列数据（顺序同 columns），按时间升序。
+        """
+        with self._lock:
+            n = max(0, min(n, self._size))
+            start = (self._head - n) % self.capacity
+            end = start + n
+            if end <= self.capacity:
+                return tuple(col[start:end].tolist() for col in self._cols)
+            # 跨越数组末尾：拼接两段
+            end -= self.capacity
+            return tuple(col[start:].tolist() + col[:end].tolist() for col in self._cols)
+
+
+def _counter_delta(now: int, prev: int) -> Optional[int]:
+    """
+    计算计数器增量：
+      - 正常递增：直接相减
+      - 旧值在 32 位范围内且回绕后的增量合理：按 32 位回绕处理
+      - 其它减小（网卡重建、驱动重置计数）：返回 None，本次不计算速率
+    """
+    if now >= prev:
+        return now - prev
+    if prev < _COUNTER_WRAP:
+        wrapped = now + _COUNTER_WRAP - prev
+        if wrapped < _COUNTER_WRAP // 2:
+            return wrapped
+    return None
+
+
+def _is_loopback(name: str) -> bool:
+    lname = name.lower()
+    return lname == "lo" or lname.startswith("lo0") or lname.startswith("loopback")
+
+
+class NetRateMeter:
+    """
+    根据相邻两次采样的网卡字节计数计算每个网卡的 rx / tx（Mbps）。
+    只与自身上一次采样比较，不与 network 概览共享状态。
+    """
+
+    def __init__(self) -> None:
+        self._last: Dict[str, Tuple[int, int]] = {}
+        self._last_ts: Optional[float] = None
+
+    def sample(self) -> Dict[str, Tuple[float, float]]:
+        counters = psutil.net_io_counters(pernic=True, nowrap=False)
+        now = time.monotonic()
+        dt = now - self._last_ts if self._last_ts is not None else 0.0
+
+        rates: Dict[str, Tuple[float, float]] = {}
+        current: Dict[str, Tuple[int, int]] = {}
+        for name, io in counters.items():
+            current[name] = (io.bytes_recv, io.bytes_sent)
+            prev = self._last.get(name)
+            if prev is None or dt <= 0:
+                # 新出现的网卡：下一次采样才有速率
+                continue
+            rx = _counter_delta(io.bytes_recv, prev[0])
+            tx = _counter_delta(io.bytes_sent, prev[1])
+            if rx is None or tx is None:
+                continue
+            rates[name] = (rx * 8 / 1_000_000 / dt, tx * 8 / 1_000_000 / dt)
+
+        # 消失的网卡直接丢弃，重新出现时从头计算
+        self._last = current
+        self._last_ts = now
+        return rates
+
+    def interfaces(self) -> List[str]:
+        """
+        最近一次采样中存在的网卡（含计数器重置 / 回绕、本轮没有速率的网卡）。
+        """
+        return list(self._last)
+
+
+_ring = TrendRing(_MAX_POINTS)
+_net_meter = NetRateMeter()
+# 每个网卡（以及 WAN_INTERFACE）的 rx / tx 序列，与 _ring 在同一次采样中写入，时间戳一致
+_iface_rings: Dict[str, TrendRing] = {}
+
+
+def _primary_interface() -> Optional[str]:
+    """
+    默认出口网卡：复用 network 任务从路由表识别的结果，避免每秒执行 ip route。
+    """
+    sample = collector.latest("network")
+    if sample is None:
+        return None
+    return sample.value.summary.primary_interface
+
+
+def _push_iface_point(name: str, ts: float, rx: float, tx: float) -> None:
+    ring = _iface_rings.get(name)
+    if ring is None:
+        ring = _iface_rings[name] = TrendRing(_IFACE_MAX_POINTS, _IFACE_COLUMNS)
+    ring.append(ts, rx, tx)
 
 
 def push_resource_point():
-    cpu = psutil.cpu_percent(interval=0.0)
+    # CPU 直接复用 cpu 任务的快照，避免再次调用 psutil.cpu_percent
+    # 打乱全局的采样窗口
+    cpu_sample = collector.latest("cpu")
+    cpu = cpu_sample.value.usagePct if cpu_sample is not None else 0.0
     mem = psutil.virtual_memory().percent
 
-    # 网络用总 io 变化会更准，这里简单不做速率，只做占位
-    # 你可以和之前 network_info 复用逻辑
-    net = psutil.net_io_counters()
-    # 为避免复杂计算，先填 0，未来你可改成基于差值的 Mbps
-    rx = 0.0
-    tx = 0.0
-
-    pt = ResourcePoint(
-        ts=datetime.utcnow(),
-        cpu_pct=cpu,
-        memory_pct=mem,
-        net_rx_mbps=rx,
-        net_tx_mbps=tx,
+    # 网络：各网卡相邻两次采样的字节增量，总量不含回环网卡
+    rates = _net_meter.sample()
+    rx = sum(r for name, (r, _) in rates.items() if not _is_loopback(name))
+    tx = sum(t for name, (_, t) in rates.items() if not _is_loopback(name))
+
+    now = time.time()
+    # 只写入列式缓冲区，ResourcePoint 在读取时按需构建
+    _ring.append(now, cpu, mem, rx, tx)
+
+    for name, (iface_rx, iface_tx) in rates.items():
+        _push_iface_point(name, now, iface_rx, iface_tx)
+    wan = _primary_interface()
+    if wan is not None:
+        wan_rx, wan_tx = rates.get(wan, (0.0, 0.0))
+        _push_iface_point(WAN_INTERFACE, now, wan_rx, wan_tx)
+    # 已经不存在的网卡不再保留序列；计数器重置的网卡本轮没有速率，但仍保留历史
+    present = set(_net_meter.interfaces())
+    for name in [n for n in _iface_rings if n != WAN_INTERFACE and n not in present]:
+        _iface_rings.pop(name, None)
+
+    # 同时写入持久化的多分辨率存储（raw / 1m / 1h）
+    trend_store.ingest(now, cpu, mem, rx, tx)
+    return now
+
+
+def list_trend_interfaces() -> List[str]:
+    """
+    当前有独立网络序列的网卡名（含 WAN_INTERFACE）。
+    """
+    return sorted(_iface_rings)
+
+
+def _build_points(
+    ts: List[float],
+    cpu: List[float],
+    mem: List[float],
+    rx: List[float],
+    tx: List[float],
+) -> List[ResourcePoint]:
+    return [
+        ResourcePoint(
+            ts=datetime.utcfromtimestamp(ts[i]),
+            cpu_pct=round(cpu[i], 2),
+            memory_pct=round(mem[i], 2),
+            net_rx_mbps=round(rx[i], 3),
+            net_tx_mbps=round(tx[i], 3),
+        )
+        for i in range(len(ts))
+    ]
+
+
+def get_resource_trend(
+    limit: int = 100,
+    interface: Optional[str] = None,
+    max_points: Optional[int] = None,
+    method: DownsampleMethod = "lttb",
+) -> ResourceTrend:
+    """
+    返回最近 limit 个点。
+    采样由后台 collector 每 TREND_SAMPLE_INTERVAL 秒完成，接口只读取。
+    interface 为网卡名或 WAN_INTERFACE 时，网络曲线使用该网卡的速率，否则为所有非回环网卡之和。
+    max_points 不为空时，在构建模型之前按 method 把列数据压缩到 max_points 个点。
+    未知网卡抛出 KeyError。
+    """
+    if not collector.running:
+        # 未启动后台采样（例如脚本直接调用）时，保持旧行为：调用即采样
+        push_resource_point()
+    ts, cpu, mem, rx, tx = _ring.tail(limit)
+
+    if interface is not None:
+        ring = _iface_rings.get(interface)
+        if ring is None:
+            raise KeyError(interface)
+        # 同一次采样写入的时间戳完全一致，按时间戳对齐；网卡出现之前的点记为 0
+        iface_ts, iface_rx, iface_tx = ring.tail(limit)
+        index = {t: i for i, t in enumerate(iface_ts)}
+        rx = [iface_rx[index[t]] if t in index else 0.0 for t in ts]
+        tx = [iface_tx[index[t]] if t in index else 0.0 for t in ts]
+
+    applied = None
+    if max_points is not None and len(ts) > max_points:
+        ts, (cpu, mem, rx, tx) = downsample(ts, (cpu, mem, rx, tx), max_points, method)
+        applied = method
+
+    return ResourceTrend(
+        points=_build_points(ts, cpu, mem, rx, tx),
+        interface=interface,
+        downsample=applied,
     )
-    _points.append(pt)
 
 
-def get_resource_trend(limit: int = 100) -> ResourceTrend:
+def get_resource_trend_range(
+    start: datetime,
+    end: Optional[datetime] = None,
+    step: Optional[int] = None,
+    max_points: Optional[int] = None,
+    method: DownsampleMethod = "lttb",
+) -> ResourceTrend:
     """
-    返回最近 limit 个点，调用前自动 push 当前点。
-    建议你在前端轮询这个接口，间隔 3~5 秒即可。
+    区间查询：从持久化存储中读取 [start, end] 内的点，按 step 秒聚合。
+      - step 为空时自动取 (end - start) / 300；指定 max_points 时按 max_points 计算
+        （lttb 先按 4 倍点数读取，再挑选代表点）
+      - 根据 step 与时间跨度自动选择 raw(1s) / 1m / 1h 层级
+      - method="max" 时每个桶取层级中保存的最大值，其余取平均值
+    start / end 为 naive datetime 时按 UTC 处理；end 不晚于 start 时抛出 ValueError。
     """
-    push_resource_point()
-    pts = list(_points)[-limit:]
-    return ResourceTrend(points=pts)
+    start_ts = _to_epoch(start)
+    end_ts = _to_epoch(end) if end is not None else time.time()
+    if end_ts <= start_ts:
+        raise ValueError("'to' must be later than 'from'")
+    if step is None:
+        target = _DEFAULT_RANGE_POINTS
+        if max_points is not None:
+            target = max_points * _LTTB_OVERSAMPLE if method == "lttb" else max_points
+        step = max(math.ceil((end_ts - start_ts) / target), 1)
+
+    tier, rows = trend_store.query(start_ts, end_ts, step)
+    indexes = [METRICS.index(m) for m in ("cpu", "mem", "rx", "tx")]
+    ts = [float(row.ts) for row in rows]
+    cpu, mem, rx, tx = (
+        [(row.max if method == "max" else row.avg)[i] for row in rows]
+        for i in indexes
+    )
+
+    applied = None
+    if max_points is not None and len(ts) > max_points:
+        ts, (cpu, mem, rx, tx) = downsample(ts, (cpu, mem, rx, tx), max_points, method)
+        applied = method
+
+    return ResourceTrend(
+        points=_build_points(ts, cpu, mem, rx, tx),
+        tier=tier.name,
+        step_seconds=max(step, tier.step),
+        downsample=applied,
+    )
+
+
+def _to_epoch(value: datetime) -> float:
+    if value.tzinfo is None:
+        return (value - datetime(1970, 1, 1)).total_seconds()
+    return value.timestamp()
+
+
+collector.register("resource_trend", push_resource_point, interval=TREND_SAMPLE_INTERVAL)
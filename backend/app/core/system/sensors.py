@@ -4,6 +4,7 @@ from typing import List
 
 import psutil
 
+from app.core.collector import collector
 from app.models.system import (
     SensorsOverview,
     TemperatureSensor,
@@ -11,10 +12,13 @@ from app.models.system import (
     BatteryStatus,
 )
 
+# 后台读取传感器的间隔（秒）
+SENSORS_SAMPLE_INTERVAL = 10.0
 
-def get_sensors_overview() -> SensorsOverview:
+
+def collect_sensors_overview() -> SensorsOverview:
     """
-    获取当前主机的传感器信息。
+    采集当前主机的传感器信息。
     - 在 Linux 上支持最好（温度 / 风扇）。
     - Windows / macOS 上，部分接口可能返回 None，此时返回空列表或 battery=None。
     """
@@ -81,3 +85,13 @@ def get_sensors_overview() -> SensorsOverview:
         fans=fans,
         battery=battery,
     )
+
+
+def get_sensors_overview() -> SensorsOverview:
+    """
+    返回后台 collector 最近一次采集的传感器信息。
+    """
+    return collector.get("sensors")
+
+
+collector.register("sensors", collect_sensors_overview, interval=SENSORS_SAMPLE_INTERVAL)
@@ -4,6 +4,8 @@ from typing import Optional
 
 import psutil
 
+from app.core.collector import collector
+from app.core.system.mount_probe import mount_probe
 from app.models.system import (
     CpuSummary,
     MemorySummary,
@@ -12,6 +14,11 @@ from app.models.system import (
 )
 
 
+# 后台采样间隔（秒）
+CPU_SAMPLE_INTERVAL = 1.0
+MEMORY_SAMPLE_INTERVAL = 2.0
+
+
 # ========= CPU =========
 
 def get_cpu_summary() -> CpuSummary:
@@ -22,9 +29,11 @@ def get_cpu_summary() -> CpuSummary:
     - cores: 逻辑核心数
     - perCoreUsage: 每个核心的使用率
     - userPct/systemPct/idlePct/iowaitPct: 各类 CPU 时间占比
+    使用非阻塞采样，数值为距离上一次调用以来的平均值，
+    由后台 collector 按 CPU_SAMPLE_INTERVAL 周期调用，请求路径只读快照。
     """
-    # 总使用率（短暂采样）
-    usage = psutil.cpu_percent(interval=0.2)
+    # 总使用率（相对上一次采样）
+    usage = psutil.cpu_percent(interval=None)
 
     # 每个核心的使用率
     per_core = psutil.cpu_percent(interval=None, percpu=True)
@@ -145,13 +154,17 @@ def get_disk_summary(mount: Optional[str] = None) -> DiskSummary:
         - 其他："/"
     - 文件系统类型 fsType 通过 psutil.disk_partitions 获取：
         - 支持 NTFS / APFS / ext4 / exFAT / FAT32 等所有系统能识别的格式
+    - 容量通过 mount_probe 带超时读取，挂载点无响应时 status 为 unreachable
     """
     norm_mount = _normalize_mount_for_os(mount)
 
-    usage = psutil.disk_usage(norm_mount)
-    total_gb = usage.total / 1024**3
-    used_gb = usage.used / 1024**3
-    free_gb = usage.free / 1024**3
+    probe = mount_probe.usage(norm_mount)
+    if probe.status == "error":
+        raise probe.error
+    usage = probe.usage
+    total_gb = usage.total / 1024**3 if usage else 0.0
+    used_gb = usage.used / 1024**3 if usage else 0.0
+    free_gb = usage.free / 1024**3 if usage else 0.0
 
     device = norm_mount
     fs_type = "unknown"
@@ -172,10 +185,11 @@ def get_disk_summary(mount: Optional[str] = None) -> DiskSummary:
         device=device,
         mount=norm_mount,
         fsType=fs_type,
-        usagePct=round(usage.percent, 1),
+        usagePct=round(usage.percent, 1) if usage else 0.0,
         totalGb=round(total_gb, 1),
         usedGb=round(used_gb, 1),
         freeGb=round(free_gb, 1),
+        status=probe.status,
     )
 
 
@@ -184,8 +198,13 @@ def get_disk_summary(mount: Optional[str] = None) -> DiskSummary:
 def get_system_summary(mount: Optional[str] = None) -> SystemSummary:
     """
     汇总整个主机状态：CPU + 内存 + 指定磁盘（跨平台友好）
+    CPU / 内存来自后台 collector 的最新快照。
     """
-    cpu = get_cpu_summary()
-    memory = get_memory_summary()
+    cpu = collector.get("cpu")
+    memory = collector.get("memory")
     disk = get_disk_summary(mount=mount)
     return SystemSummary(cpu=cpu, memory=memory, disk=disk)
+
+
+collector.register("cpu", get_cpu_summary, interval=CPU_SAMPLE_INTERVAL)
+collector.register("memory", get_memory_summary, interval=MEMORY_SAMPLE_INTERVAL)
@@ -0,0 +1,244 @@
+# backend/app/core/system/trend_store.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DB_PATH = Path(__file__).resolve().parents[2] / "data" / "resource_trend.sqlite3"
+
+# 每个点记录的指标列
+METRICS = ("cpu", "mem", "rx", "tx")
+
+
+@dataclass(frozen=True)
+class Tier:
+    """
+    一个分辨率层级：
+      - step: 每个点代表的秒数
+      - retention: 保留多久（秒）
+    """
+    name: str
+    step: int
+    retention: int
+
+
+# raw 1 秒保留 1 小时；1 分钟保留 7 天；1 小时保留 1 年
+TIERS: Tuple[Tier, ...] = (
+    Tier("raw", 1, 3600),
+    Tier("1m", 60, 7 * 86400),
+    Tier("1h", 3600, 365 * 86400),
+)
+
+# 每写入多少个点做一次过期清理
+_PRUNE_EVERY = 300
+
+
+@dataclass
+class _Bucket:
+    """
+    正在累积的汇总桶（内存中），桶结束时落盘。
+    """
+    start: int
+    n: int = 0
+    sums: Optional[List[float]] = None
+    maxs: Optional[List[float]] = None
+
+    def add(self, values: Tuple[float, ...]) -> None:
+        if self.sums is None:
+            self.sums = list(values)
+            self.maxs = list(values)
+        else:
+            for i, v in enumerate(values):
+                self.sums[i] += v
+                if v > self.maxs[i]:
+                    self.maxs[i] = v
+        self.n += 1
+
+
+@dataclass(frozen=True)
+class TrendRow:
+    ts: int                      # 桶起始时间（unix 秒）
+    n: int                       # 桶内原始点数
+    avg: Tuple[float, ...]       # 按 METRICS 顺序的平均值
+    max: Tuple[float, ...]       # 按 METRICS 顺序的最大值
+
+
+class TrendStore:
+    """
+    本地 SQLite 时间序列存储：
+      - ingest() 每秒写入一个 raw 点，同时在内存里累积 1m / 1h 汇总桶，桶结束时落盘
+      - 汇总表使用 upsert 合并（加权平均 + 最大值），重启后同一个桶可以继续累积
+      - query() 根据 step 与时间范围自动选择合适的层级，只读取需要的行
+    """
+
+    def __init__(self, path: Path = DB_PATH) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _Bucket] = {}
+        self._ingested = 0
+
+    # ---------- 连接 ----------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        cols = ", ".join(f"{m} REAL" for m in METRICS)
+        conn.execute(f"CREATE TABLE IF NOT EXISTS trend_raw (ts INTEGER PRIMARY KEY, {cols})")
+        rollup_cols = ", ".join(f"{m}_avg REAL, {m}_max REAL" for m in METRICS)
+        for tier in TIERS[1:]:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS trend_{tier.name} (ts INTEGER PRIMARY KEY, n INTEGER, {rollup_cols})"
+            )
+        self._conn = conn
+        return conn
+
+    def reopen(self, path: Path) -> None:
+        """
+        切换到另一个数据库文件（例如基准测试使用临时目录）。
+        """
+        self.close()
+        self.path = path
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                # 未结束的汇总桶也写入，重启后通过 upsert 继续累积
+                for name, bucket in self._buckets.items():
+                    self._flush_bucket(name, bucket)
+                self._buckets.clear()
+            finally:
+                self._conn.close()
+                self._conn = None
+
+    # ---------- 写入 ----------
+
+    def _flush_bucket(self, tier_name: str, bucket: _Bucket) -> None:
+        if bucket.n == 0:
+            return
+        avgs = [s / bucket.n for s in bucket.sums]
+        names = ["ts", "n"]
+        values: List[float] = [bucket.start, bucket.n]
+        updates = ["n = n + excluded.n"]
+        for i, m in enumerate(METRICS):
+            names += [f"{m}_avg", f"{m}_max"]
+            values += [avgs[i], bucket.maxs[i]]
+            updates.append(f"{m}_avg = ({m}_avg * n + excluded.{m}_avg * excluded.n) / (n + excluded.n)")
+            updates.append(f"{m}_max = MAX({m}_max, excluded.{m}_max)")
+        placeholders = ", ".join("?" for _ in names)
+        # SQLite 中 SET 的所有表达式都基于旧行求值，n 始终是合并前的计数
+        self._conn.execute(
+            f"INSERT INTO trend_{tier_name} ({', '.join(names)}) VALUES ({placeholders}) "
+            f"ON CONFLICT(ts) DO UPDATE SET {', '.join(updates)}",
+            values,
+        )
+
+    def ingest(self, ts: float, cpu: float, mem: float, rx: float, tx: float) -> None:
+        values = (cpu, mem, rx, tx)
+        second = int(ts)
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN")
+            try:
+                conn.execute(
+                    f"INSERT OR REPLACE INTO trend_raw (ts, {', '.join(METRICS)}) VALUES (?, ?, ?, ?, ?)",
+                    (second, *values),
+                )
+                for tier in TIERS[1:]:
+                    start = second - second % tier.step
+                    bucket = self._buckets.get(tier.name)
+                    if bucket is not None and bucket.start != start:
+                        self._flush_bucket(tier.name, bucket)
+                        bucket = None
+                    if bucket is None:
+                        bucket = _Bucket(start=start)
+                        self._buckets[tier.name] = bucket
+                    bucket.add(values)
+
+                self._ingested += 1
+                if self._ingested % _PRUNE_EVERY == 0:
+                    self._prune(second)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _prune(self, now: int) -> None:
+        for tier in TIERS:
+            self._conn.execute(f"DELETE FROM trend_{tier.name} WHERE ts < ?", (now - tier.retention,))
+
+    # ---------- 查询 ----------
+
+    @staticmethod
+    def pick_tier(start: float, step: int, now: Optional[float] = None) -> Tier:
+        """
+        选择层级：step 不小于层级精度，且层级保留期覆盖 start；都不满足时用最粗的层级。
+        """
+        now = now if now is not None else time.time()
+        candidates = [t for t in TIERS if t.step <= step and now - start <= t.retention]
+        if candidates:
+            return candidates[-1]
+        covering = [t for t in TIERS if now - start <= t.retention]
+        return covering[0] if covering else TIERS[-1]
+
+    def query(self, start: float, end: float, step: int) -> Tuple[Tier, List[TrendRow]]:
+        step = max(int(step), 1)
+        tier = self.pick_tier(start, step)
+        step = max(step, tier.step)
+        lo, hi = int(start), int(end)
+
+        if tier.name == "raw":
+            select = "COUNT(*), " + ", ".join(f"AVG({m}), MAX({m})" for m in METRICS)
+        else:
+            select = "SUM(n), " + ", ".join(f"SUM({m}_avg * n) / SUM(n), MAX({m}_max)" for m in METRICS)
+        sql = (
+            f"SELECT (ts / ?) * ? AS bucket, {select} FROM trend_{tier.name} "
+            f"WHERE ts >= ? AND ts <= ? GROUP BY bucket ORDER BY bucket"
+        )
+
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(sql, (step, step, lo, hi)).fetchall()
+            # 当前尚未落盘的汇总桶也参与结果，保证最新一段不缺失
+            pending = self._buckets.get(tier.name) if tier.name != "raw" else None
+            pending_row = None
+            if pending is not None and pending.n and lo <= pending.start <= hi:
+                pending_row = TrendRow(
+                    ts=pending.start - pending.start % step,
+                    n=pending.n,
+                    avg=tuple(s / pending.n for s in pending.sums),
+                    max=tuple(pending.maxs),
+                )
+
+        result = [
+            TrendRow(ts=row[0], n=row[1], avg=tuple(row[2::2]), max=tuple(row[3::2]))
+            for row in rows
+        ]
+        if pending_row is not None:
+            if result and result[-1].ts == pending_row.ts:
+                # 与已落盘的同一桶按点数加权合并
+                last = result[-1]
+                n = last.n + pending_row.n
+                result[-1] = TrendRow(
+                    ts=last.ts,
+                    n=n,
+                    avg=tuple((a * last.n + b * pending_row.n) / n for a, b in zip(last.avg, pending_row.avg)),
+                    max=tuple(max(a, b) for a, b in zip(last.max, pending_row.max)),
+                )
+            else:
+                result.append(pending_row)
+        return tier, result
+
+
+# 全局单例：由资源趋势采样任务写入
+trend_store = TrendStore()
@@ -1,4 +1,6 @@
 # backend/app/main.py
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -7,8 +9,33 @@ from app.api import network as network_api
 from app.api import monitor as monitor_api
 from app.api import docker_api
 from app.api import host as host_api
+from app.api import metrics as metrics_api
+from app.core.collector import collector
+from app.core.system.disk_events import mount_watcher
+from app.core.system.journal import journal_reader
+from app.core.system.trend_store import trend_store
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 后台采样：CPU / 内存 / 磁盘 / 网络 / 传感器 / 进程按各自节奏采集，
+    # 接口只读取最新快照
+    collector.start()
+    # 挂载表变化时立即刷新磁盘列表（Linux）
+    mount_watcher.start()
+    # 常驻 journalctl 读取系统日志（Linux）
+    journal_reader.start()
+    try:
+        yield
+    finally:
+        journal_reader.stop()
+        mount_watcher.stop()
+        collector.stop()
+        # 落盘未结束的趋势汇总桶
+        trend_store.close()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # 允许的前端来源
 origins = [
@@ -31,3 +58,4 @@ app.include_router(network_api.router, prefix="/network", tags=["network"])
 app.include_router(monitor_api.router, prefix="/monitor", tags=["monitor"])
 app.include_router(docker_api.router,  prefix="/docker",  tags=["docker"])
 app.include_router(host_api.router,    prefix="/host",    tags=["host"])
+app.include_router(metrics_api.router, tags=["metrics"])
@@ -1,6 +1,8 @@
 # backend/app/models/host.py
-from pydantic import BaseModel
-from typing import Optional
+from datetime import datetime
+from typing import Dict, Literal, Optional
+
+from pydantic import BaseModel, Field
 
 from app.models.system import (
     SystemSummary,
@@ -14,6 +16,20 @@ from app.models.monitor import MonitorOverview
 from app.models.docker import DockerOverview
 
 
+class HostSectionStatus(BaseModel):
+    """
+    首页聚合中单个区块的状态：
+      - ok: 在 deadline 内完成
+      - stale: 超时或失败，返回的是上一次成功的结果
+      - missing: 超时或失败，且从未成功过，对应字段为 None
+    """
+    status: Literal["ok", "stale", "missing"]
+    elapsed_ms: float                       # 本次请求中等待该区块的耗时
+    deadline_ms: float                      # 该区块的等待上限
+    collected_at: Optional[datetime] = None  # 返回数据的产生时间
+    message: Optional[str] = None           # 超时 / 异常说明
+
+
 class HostOverview(BaseModel):
     """
     首页用的一次性聚合视图：
@@ -24,12 +40,16 @@ class HostOverview(BaseModel):
       - uptime: 开机时间/已运行时长
       - network: 主机网络概览
       - monitor: 外部服务监控总览（如果你有配置）
+      - sections: 每个区块的状态（ok/stale/missing）与耗时
+    各区块并发采集，超时且没有历史结果的区块为 None。
     """
-    system: SystemSummary
-    disks: DiskDevicesSnapshot
-    processes: ProcessesOverview
-    sensors: SensorsOverview
-    uptime: UptimeInfo
-    network: NetworkOverview
+    system: Optional[SystemSummary] = None
+    disks: Optional[DiskDevicesSnapshot] = None
+    processes: Optional[ProcessesOverview] = None
+    sensors: Optional[SensorsOverview] = None
+    uptime: Optional[UptimeInfo] = None
+    network: Optional[NetworkOverview] = None
     monitor: Optional[MonitorOverview] = None
     docker: Optional[DockerOverview] = None
+
+    sections: Dict[str, HostSectionStatus] = Field(default_factory=dict)
@@ -41,6 +41,7 @@ class DiskSummary(BaseModel):
     totalGb: float               # 总容量 GB
     usedGb: float                # 已用 GB
     freeGb: float                # 剩余 GB
+    status: str = "ok"           # ok / unreachable（挂载点无响应，容量为最后一次成功的结果）
 
 
 class SystemSummary(BaseModel):
@@ -60,6 +61,33 @@ class DiskDevice(BaseModel):
     usedGb: float      # 已用 GB
     freeGb: float      # 剩余 GB
     isRemovable: bool  # 是否推测为可移动设备/USB
+    status: str = "ok"  # ok / unreachable（挂载点无响应，容量为最后一次成功的结果，从未成功时为 0）
+
+    inodesTotal: Optional[int] = None  # inode 总数；Windows / btrfs 等不限制 inode 时为空
+    inodesUsed: Optional[int] = None
+    inodesPct: Optional[float] = None  # inode 使用率 %
+
+    # 按近 6 小时加权的增长趋势估计，采样满 30 分钟后才给出；不增长或一年内不会写满时 hours* 为空
+    growthGbPerHour: Optional[float] = None
+    hoursUntilFull: Optional[float] = None
+    hoursUntilInodesFull: Optional[float] = None
+
+    # I/O 指标来自所在块设备（blockDevice）两次后台采样之间的增量，采样尚未完成时为空
+    blockDevice: Optional[str] = None  # 分区所在的块设备，例如 sda / nvme0n1 / dm-0
+    readMBps: Optional[float] = None   # 读吞吐 MB/s
+    writeMBps: Optional[float] = None  # 写吞吐 MB/s
+    readIops: Optional[float] = None
+    writeIops: Optional[float] = None
+    awaitMs: Optional[float] = None    # 平均每次 I/O 的耗时（排队 + 服务），ms
+    utilPct: Optional[float] = None    # 设备忙碌时间占比，部分平台不提供
+
+
+class DiskEvent(BaseModel):
+    seq: int                             # 递增序号，即游标
+    kind: str                            # added / removed
+    device: str
+    mount: Optional[str] = None
+    ts: datetime
 
 
 class DiskDevicesSnapshot(BaseModel):
@@ -67,6 +95,29 @@ class DiskDevicesSnapshot(BaseModel):
     added: List[str]           # 新增的 device 名称列表
     removed: List[str]         # 消失的 device 名称列表
     snapshotId: str            # 时间戳或 UUID，用于标记这次快照
+    cursor: int = 0            # 下次请求时作为 since 传回
+    events: List[DiskEvent] = []  # since 之后的原始事件（按序号升序）
+    truncated: bool = False    # since 之后有事件已被丢弃（或服务已重启），需要以 devices 为准
+
+
+class DiskIoPoint(BaseModel):
+    ts: datetime
+    read_mbps: float
+    write_mbps: float
+    read_iops: float
+    write_iops: float
+    await_ms: float
+    util_pct: Optional[float] = None
+
+
+class DiskIoHistory(BaseModel):
+    """
+    /system/disks/io-history：某个块设备最近的 I/O 曲线
+    """
+    device: str                         # 块设备名
+    interval_seconds: float             # 采样间隔
+    points: List[DiskIoPoint]
+    downsample: Optional[str] = None    # 实际使用的降采样方法，未降采样为 None
 
 # =========================
 # 1) 进程监控 /system/processes
@@ -81,8 +132,29 @@ class ProcessInfo(BaseModel):
     memory_mb: float       # 常驻内存，单位 MB
     memory_pct: float      # 占总内存百分比
 
+    pss_mb: Optional[float] = None  # 按共享进程数均摊共享页后的内存（PSS），低频采样，仅 Linux Top 候选提供
+    uss_mb: Optional[float] = None  # 进程独占内存（USS）
+
     cmdline: Optional[str] = None  # 完整命令行（可用于详情弹窗）
 
+    threads: Optional[int] = None         # 线程数
+    io_read_bps: Optional[float] = None   # 块设备读取速率（字节/秒），无权限时为空
+    io_write_bps: Optional[float] = None  # 块设备写入速率（字节/秒）
+    sockets: Optional[int] = None         # 打开的 socket 数，仅 top_by_io 中提供
+
+
+class ProcessGroup(BaseModel):
+    """
+    按名称 / 用户 / cgroup / 容器聚合后的一组进程
+    """
+    key: str               # 分组键：进程名 / 用户名 / cgroup 路径 / 容器名（不在容器中为 "host"）
+    cpu_pct: float         # 组内 CPU 占用之和
+    memory_mb: float       # 组内常驻内存之和，单位 MB
+    memory_pct: float
+    process_count: int
+    thread_count: int
+    service: Optional[str] = None  # group_by=container 时匹配到的 docker 服务 slug
+
 
 class ProcessesOverview(BaseModel):
     """
@@ -90,12 +162,31 @@ class ProcessesOverview(BaseModel):
       - summary：整体统计
       - top_by_cpu：按 CPU 排序的前 N 个进程
       - top_by_memory：按内存排序的前 N 个进程
+      - top_by_io：按磁盘读写速率排序的前 N 个进程
+      - groups_by_cpu / groups_by_memory：指定 group_by 时的前 N 个分组
     """
     total: int
     collected_at: datetime
+    cpu_window_seconds: Optional[float] = None  # CPU% 的统计窗口（两次后台采样的间隔）
 
     top_by_cpu: List[ProcessInfo]
     top_by_memory: List[ProcessInfo]
+    top_by_io: List[ProcessInfo] = []
+
+    group_by: Optional[str] = None
+    groups_by_cpu: Optional[List[ProcessGroup]] = None
+    groups_by_memory: Optional[List[ProcessGroup]] = None
+
+
+class ProcessSearchResult(BaseModel):
+    """
+    进程搜索 /system/processes/search 的一页结果
+    """
+    total: int                  # 快照中的进程总数
+    matched: int                # 符合过滤条件的进程数
+    collected_at: datetime
+    items: List[ProcessInfo]
+    next_cursor: Optional[str] = None  # 下一页游标，没有更多结果时为空
 
 
 # =========================
@@ -155,12 +246,41 @@ class SystemEvent(BaseModel):
     level: Optional[str] = None   # info / warning / error ...
     source: Optional[str] = None
     message: str
+    seq: Optional[int] = None       # 事件序号（Linux 常驻读取时提供），可作为 since 游标
+    unit: Optional[str] = None      # systemd unit，例如 nginx.service
+    priority: Optional[int] = None  # syslog 优先级 0(emerg) ~ 7(debug)
+    pid: Optional[int] = None
 
 # =========================
 # 4) 系统事件 /system/events
 # =========================
 class SystemEventsOverview(BaseModel):
     items: List[SystemEvent]
+    cursor: Optional[int] = None  # 下次请求时作为 since 传回；不支持增量读取时为空
+    truncated: bool = False       # since 之后有事件已被挤出缓冲区（或服务已重启）
+    has_more: bool = False        # 带过滤条件时还有未返回的匹配（无 since 时指更早的，可用 before 翻页）
+    next_before: Optional[int] = None  # has_more 且未传 since 时，作为下一页的 before
+
+
+class EventRate(BaseModel):
+    key: str                                      # unit 名称 / 优先级名称（err、warning ...）/ all
+    per_minute: float                             # 最近 60 秒的事件数
+    baseline_per_minute: Optional[float] = None   # EWMA 基线（半衰期 1 小时）；预热期间为空
+    stddev_per_minute: Optional[float] = None
+    burst: bool = False                           # 明显高于基线
+    history: List[int] = []                       # 最近每分钟的事件数，按时间升序，最后一个为当前分钟
+
+
+class EventRatesOverview(BaseModel):
+    """
+    /system/events/rates：按 unit / priority 的事件速率与突发
+    """
+    bucket_seconds: int
+    generated_at: datetime
+    total: Optional[EventRate] = None             # 尚未读取到任何事件时为空
+    units: List[EventRate]                        # 按当前速率降序
+    priorities: List[EventRate]                   # 按严重程度降序（emerg 在前）
+    bursts: List[str] = []                        # 处于突发状态的 unit
 
 
 class ResourcePoint(BaseModel):
@@ -173,6 +293,10 @@ class ResourcePoint(BaseModel):
 
 class ResourceTrend(BaseModel):
     points: List[ResourcePoint]
+    tier: Optional[str] = None          # 区间查询时使用的存储层级：raw / 1m / 1h
+    step_seconds: Optional[int] = None  # 区间查询时每个点代表的秒数
+    interface: Optional[str] = None     # 网络曲线对应的网卡，None 表示所有非回环网卡之和
+    downsample: Optional[str] = None    # 实际使用的降采样方法（lttb / max / avg），未降采样为 None
 
 
 class ScheduleEntry(BaseModel):
@@ -0,0 +1 @@
+# backend/bench/__init__.py
@@ -0,0 +1,440 @@
+# backend/bench/fakes.py
+"""
+基准测试用的可替换后端：
+  - FakePsutil: 合成的 psutil（默认 5000 个进程、64 块网卡），结果确定、可重复
+  - FakeCommands: 临时目录里的假 docker / journalctl / arp / ip / last / crontab / speedtest，
+                  通过 PATH 前置生效（默认 300 个容器）
+  - FakeNetwork: 固定结果的 TCP 探测 / DNS / 公网 IP / httpx 请求
+全部以上下文管理器形式提供，退出时恢复原状。
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import shutil
+import socket
+import stat
+import tempfile
+import time
+from collections import namedtuple
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from unittest import mock
+
+import httpx
+import psutil
+from psutil import _common
+
+SEED = 20240601
+
+svmem = namedtuple("svmem", "total available percent used free active inactive buffers cached shared slab")
+sswap = namedtuple("sswap", "total used free percent sin sout")
+scputimes = namedtuple("scputimes", "user nice system idle iowait irq softirq steal guest guest_nice")
+pmem = namedtuple("pmem", "rss vms shared text lib data dirty")
+pio = namedtuple("pio", "read_count write_count read_bytes write_bytes read_chars write_chars")
+pcputimes = namedtuple("pcputimes", "user system children_user children_system iowait")
+puids = namedtuple("puids", "real effective saved")
+sdiskio = namedtuple("sdiskio", "read_count write_count read_bytes write_bytes read_time write_time read_merged_count write_merged_count busy_time")
+
+_NAMES = ["nginx", "php-fpm", "postgres", "python3", "node", "java", "chrome", "sshd", "bash", "redis-server"]
+_USERS = ["root", "www-data", "postgres", "app", "nobody"]
+
+
+class FakeProcess:
+    """
+    psutil.Process 的最小替身，字段在构造时确定，CPU 时间随调用稳定增长。
+    """
+
+    def __init__(self, pid: int, rng: random.Random, total_mem: int) -> None:
+        self.pid = pid
+        self._name = rng.choice(_NAMES)
+        self._username = rng.choice(_USERS)
+        self._cmdline = [f"/usr/bin/{self._name}", "--worker", str(pid % 97)]
+        self._rss = rng.randint(2, 800) * 1024 * 1024
+        self._total_mem = total_mem
+        self._create_time = 1_700_000_000.0 + pid
+        self._cpu_rate = rng.random() * 0.5  # 每秒消耗的 CPU 秒
+        self._io_rate = rng.randint(0, 4 * 1024 * 1024)
+        self._threads = rng.randint(1, 64)
+        self._ppid = 1 if pid > 1 else 0
+        # 每 10 个进程有 1 个在 docker 容器中，容器短 ID 与 FakeCommands 的 docker ps 对应
+        if pid % 10 == 0:
+            self._cgroup = f"/system.slice/docker-{pid // 10 % 300:012x}{'0' * 52}.scope"
+        else:
+            self._cgroup = f"/system.slice/{self._name}.service"
+        self._start = time.monotonic()
+        self.info: Dict = {}
+
+    # ---- psutil.Process API ----
+    def oneshot(self):
+        return _NullContext()
+
+    def name(self) -> str:
+        return self._name
+
+    def username(self) -> str:
+        return self._username
+
+    def cmdline(self) -> List[str]:
+        return list(self._cmdline)
+
+    def create_time(self) -> float:
+        return self._create_time
+
+    def ppid(self) -> int:
+        return self._ppid
+
+    def status(self) -> str:
+        return psutil.STATUS_SLEEPING
+
+    def num_threads(self) -> int:
+        return self._threads
+
+    def memory_info(self):
+        return pmem(self._rss, self._rss * 2, self._rss // 4, 0, 0, self._rss // 2, 0)
+
+    def memory_percent(self, memtype: str = "rss") -> float:
+        return self._rss / self._total_mem * 100.0
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._start + 10.0
+
+    def cpu_times(self):
+        used = self._elapsed() * self._cpu_rate
+        return pcputimes(used * 0.7, used * 0.3, 0.0, 0.0, 0.0)
+
+    def cpu_percent(self, interval: Optional[float] = None) -> float:
+        return round(self._cpu_rate * 100.0, 1)
+
+    def io_counters(self):
+        total = int(self._elapsed() * self._io_rate)
+        return pio(total // 4096, total // 8192, total, total // 2, total, total // 2)
+
+    def net_connections(self, kind: str = "inet") -> List:
+        return [None] * (self.pid % 8)
+
+    def uids(self):
+        return puids(0, 0, 0)
+
+    def is_running(self) -> bool:
+        return True
+
+
+class _NullContext:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+class FakePsutil:
+    """
+    用合成数据替换 psutil 的模块级函数（进程 / 网卡 / CPU / 内存 / 磁盘 / 传感器）。
+    """
+
+    def __init__(self, processes: int = 5000, nics: int = 64, disks: int = 8, seed: int = SEED) -> None:
+        self.rng = random.Random(seed)
+        self.total_mem = 64 * 1024**3
+        self.processes = [FakeProcess(pid, self.rng, self.total_mem) for pid in range(1, processes + 1)]
+        self.by_pid = {p.pid: p for p in self.processes}
+        self.nics = [f"eth{i}" for i in range(nics)]
+        self.disks = [f"sd{chr(ord('a') + i)}" for i in range(disks)]
+        self._start = time.monotonic()
+
+    # ---- 进程 ----
+    def process_iter(self, attrs=None, ad_value=None) -> Iterator[FakeProcess]:
+        for proc in self.processes:
+            if attrs:
+                proc.info = {name: getattr(proc, name)() if name != "pid" else proc.pid for name in attrs}
+            yield proc
+
+    def pids(self) -> List[int]:
+        return list(self.by_pid)
+
+    def read_cgroup(self, pid: int) -> Optional[str]:
+        proc = self.by_pid.get(pid)
+        return proc._cgroup if proc is not None else None
+
+    def process(self, pid: int) -> FakeProcess:
+        proc = self.by_pid.get(pid)
+        if proc is None:
+            raise psutil.NoSuchProcess(pid)
+        return proc
+
+    # ---- CPU / 内存 ----
+    def cpu_percent(self, interval=None, percpu=False):
+        if percpu:
+            return [round(10.0 + i % 7, 1) for i in range(16)]
+        return 23.4
+
+    def cpu_times_percent(self, interval=None, percpu=False):
+        return scputimes(15.0, 0.0, 6.0, 77.0, 2.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+
+    def cpu_count(self, logical=True):
+        return 16
+
+    def getloadavg(self):
+        return (1.5, 1.2, 0.9)
+
+    def virtual_memory(self):
+        total = self.total_mem
+        available = total // 3
+        return svmem(total, available, 66.7, total - available, available, 0, 0, 1024**3, 4 * 1024**3, 0, 0)
+
+    def swap_memory(self):
+        return sswap(8 * 1024**3, 1024**3, 7 * 1024**3, 12.5, 0, 0)
+
+    def boot_time(self) -> float:
+        return 1_700_000_000.0
+
+    # ---- 网络 ----
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._start + 1.0
+
+    def net_if_addrs(self):
+        out = {}
+        for i, name in enumerate(self.nics):
+            out[name] = [
+                _common.snicaddr(socket.AF_INET, f"10.{i // 250}.{i % 250}.2", "255.255.255.0", None, None),
+                _common.snicaddr(psutil.AF_LINK, f"02:00:00:00:{i // 256:02x}:{i % 256:02x}", None, None, None),
+            ]
+        return out
+
+    def net_if_stats(self):
+        return {
+            name: _common.snicstats(True, _common.NIC_DUPLEX_FULL, 10000, 1500, "up,broadcast,running")
+            for name in self.nics
+        }
+
+    def net_io_counters(self, pernic=False, nowrap=True):
+        t = self._elapsed()
+        per = {
+            name: _common.snetio(
+                int(t * (i + 1) * 125_000), int(t * (i + 1) * 250_000),
+                int(t * 100), int(t * 200), 0, 0, 0, 0,
+            )
+            for i, name in enumerate(self.nics)
+        }
+        if pernic:
+            return per
+        return _common.snetio(*(sum(v[k] for v in per.values()) for k in range(8)))
+
+    # ---- 磁盘 / 传感器 ----
+    def disk_partitions(self, all=False):
+        parts = [_common.sdiskpart("/dev/sda1", "/", "ext4", "rw,relatime")]
+        for name in self.disks[1:]:
+            parts.append(_common.sdiskpart(f"/dev/{name}1", f"/mnt/{name}", "xfs", "rw,relatime"))
+        return parts
+
+    def disk_usage(self, path):
+        total = 2 * 1024**4
+        used = total // 3
+        return _common.sdiskusage(total, used, total - used, 33.3)
+
+    def disk_io_counters(self, perdisk=False, nowrap=True):
+        t = self._elapsed()
+        per = {
+            f"{name}1": sdiskio(int(t * 100), int(t * 50), int(t * 4_000_000), int(t * 2_000_000),
+                                int(t * 40), int(t * 30), 0, 0, int(t * 50))
+            for name in self.disks
+        }
+        if perdisk:
+            return per
+        return sdiskio(*(sum(v[k] for v in per.values()) for k in range(9)))
+
+    def sensors_temperatures(self, fahrenheit=False):
+        return {"coretemp": [_common.shwtemp(f"Core {i}", 45.0 + i, 80.0, 100.0) for i in range(8)]}
+
+    def sensors_fans(self):
+        return {}
+
+    def sensors_battery(self):
+        return None
+
+    @contextmanager
+    def installed(self):
+        from app.core.system import process_table
+
+        names = [
+            "process_iter", "pids", "cpu_percent", "cpu_times_percent", "cpu_count", "getloadavg",
+            "virtual_memory", "swap_memory", "boot_time", "net_if_addrs", "net_if_stats",
+            "net_io_counters", "disk_partitions", "disk_usage", "disk_io_counters",
+            "sensors_temperatures", "sensors_fans", "sensors_battery",
+        ]
+        with ExitStack() as stack:
+            for name in names:
+                stack.enter_context(mock.patch.object(psutil, name, getattr(self, name)))
+            stack.enter_context(mock.patch.object(psutil, "Process", self.process))
+            stack.enter_context(mock.patch.object(process_table, "_read_cgroup", self.read_cgroup))
+            # 假进程只存在于 psutil 替身中，关闭 /proc 批量读取
+            stack.enter_context(mock.patch.object(process_table, "PROCFS_READER_ENABLED", False))
+            yield self
+
+
+def _write_script(bin_dir: Path, name: str, body: str) -> None:
+    path = bin_dir / name
+    path.write_text("#!/bin/sh\n" + body, encoding="utf-8")
+    path.chmod(path.stat().st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
+
+
+class FakeCommands:
+    """
+    生成一组假的命令行工具，输出预先写入数据文件，执行开销只有一次 fork + cat。
+    """
+
+    def __init__(self, containers: int = 300, journal_lines: int = 2000, arp_entries: int = 200, seed: int = SEED) -> None:
+        self.containers = containers
+        self.journal_lines = journal_lines
+        self.arp_entries = arp_entries
+        self.rng = random.Random(seed)
+        self.root: Optional[Path] = None
+
+    def _populate(self, root: Path) -> None:
+        bin_dir = root / "bin"
+        data = root / "data"
+        bin_dir.mkdir()
+        data.mkdir()
+
+        # docker ps / docker container inspect
+        with (data / "docker_ps.jsonl").open("w", encoding="utf-8") as fh:
+            for i in range(self.containers):
+                state = "running" if i % 10 else "exited"
+                fh.write(json.dumps({
+                    "ID": f"{i:012x}",
+                    "Names": f"svc-{i:03d}",
+                    "Image": f"example/app-{i % 17}:latest",
+                    "State": state,
+                    "Status": "Up 3 hours" if state == "running" else "Exited (0) 1 hour ago",
+                }) + "\n")
+        _write_script(bin_dir, "docker", f"""
+if [ "$1" = "ps" ]; then cat "{data}/docker_ps.jsonl"; exit 0; fi
+if [ "$1" = "container" ] && [ "$2" = "inspect" ]; then
+  printf '[{{"Name":"/%s","Image":"example/app:latest","State":{{"Status":"running","Running":true,"Health":{{"Status":"healthy"}}}},"Config":{{}}}}]' "$3"
+  exit 0
+fi
+exit 1
+""")
+
+        # journalctl -n N -o short-iso / -o json
+        with (data / "journal.txt").open("w", encoding="utf-8") as fh:
+            for i in range(self.journal_lines):
+                fh.write(f"2024-06-01T12:{i // 60 % 60:02d}:{i % 60:02d}+0000 host sshd[{1000 + i % 50}]: "
+                         f"Accepted publickey for user{i % 7} from 10.0.0.{i % 250} port {40000 + i}\n")
+        with (data / "journal.jsonl").open("w", encoding="utf-8") as fh:
+            base_us = 1_717_243_200_000_000
+            units = ["sshd.service", "nginx.service", "cron.service", "kernel", "docker.service"]
+            for i in range(self.journal_lines):
+                unit = units[i % len(units)]
+                fh.write(json.dumps({
+                    "__CURSOR": f"s=fake;i={i:x}",
+                    "__REALTIME_TIMESTAMP": str(base_us + i * 1_000_000),
+                    "_SYSTEMD_UNIT": unit,
+                    "SYSLOG_IDENTIFIER": unit.split(".")[0],
+                    "PRIORITY": str(3 if i % 97 == 0 else 6),
+                    "_PID": str(1000 + i % 50),
+                    "MESSAGE": f"event {i} from {unit}" + (" Out of memory: Killed process" if i % 500 == 0 else ""),
+                }) + "\n")
+        _write_script(bin_dir, "journalctl", f"""
+case "$*" in
+  *json*) cat "{data}/journal.jsonl" ;;
+  *) cat "{data}/journal.txt" ;;
+esac
+""")
+
+        # arp -a
+        with (data / "arp.txt").open("w", encoding="utf-8") as fh:
+            for i in range(self.arp_entries):
+                fh.write(f"? (192.168.1.{i % 254 + 1}) at 02:00:00:00:{i // 256:02x}:{i % 256:02x} [ether] on eth0\n")
+        _write_script(bin_dir, "arp", f'cat "{data}/arp.txt"\n')
+
+        # ip route
+        (data / "routes.txt").write_text(
+            "default via 10.0.0.1 dev eth0 proto dhcp metric 100\n"
+            + "".join(f"10.{i // 250}.{i % 250}.0/24 dev eth{i} proto kernel scope link\n" for i in range(64)),
+            encoding="utf-8",
+        )
+        _write_script(bin_dir, "ip", f'cat "{data}/routes.txt"\n')
+
+        _write_script(bin_dir, "last", "".join(
+            f'echo "user{i} pts/{i} 10.0.0.{i} Sat Jun  1 12:00   still logged in"\n' for i in range(20)
+        ))
+        _write_script(bin_dir, "crontab", 'echo "*/5 * * * * /usr/local/bin/backup.sh # backup"\n')
+        _write_script(bin_dir, "speedtest", """echo '{"ping":{"latency":5.0},"download":{"bandwidth":12500000},"upload":{"bandwidth":6250000}}'\n""")
+
+    @contextmanager
+    def installed(self):
+        root = Path(tempfile.mkdtemp(prefix="homepage-bench-"))
+        try:
+            self._populate(root)
+            self.root = root
+            old_path = os.environ.get("PATH", "")
+            os.environ["PATH"] = f"{root / 'bin'}{os.pathsep}{old_path}"
+            try:
+                yield self
+            finally:
+                os.environ["PATH"] = old_path
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+class _FakeUrlResponse:
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+class FakeNetwork:
+    """
+    固定 TCP 探测 / DNS / 公网 IP / httpx 的结果，避免基准依赖真实网络。
+    """
+
+    @staticmethod
+    def _httpx_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={}, request=request)
+
+    @contextmanager
+    def installed(self):
+        from app.core.network import overview as net_overview
+
+        real_async_client = httpx.AsyncClient
+
+        class _MockAsyncClient(real_async_client):
+            def __init__(self, *args, **kwargs):
+                # 显式传入 transport 的客户端（例如基准自身的 ASGITransport）保持不变
+                kwargs.setdefault("transport", httpx.MockTransport(FakeNetwork._httpx_handler))
+                super().__init__(*args, **kwargs)
+
+        with ExitStack() as stack:
+            stack.enter_context(mock.patch.object(net_overview, "_measure_tcp_latency", lambda *a, **k: (1.0, True)))
+            stack.enter_context(mock.patch.object(
+                net_overview.urllib_request, "urlopen", lambda *a, **k: _FakeUrlResponse(b"203.0.113.10")
+            ))
+            stack.enter_context(mock.patch.object(socket, "gethostbyname", lambda host: "93.184.216.34"))
+            stack.enter_context(mock.patch.object(
+                socket, "gethostbyaddr", lambda ip: (f"host-{ip.replace('.', '-')}.lan", [], [ip])
+            ))
+            stack.enter_context(mock.patch.object(httpx, "AsyncClient", _MockAsyncClient))
+            yield self
+
+
+@contextmanager
+def fake_backends(processes: int = 5000, nics: int = 64, containers: int = 300):
+    """
+    一次性安装全部假后端。FakeCommands 必须在 import app 之前生效
+    （docker CLI 路径在模块导入时解析），调用方需要注意顺序。
+    """
+    with FakeCommands(containers=containers).installed() as commands:
+        with FakePsutil(processes=processes, nics=nics).installed() as fake_psutil:
+            with FakeNetwork().installed():
+                yield fake_psutil, commands
@@ -0,0 +1,147 @@
+# backend/bench/procfs.py
+"""
+进程表采集基准：对比 psutil 路径与 /proc 批量读取路径（仅 Linux）。
+  python -m bench.procfs                    # 合成 5000 个进程的 /proc 目录树
+  python -m bench.procfs --processes 20000
+  python -m bench.procfs --real             # 直接读取本机 /proc
+
+合成目录树通过 psutil.PROCFS_PATH 同时提供给 psutil 与 ProcfsReader，两条路径读取完全相同的文件。
+首轮（所有进程都是新进程，需要读取 cmdline / 用户名 / cgroup）与后续轮次分别统计。
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, List, Optional
+from unittest import mock
+
+import psutil
+
+from bench.fakes import SEED
+
+_NAMES = ["nginx", "php-fpm", "postgres", "python3", "node", "java", "chrome", "sshd", "bash", "gunicorn-worker-process"]
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_BOOT_TIME = 1_700_000_000
+
+
+def build_proc_tree(root: Path, processes: int, seed: int = SEED) -> None:
+    """
+    生成最小的 /proc 目录树：stat / meminfo / uptime 以及每个进程的 stat、statm、status、io、cmdline、cgroup。
+    """
+    rng = random.Random(seed)
+    (root / "stat").write_text(
+        "cpu  1000 0 1000 100000 0 0 0 0 0 0\n"
+        f"btime {_BOOT_TIME}\n",
+        encoding="utf-8",
+    )
+    (root / "meminfo").write_text(
+        "MemTotal:       67108864 kB\nMemFree:        33554432 kB\nMemAvailable:   50331648 kB\n"
+        "Buffers:          524288 kB\nCached:         8388608 kB\nSwapCached:            0 kB\n"
+        "Active:         16777216 kB\nInactive:       8388608 kB\nShmem:            262144 kB\n"
+        "SReclaimable:     524288 kB\nSwapTotal:       8388608 kB\nSwapFree:        8388608 kB\n",
+        encoding="utf-8",
+    )
+    (root / "uptime").write_text("86400.00 172800.00\n", encoding="utf-8")
+
+    for pid in range(1, processes + 1):
+        name = rng.choice(_NAMES)
+        comm = name[:15]
+        threads = rng.randint(1, 64)
+        utime, stime = rng.randint(0, 10**6), rng.randint(0, 10**5)
+        starttime = rng.randint(0, 86400 * _CLK_TCK)
+        rss_pages = rng.randint(100, 200_000)
+        uid = rng.choice([0, 33, 1000])
+
+        d = root / str(pid)
+        d.mkdir()
+        fields = [
+            "S", "1", str(pid), str(pid), "0", "-1", "4194560", "100", "0", "0", "0",
+            str(utime), str(stime), "0", "0", "20", "0", str(threads), "0", str(starttime),
+            str(rss_pages * 4096 * 2), str(rss_pages),
+        ] + ["0"] * 30
+        (d / "stat").write_text(f"{pid} ({comm}) {' '.join(fields)}\n", encoding="utf-8")
+        (d / "statm").write_text(f"{rss_pages * 2} {rss_pages} {rss_pages // 4} 100 0 {rss_pages // 2} 0\n", encoding="utf-8")
+        (d / "status").write_text(
+            f"Name:\t{comm}\nState:\tS (sleeping)\nPid:\t{pid}\nPPid:\t1\n"
+            f"Uid:\t{uid}\t{uid}\t{uid}\t{uid}\nGid:\t{uid}\t{uid}\t{uid}\t{uid}\n"
+            f"Threads:\t{threads}\nvoluntary_ctxt_switches:\t10\nnonvoluntary_ctxt_switches:\t1\n",
+            encoding="utf-8",
+        )
+        (d / "io").write_text(
+            f"rchar: {utime * 4096}\nwchar: {stime * 4096}\nsyscr: {utime}\nsyscw: {stime}\n"
+            f"read_bytes: {utime * 512}\nwrite_bytes: {stime * 512}\ncancelled_write_bytes: 0\n",
+            encoding="utf-8",
+        )
+        (d / "cmdline").write_bytes(f"/usr/bin/{name}\0--worker\0{pid % 97}\0".encode())
+        (d / "cgroup").write_text(f"0::/system.slice/{name}.service\n", encoding="utf-8")
+
+
+def _run(backend: str, rounds: int) -> Dict[str, float]:
+    from app.core.system import process_table as pt
+
+    with mock.patch.object(pt, "PROCFS_READER_ENABLED", backend == "procfs"), \
+            mock.patch.object(pt, "CPU_MIN_WINDOW", 0.0):
+        table = pt.ProcessTable()
+        assert table.backend == backend, f"{backend} backend not available"
+
+        start = time.perf_counter()
+        snapshot = table.refresh(top=50)
+        cold = (time.perf_counter() - start) * 1000.0
+
+        warm: List[float] = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            table.refresh(top=50)
+            warm.append((time.perf_counter() - start) * 1000.0)
+
+    return {
+        "processes": len(snapshot.rows),
+        "cold_ms": round(cold, 1),
+        "warm_p50_ms": round(statistics.median(warm), 1),
+        "warm_min_ms": round(min(warm), 1),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="process table collection benchmark")
+    parser.add_argument("--processes", type=int, default=5000, help="合成进程数")
+    parser.add_argument("--rounds", type=int, default=10, help="首轮之后的测量轮数")
+    parser.add_argument("--real", action="store_true", help="读取本机 /proc 而不是合成目录树")
+    args = parser.parse_args(argv)
+
+    if not sys.platform.startswith("linux"):
+        print("the /proc reader is Linux only; nothing to compare")
+        return 0
+
+    with ExitStack() as stack:
+        if not args.real:
+            root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="homepage-procfs-")))
+            print(f"building synthetic /proc with {args.processes} processes ...", flush=True)
+            build_proc_tree(root, args.processes)
+            stack.enter_context(mock.patch.object(psutil, "PROCFS_PATH", str(root)))
+
+        results = {backend: _run(backend, args.rounds) for backend in ("psutil", "procfs")}
+
+    for backend, r in results.items():
+        print(
+            f"{backend:<8} {r['processes']:>6} procs  first pass {r['cold_ms']:>8.1f} ms  "
+            f"steady p50 {r['warm_p50_ms']:>8.1f} ms  min {r['warm_min_ms']:>8.1f} ms"
+        )
+    base, fast = results["psutil"], results["procfs"]
+    if fast["warm_p50_ms"] > 0 and fast["cold_ms"] > 0:
+        print(
+            f"speedup: first pass x{base['cold_ms'] / fast['cold_ms']:.1f}, "
+            f"steady x{base['warm_p50_ms'] / fast['warm_p50_ms']:.1f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
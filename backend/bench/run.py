@@ -0,0 +1,242 @@
+# backend/bench/run.py
+"""
+接口基准测试：
+  python -m bench.run                       # 跑全部 GET 接口并与基线对比
+  python -m bench.run --save                # 保存为新的基线
+  python -m bench.run -k /system -n 300     # 只跑路径包含 /system 的接口，每个 300 次
+  python -m bench.run --cold                # 不启动后台 collector，测量请求路径内的采集成本
+
+所有接口通过 httpx.ASGITransport 在进程内调用，后端替换为 bench.fakes 中的确定性数据，
+输出每个接口的 p50 / p99 延迟、吞吐和每请求分配的内存，并与 bench/baselines/ 下的基线做差异。
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from bench.fakes import FakeCommands, FakeNetwork, FakePsutil
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+# 不适合做基准的接口：长连接推送
+SKIP_PATHS = {"/host/stream"}
+
+# 带必填查询参数的接口：请求时附加的查询串（对应 fakes 中的数据）
+QUERY_STRINGS = {
+    "/system/disks/io-history": "device=/dev/sda1",
+}
+
+
+def _discover_endpoints(app) -> List[str]:
+    """
+    枚举 app 中所有无路径参数的 GET 接口（即 app/api 下每个 router 的读接口）。
+    """
+    from fastapi.routing import APIRoute
+
+    paths: List[str] = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        if "{" in route.path or route.path in SKIP_PATHS:
+            continue
+        paths.append(route.path)
+    return sorted(set(paths))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(int(round(pct / 100.0 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+async def _bench_endpoint(client, path: str, requests: int, concurrency: int, alloc_samples: int) -> Dict:
+    url = f"{path}?{QUERY_STRINGS[path]}" if path in QUERY_STRINGS else path
+    # 预热：填充缓存 / collector 首轮结果
+    resp = await client.get(url)
+    status = resp.status_code
+
+    latencies: List[float] = []
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with sem:
+            start = time.perf_counter()
+            r = await client.get(url)
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            return r.status_code
+
+    wall_start = time.perf_counter()
+    codes = await asyncio.gather(*(one() for _ in range(requests)))
+    wall = time.perf_counter() - wall_start
+
+    # 分配量单独测量（tracemalloc 本身会拖慢请求）
+    tracemalloc.start()
+    alloc_peaks: List[int] = []
+    for _ in range(alloc_samples):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        await client.get(url)
+        _, peak = tracemalloc.get_traced_memory()
+        alloc_peaks.append(max(peak - base, 0))
+    tracemalloc.stop()
+
+    return {
+        "status": status,
+        "errors": sum(1 for c in codes if c >= 400),
+        "requests": requests,
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p99_ms": round(_percentile(latencies, 99), 3),
+        "throughput_rps": round(requests / wall, 1) if wall > 0 else 0.0,
+        "alloc_kb": round(statistics.median(alloc_peaks) / 1024.0, 1) if alloc_peaks else 0.0,
+    }
+
+
+async def run_suite(
+    filters: List[str],
+    requests: int,
+    concurrency: int,
+    alloc_samples: int,
+    cold: bool,
+) -> Dict[str, Dict]:
+    import httpx
+
+    from app.core.collector import collector
+    from app.core.system.journal import journal_reader, journal_ring
+    from app.core.system.trend_store import trend_store
+    from app.main import app
+
+    # 资源趋势写入临时库，避免污染 app/data 下的真实数据
+    tmpdir = tempfile.TemporaryDirectory(prefix="homepage-bench-")
+    trend_store.reopen(Path(tmpdir.name) / "resource_trend.sqlite3")
+
+    endpoints = [p for p in _discover_endpoints(app) if not filters or any(f in p for f in filters)]
+
+    if not cold:
+        collector.start()
+        # 等所有任务完成首轮采样
+        deadline = time.monotonic() + 30
+        while len(collector.snapshot()) < len(collector.jobs()) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        # 与 app.main 的 lifespan 一致：系统日志由常驻 journalctl 读取
+        journal_reader.start()
+        while journal_reader.running and not len(journal_ring) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+
+    results: Dict[str, Dict] = {}
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for path in endpoints:
+                result = await _bench_endpoint(client, path, requests, concurrency, alloc_samples)
+                results[path] = result
+                print(
+                    f"{path:<32} p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms  "
+                    f"{result['throughput_rps']:>9.1f} req/s  {result['alloc_kb']:>9.1f} KiB/req"
+                    + (f"  [HTTP {result['status']}]" if result["status"] >= 400 else ""),
+                    flush=True,
+                )
+    finally:
+        if not cold:
+            journal_reader.stop()
+            collector.stop()
+        trend_store.close()
+        tmpdir.cleanup()
+    return results
+
+
+def compare(
+    current: Dict[str, Dict],
+    baseline: Dict[str, Dict],
+    threshold: float,
+    min_delta_ms: float,
+) -> List[str]:
+    """
+    与基线对比，返回回归项描述：
+    p50 同时超过百分比阈值与绝对阈值（避免亚毫秒级接口的抖动误报），或吞吐下降超过百分比阈值。
+    """
+    regressions: List[str] = []
+    print(f"\n{'endpoint':<32} {'p50 Δ':>10} {'p99 Δ':>10} {'rps Δ':>10} {'alloc Δ':>10}")
+    for path, cur in current.items():
+        base = baseline.get(path)
+        if not base:
+            print(f"{path:<32} {'(new)':>10}")
+            continue
+
+        def delta(key: str) -> Optional[float]:
+            if not base.get(key):
+                return None
+            return (cur[key] - base[key]) / base[key] * 100.0
+
+        d = {key: delta(key) for key in ("p50_ms", "p99_ms", "throughput_rps", "alloc_kb")}
+        fmt = lambda v: f"{v:+9.1f}%" if v is not None else f"{'-':>10}"  # noqa: E731
+        print(f"{path:<32} {fmt(d['p50_ms'])} {fmt(d['p99_ms'])} {fmt(d['throughput_rps'])} {fmt(d['alloc_kb'])}")
+
+        slower_ms = cur["p50_ms"] - base["p50_ms"]
+        if d["p50_ms"] is not None and d["p50_ms"] > threshold and slower_ms > min_delta_ms:
+            regressions.append(f"{path}: p50 {base['p50_ms']} -> {cur['p50_ms']} ms")
+        if d["throughput_rps"] is not None and d["throughput_rps"] < -threshold and slower_ms > min_delta_ms:
+            regressions.append(f"{path}: throughput {base['throughput_rps']} -> {cur['throughput_rps']} req/s")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Homepage API benchmark")
+    parser.add_argument("-k", "--filter", action="append", default=[], help="只跑路径包含该子串的接口，可重复")
+    parser.add_argument("-n", "--requests", type=int, default=200, help="每个接口的请求数")
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="并发数")
+    parser.add_argument("--alloc-samples", type=int, default=5, help="测量内存分配的请求数")
+    parser.add_argument("--processes", type=int, default=5000, help="合成进程数")
+    parser.add_argument("--nics", type=int, default=64, help="合成网卡数")
+    parser.add_argument("--containers", type=int, default=300, help="合成容器数")
+    parser.add_argument("--cold", action="store_true", help="不启动后台 collector")
+    parser.add_argument("--baseline", default="default", help="基线名称（bench/baselines/<name>.json）")
+    parser.add_argument("--save", action="store_true", help="把本次结果保存为基线")
+    parser.add_argument("--threshold", type=float, default=20.0, help="回归阈值（百分比）")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="p50 变慢少于该毫秒数时不算回归")
+    args = parser.parse_args(argv)
+
+    baseline_name = args.baseline + ("-cold" if args.cold else "")
+    baseline_path = BASELINE_DIR / f"{baseline_name}.json"
+
+    # 顺序很重要：假命令必须先进入 PATH，再 import app（docker CLI 路径在导入时解析）
+    with FakeCommands(containers=args.containers).installed():
+        with FakePsutil(processes=args.processes, nics=args.nics).installed():
+            with FakeNetwork().installed():
+                results = asyncio.run(run_suite(
+                    args.filter, args.requests, args.concurrency, args.alloc_samples, args.cold,
+                ))
+
+    if args.save:
+        BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+        existing = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else {}
+        existing.update(results)
+        baseline_path.write_text(json.dumps(existing, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nbaseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"\nno baseline at {baseline_path}; run with --save to create one")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print("\nregressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 import http from './http'
 
 // 首页聚合接口
-export function fetchHostOverview() {
-  return http.get('/host/overview')
+// params 可选：{ sections: 'system,uptime' } 或 { exclude: 'network,docker' }
+export function fetchHostOverview(params) {
+  return http.get('/host/overview', params)
 }
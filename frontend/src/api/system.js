@@ -16,8 +16,8 @@ export function fetchSystemUptime() {
   return http.get('/system/uptime')
 }
 
-export function fetchSystemDisks() {
-  return http.get('/system/disks')
+export function fetchSystemDisks(params) {
+  return http.get('/system/disks', params)
 }
 
 export function fetchSystemFiles(params) {
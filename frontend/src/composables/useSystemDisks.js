@@ -31,6 +31,9 @@ export function useSystemDisks(initialPath = '/') {
   const files = ref(null)
   const currentPath = ref(normalizePath(initialPath))
 
+  // 上一次 /system/disks 返回的游标，只拉取此后的新增/移除
+  let diskCursor = null
+
   const loadingDisks = ref(false)
   const loadingFiles = ref(false)
   const error = ref(null)
@@ -39,7 +42,10 @@ export function useSystemDisks(initialPath = '/') {
     loadingDisks.value = true
     error.value = null
     try {
-      disks.value = await fetchSystemDisks()
+      const params = diskCursor == null ? undefined : { since: diskCursor }
+      const data = await fetchSystemDisks(params)
+      diskCursor = data?.cursor ?? null
+      disks.value = data
     } catch (err) {
       error.value = err
       console.error(err)